@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Microbenchmark: JSON log formatting throughput
+
+Formats a typical "Request completed" record (correlation fields plus
+request extras) with:
+- python-json-logger's JsonFormatter (the previous formatter)
+- FastJsonFormatter, correlation fields added by CorrelationFilter
+
+Usage: cd backend && PYTHONPATH=src python scripts/bench_logging.py
+"""
+
+import logging
+import timeit
+
+from pythonjsonlogger import jsonlogger
+
+from app.infrastructure.observability.json_formatter import FastJsonFormatter
+from app.infrastructure.observability.log_context import (
+    CorrelationFilter,
+    bind_correlation,
+    reset_correlation,
+)
+
+ITERATIONS = 50_000
+EXTRA = {
+    "method": "GET",
+    "path": "/api/health",
+    "route": "/api/health",
+    "status_code": 200,
+    "started_at": "2024-01-01T00:00:00+00:00",
+    "duration_seconds": 0.0042,
+    "sample_reason": "sampled",
+    "sample_rate": 1.0,
+}
+CORRELATION = {
+    "request_id": "0d6c3f9e-5b1a-4c47-9f0e-3b8f2a7d1c55",
+    "trace_id": "4bf92f3577b34da6a3ce929d0e0e4736",
+    "span_id": "00f067aa0ba902b7",
+}
+
+
+def make_record() -> logging.LogRecord:
+    logger = logging.getLogger("app.infrastructure.observability.middleware")
+    return logger.makeRecord(
+        logger.name, logging.INFO, __file__, 0, "Request completed", None, None, extra=EXTRA
+    )
+
+
+def main() -> int:
+    legacy = jsonlogger.JsonFormatter(  # type: ignore[no-untyped-call]
+        "%(asctime)s %(levelname)s %(name)s %(message)s " "%(request_id)s %(trace_id)s %(span_id)s",
+        rename_fields={"levelname": "level", "asctime": "timestamp"},
+    )
+    fast = FastJsonFormatter()
+    correlation = CorrelationFilter()
+
+    def run_legacy() -> None:
+        # Previous call sites passed the correlation fields in `extra`
+        record = make_record()
+        record.__dict__.update(CORRELATION)
+        legacy.format(record)
+
+    def run_fast() -> None:
+        record = make_record()
+        correlation.filter(record)
+        fast.format(record)
+
+    token = bind_correlation(**CORRELATION)
+    try:
+        cases = {
+            "python-json-logger JsonFormatter": run_legacy,
+            "FastJsonFormatter + CorrelationFilter": run_fast,
+        }
+        print(f"{'case':<40} {'records/s':>12}")
+        for name, fn in cases.items():
+            best = min(timeit.repeat(fn, number=ITERATIONS, repeat=5))
+            print(f"{name:<40} {ITERATIONS / best:>12,.0f}")
+    finally:
+        reset_correlation(token)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
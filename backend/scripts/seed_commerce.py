@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Seed the commerce sample schema with bulk, skewed, reproducible data
+
+Replaces the commerce tables in DATABASE_URL. Postgres loads with COPY and
+parallel workers; SQLite with batched executemany.
+
+Usage: cd backend && DATABASE_URL=... PYTHONPATH=src python scripts/seed_commerce.py \\
+           --customers 100000 --products 10000 --orders 1000000 --product-skew 1.2
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.commerce.seeder import SeedConfig, seed
+
+
+def parse_args(argv: list[str]) -> SeedConfig:
+    defaults = SeedConfig()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--customers", type=int, default=defaults.customers)
+    parser.add_argument("--products", type=int, default=defaults.products)
+    parser.add_argument("--orders", type=int, default=defaults.orders)
+    parser.add_argument("--max-lines", type=int, default=defaults.max_lines_per_order)
+    parser.add_argument(
+        "--product-skew",
+        type=float,
+        default=defaults.product_skew,
+        help="Zipf exponent, 0 = uniform",
+    )
+    parser.add_argument("--customer-skew", type=float, default=defaults.customer_skew)
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    parser.add_argument("--workers", type=int, default=defaults.workers)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args(argv)
+    return SeedConfig(
+        customers=args.customers,
+        products=args.products,
+        orders=args.orders,
+        max_lines_per_order=args.max_lines,
+        product_skew=args.product_skew,
+        customer_skew=args.customer_skew,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        seed=args.seed,
+    )
+
+
+async def run(database_url: str, config: SeedConfig) -> dict[str, int]:
+    started = time.perf_counter()
+    reported: dict[str, float] = {}
+
+    def progress(table: str, done: int, total: int) -> None:
+        # At most one line per table per second, plus the last one
+        now = time.perf_counter()
+        if done != total and now - reported.get(table, 0.0) < 1.0:
+            return
+        reported[table] = now
+        share = f" ({done / total:.0%})" if total else ""
+        rate = done / max(now - started, 1e-9)
+        print(f"{table:<12} {done:>12,}{share} {rate:>12,.0f} rows/s", flush=True)
+
+    engine = create_async_engine(database_url)
+    try:
+        return await seed(engine, config, progress)
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str]) -> int:
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("DATABASE_URL is not set", file=sys.stderr)
+        return 1
+    config = parse_args(argv)
+    started = time.perf_counter()
+    counts = asyncio.run(run(database_url, config))
+    elapsed = time.perf_counter() - started
+    rows = sum(counts.values())
+    rate = rows / elapsed
+    print(f"Seeded {rows:,} rows in {elapsed:.1f}s ({rate:,.0f} rows/s, seed {config.seed})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -3,32 +3,128 @@
 from __future__ import annotations
 
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import cast
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from app.api.middleware.request_id import RequestIdMiddleware
 from app.api.middleware.simulator_injection import SimulatorInjectionMiddleware
+from app.api.routers.commerce import router as commerce_router
 from app.api.routers.health import router as health_router
 from app.api.routers.metrics import router as metrics_router
 from app.api.routers.simulator import router as simulator_router
+from app.application.commerce.service import CommerceService
+from app.application.ports.simulator_store import SimulatorStore
+from app.application.simulator.profiles import build_profiles
 from app.application.simulator.registry import build_registry
 from app.application.simulator.service import SimulatorService
+from app.infrastructure.commerce.orm import create_schema
+from app.infrastructure.commerce.sql_repository import (
+    SqlCustomerRepository,
+    SqlOrderRepository,
+    SqlProductRepository,
+)
+from app.infrastructure.db.effects import DbEffectInjector
+from app.infrastructure.db.pool import PoolSettings, install_pool_metrics, prewarm_pool
+from app.infrastructure.db.query_stats import DEFAULT_N_PLUS_ONE_THRESHOLD, install_query_stats
+from app.infrastructure.db.session import init_db, install_effect_hooks
+from app.infrastructure.observability.exposition import MetricsExposition
+from app.infrastructure.observability.impact import ImpactAnalyzer
+from app.infrastructure.observability.latency import LatencyRecorder
+from app.infrastructure.observability.log_queue import (
+    DEFAULT_CAPACITY,
+    DEFAULT_OVERFLOW_POLICY,
+    OverflowPolicy,
+)
+from app.infrastructure.observability.log_sampling import (
+    RequestLogSampler,
+    parse_route_rate_limits,
+)
 from app.infrastructure.observability.logging import setup_logging
+from app.infrastructure.observability.metric_events import MetricEventBuffer
 from app.infrastructure.observability.metrics import PrometheusMetrics
 from app.infrastructure.observability.middleware import ObservabilityMiddleware
-from app.infrastructure.observability.tracing import instrument_fastapi, setup_tracing
+from app.infrastructure.observability.multiprocess import (
+    MULTIPROC_DIR_ENV,
+    MultiProcessPrometheusMetrics,
+)
 from app.infrastructure.simulator.memory_store import InMemorySimulatorStore
+from app.infrastructure.simulator.sql_store import SqlSimulatorStore
 from app.infrastructure.time.system_clock import SystemClock
 
 # Setup logging first (before any other imports that log)
-setup_logging(
+log_queue = setup_logging(
     level=os.getenv("LOG_LEVEL", "INFO"),
     json_format=os.getenv("LOG_JSON", "false").lower() == "true",
+    queue_capacity=int(os.getenv("LOG_QUEUE_SIZE", str(DEFAULT_CAPACITY))),
+    overflow=cast(OverflowPolicy, os.getenv("LOG_QUEUE_OVERFLOW", DEFAULT_OVERFLOW_POLICY)),
 )
 
-# Setup tracing
-setup_tracing(app_name=os.getenv("OTEL_SERVICE_NAME", "systems-design-lab-backend"))
+
+def tracing_enabled() -> bool:
+    """OTEL_SDK_DISABLED=true skips the tracing adapter entirely"""
+    return os.getenv("OTEL_SDK_DISABLED", "false").lower() != "true"
+
+
+# Setup tracing; the SDK, OTLP exporter and instrumentations load only when enabled
+if tracing_enabled():
+    from app.infrastructure.observability.tracing import setup_tracing
+
+    setup_tracing(app_name=os.getenv("OTEL_SERVICE_NAME", "systems-design-lab-backend"))
+
+
+def build_pool_settings() -> PoolSettings:
+    """Connection pool settings from DB_POOL_* (SQLAlchemy's defaults when unset)"""
+    defaults = PoolSettings()
+    return PoolSettings(
+        size=int(os.getenv("DB_POOL_SIZE", str(defaults.size))),
+        max_overflow=int(os.getenv("DB_POOL_MAX_OVERFLOW", str(defaults.max_overflow))),
+        timeout_seconds=float(os.getenv("DB_POOL_TIMEOUT_SECONDS", str(defaults.timeout_seconds))),
+        recycle_seconds=int(os.getenv("DB_POOL_RECYCLE_SECONDS", str(defaults.recycle_seconds))),
+        pre_ping=os.getenv("DB_POOL_PRE_PING", "false").lower() == "true",
+        prewarm=int(os.getenv("DB_POOL_PREWARM", str(defaults.prewarm))),
+    )
+
+
+def build_engine(pool: PoolSettings) -> AsyncEngine | None:
+    """Database engine for DATABASE_URL, or None when no database is configured"""
+    database_url = os.getenv("DATABASE_URL")
+    return init_db(database_url, pool) if database_url else None
+
+
+def build_simulator_store(engine: AsyncEngine | None) -> SimulatorStore:
+    """
+    Select the SimulatorStore adapter from configuration.
+
+    SIMULATOR_STORE=memory (default) keeps state in-process.
+    SIMULATOR_STORE=sql persists state in DATABASE_URL and shares it across processes.
+    """
+    backend = os.getenv("SIMULATOR_STORE", "memory").lower()
+    if backend == "sql":
+        if engine is None:
+            raise RuntimeError("SIMULATOR_STORE=sql requires DATABASE_URL")
+        return SqlSimulatorStore(
+            engine,
+            poll_interval_seconds=float(os.getenv("SIMULATOR_STORE_POLL_SECONDS", "1.0")),
+        )
+    return InMemorySimulatorStore()
+
+
+def build_metrics() -> PrometheusMetrics:
+    """
+    Select the metrics adapter from configuration.
+
+    With PROMETHEUS_MULTIPROC_DIR set (multi-worker uvicorn/gunicorn), values
+    are shared through mmap'd files and every scrape aggregates all workers.
+    """
+    multiproc_dir = os.getenv(MULTIPROC_DIR_ENV)
+    if multiproc_dir:
+        return MultiProcessPrometheusMetrics(multiproc_dir)
+    return PrometheusMetrics()
 
 
 def create_app() -> FastAPI:
@@ -39,37 +135,107 @@ def create_app() -> FastAPI:
     Infrastructure implementations are created and injected into
     application services.
     """
+    pool_settings = build_pool_settings()
+    engine = build_engine(pool_settings)
+    store = build_simulator_store(engine)
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        # Open pooled connections up front instead of on the first burst
+        if engine is not None and pool_settings.prewarm:
+            await prewarm_pool(engine, pool_settings.prewarm)
+        if engine is not None:
+            await create_schema(engine)
+        # Durable stores load state and start their change feed before serving
+        if isinstance(store, SqlSimulatorStore):
+            await store.start()
+        await metric_events.start()
+        try:
+            yield
+        finally:
+            await metric_events.stop()
+            if isinstance(store, SqlSimulatorStore):
+                await store.stop()
+            if engine is not None:
+                await engine.dispose()
+
     app = FastAPI(
         title="Local Systems Design Lab",
         version="0.1.0",
         description="Production-grade systems design lab for simulating real-world issues",
+        lifespan=lifespan,
     )
 
-    # Instrument FastAPI with OpenTelemetry tracing
-    instrument_fastapi(app)
-
     # Infrastructure implementations (adapters)
-    store = InMemorySimulatorStore()
     clock = SystemClock()
     registry = build_registry()
-    metrics = PrometheusMetrics()
+    metrics = build_metrics()
 
     # Register all scenario metrics at startup
     for scenario in registry.scenarios.values():
         if hasattr(scenario.meta, "metrics") and scenario.meta.metrics:
             metrics.register_scenario_metrics(scenario.meta.name, scenario.meta.metrics)
 
+    if log_queue is not None:
+        log_queue.set_drop_listener(
+            lambda reason: metrics.counter("log_records_dropped_total", {"reason": reason}).inc()
+        )
+
     # Store metrics in app state for routers and middleware to access
     app.state.metrics = metrics
+    # Scenario metric events are batched per process and flushed on a tick
+    metric_events = MetricEventBuffer(
+        metrics,
+        flush_interval_seconds=float(os.getenv("METRIC_EVENTS_FLUSH_SECONDS", "1.0")),
+    )
+    app.state.metric_events = metric_events
+    # Exact latency percentiles per route and scenario, served by /api/sim/latency
+    latency_recorder = LatencyRecorder()
+    app.state.latency_recorder = latency_recorder
+    # Rolling stats per active-scenario set, served by /api/sim/impact
+    impact_analyzer = ImpactAnalyzer()
+    app.state.impact_analyzer = impact_analyzer
+    # Scrapes are served from a short-lived snapshot (0 disables caching)
+    app.state.metrics_exposition = MetricsExposition(
+        metrics, ttl_seconds=float(os.getenv("METRICS_CACHE_TTL_SECONDS", "1.0"))
+    )
 
     # Application services (use cases) - inject metrics port
-    sim_service = SimulatorService(store=store, clock=clock, registry=registry, metrics=metrics)
+    sim_service = SimulatorService(
+        store=store,
+        clock=clock,
+        registry=registry,
+        metrics=metrics,
+        profiles=build_profiles(),
+    )
 
     # Store in app state for routers to access
     app.state.simulator_service = sim_service
 
-    # Middleware (order matters - last added runs first)
-    # CORS is outermost
+    # Sample workload for scenarios to act on; needs a database
+    app.state.commerce_service = (
+        CommerceService(
+            customers=SqlCustomerRepository(engine),
+            products=SqlProductRepository(engine),
+            orders=SqlOrderRepository(engine),
+            clock=clock,
+        )
+        if engine is not None
+        else None
+    )
+
+    # db-category scenarios act on real statements through engine hooks
+    if engine is not None:
+        install_pool_metrics(engine, metrics)
+        # Per-request query counts; installed first so injected delays count as DB time
+        install_query_stats(engine)
+        install_effect_hooks(
+            engine,
+            DbEffectInjector(sim_service, registry, metrics=metrics, metric_events=metric_events),
+        )
+
+    # Middleware (order matters - last added is outermost and runs first)
+    # CORS is innermost, next to the routes
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["http://localhost:5173"],  # Vite default
@@ -77,17 +243,39 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    # Observability tracks all requests (after CORS)
-    app.add_middleware(ObservabilityMiddleware, metrics=metrics)
-    # Simulator injection applies effects (after observability)
-    app.add_middleware(SimulatorInjectionMiddleware, metrics=metrics)
-    # Request ID is innermost (runs first)
+    # Simulator injection applies effects around the routes
+    app.add_middleware(SimulatorInjectionMiddleware, metrics=metrics, metric_events=metric_events)
+    # Observability wraps injection, so injected delays and errors are measured
+    app.add_middleware(
+        ObservabilityMiddleware,
+        metrics=metrics,
+        latency=latency_recorder,
+        impact=impact_analyzer,
+        exemplar_min_seconds=float(os.getenv("METRICS_EXEMPLAR_MIN_SECONDS", "0.1")),
+        log_sampler=RequestLogSampler(
+            sample_rate=float(os.getenv("LOG_SAMPLE_RATE", "1.0")),
+            slow_seconds=float(os.getenv("LOG_SLOW_SECONDS", "1.0")),
+            route_rate_limits=parse_route_rate_limits(os.getenv("LOG_ROUTE_RATE_LIMITS", "")),
+        ),
+        server_timing=os.getenv("SERVER_TIMING", "false").lower() == "true",
+        n_plus_one_threshold=int(
+            os.getenv("DB_N_PLUS_ONE_THRESHOLD", str(DEFAULT_N_PLUS_ONE_THRESHOLD))
+        ),
+    )
+    # Request ID runs first among ours, so it can tag the request span
     app.add_middleware(RequestIdMiddleware)
+    # Instrument FastAPI with OpenTelemetry tracing; added last, so the server
+    # span is current in every middleware above
+    if tracing_enabled():
+        from app.infrastructure.observability.tracing import instrument_fastapi
+
+        instrument_fastapi(app)
 
     # Routers
     app.include_router(health_router, prefix="/api")
     app.include_router(metrics_router, prefix="/api")
     app.include_router(simulator_router, prefix="/api/sim")
+    app.include_router(commerce_router, prefix="/api")
 
     return app
 
@@ -2,23 +2,43 @@
 
 from __future__ import annotations
 
-import uuid
 from collections.abc import Awaitable, Callable
 
 from fastapi import Request, Response
+from opentelemetry import trace
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.infrastructure.observability.correlation import (
+    REQUEST_ID_ATTRIBUTE,
+    REQUEST_ID_HEADER,
+    TRACEPARENT_HEADER,
+    resolve_request_id,
+)
+from app.infrastructure.observability.log_context import bind_correlation, reset_correlation
+
 
 class RequestIdMiddleware(BaseHTTPMiddleware):
-    """Adds request_id to all requests for correlation"""
+    """
+    Adds request_id to all requests, their log context and the request span.
+
+    The caller's X-Request-ID wins, then the traceparent trace ID; otherwise
+    a sortable ID is generated.
+    """
 
     async def dispatch(
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
     ) -> Response:
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        request_id = resolve_request_id(
+            request.headers.get(REQUEST_ID_HEADER), request.headers.get(TRACEPARENT_HEADER)
+        )
         request.state.request_id = request_id
-
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
+        trace.get_current_span().set_attribute(REQUEST_ID_ATTRIBUTE, request_id)
+
+        token = bind_correlation(request_id=request_id)
+        try:
+            response = await call_next(request)
+        finally:
+            reset_correlation(token)
+        response.headers[REQUEST_ID_HEADER] = request_id
 
         return response
@@ -3,27 +3,46 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import cast
 
 from fastapi import Request, Response
+from opentelemetry import trace
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
 from app.application.ports.metrics import MetricsPort
 from app.application.simulator.app_models import ActiveScenarioApp
+from app.application.simulator.events import METRIC_EVENTS_KEY, MetricEvent
 from app.application.simulator.service import SimulatorService
+from app.infrastructure.db.effects import bind_db_scope, reset_db_scope
+from app.infrastructure.observability.effects import EffectRecorder
+from app.infrastructure.observability.metric_events import MetricEventBuffer
+from app.infrastructure.observability.server_timing import timed_phase
+from app.infrastructure.observability.span_attributes import SIM_SCENARIOS_ATTRIBUTE
 
 
 class SimulatorInjectionMiddleware(BaseHTTPMiddleware):
     """
     Applies active scenario effects to requests/responses.
 
-    This is where effect dicts from scenarios get executed.
+    This is where effect dicts from scenarios get executed. Each executed
+    effect gets a child span and a simulator_effect_duration_seconds
+    observation. Metric events returned by scenarios are handed to the event
+    buffer, not applied inline.
     """
 
-    def __init__(self, app: ASGIApp, metrics: MetricsPort | None = None) -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: MetricsPort | None = None,
+        metric_events: MetricEventBuffer | None = None,
+    ) -> None:
         super().__init__(app)
         self.metrics = metrics
+        self.metric_events = metric_events
+        self.effects = EffectRecorder(metrics)
 
     async def dispatch(
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
@@ -33,36 +52,46 @@ class SimulatorInjectionMiddleware(BaseHTTPMiddleware):
         if request.url.path.startswith("/api/sim"):
             return await call_next(request)
 
-        # Get active scenarios
-        sim_service: SimulatorService = request.app.state.simulator_service
-        status = sim_service.status()
+        with timed_phase("plan"):
+            # Get active scenarios
+            sim_service: SimulatorService = request.app.state.simulator_service
+            status = sim_service.status()
+            # Lets outer middleware segment request stats by the active-scenario set
+            request.state.sim_active = tuple(a.name for a in status.active)
 
-        # Collect all effects from active scenarios
-        effects = self._collect_effects(request, status.active)
+            # Collect all effects from active scenarios
+            effects, sources = self._collect_effects(request, status.active)
 
         # Apply pre-request effects (e.g., delays)
-        await self._apply_pre_request_effects(effects, request)
+        with timed_phase("inject"):
+            await self._apply_pre_request_effects(effects, sources, request)
 
-        # Call next middleware/route
+        # Call next middleware/route; DB statements it issues get db-category effects
+        db_scope = bind_db_scope(request.url.path)
         try:
             response = await call_next(request)
         except Exception:
             # Could apply error injection here
             raise
+        finally:
+            reset_db_scope(db_scope)
 
         # Apply post-response effects
-        response = await self._apply_post_response_effects(effects, response)
+        with timed_phase("inject"):
+            response = await self._apply_post_response_effects(effects, sources, response)
 
         return response
 
     def _collect_effects(
         self, request: Request, active_scenarios: list[ActiveScenarioApp]
-    ) -> dict[str, object]:
-        """Collect all effects from active scenarios"""
+    ) -> tuple[dict[str, object], dict[str, str]]:
+        """Collect all effects from active scenarios, and which scenario set each key"""
         sim_service: SimulatorService = request.app.state.simulator_service
         registry = sim_service._registry
 
         combined_effects = {}
+        sources: dict[str, str] = {}
+        applied: list[str] = []
         target = {
             "category": "http",
             "path": request.url.path,
@@ -74,16 +103,27 @@ class SimulatorInjectionMiddleware(BaseHTTPMiddleware):
                 scenario = registry.get(active.name)
                 if scenario.is_applicable(target=target):
                     ctx: dict[str, object] = {"request": request, "target": target}
-                    effects = scenario.apply(ctx=ctx, parameters=active.parameters)  # type: ignore
+                    parameters = sim_service.effective_parameters(active)
+                    effects = scenario.apply(ctx=ctx, parameters=parameters)
+                    events = effects.pop(METRIC_EVENTS_KEY, None)
+                    if events and self.metric_events is not None:
+                        self.metric_events.emit(cast("Iterable[MetricEvent]", events))
                     combined_effects.update(effects)
+                    sources.update(dict.fromkeys(effects, active.name))
+                    applied.append(active.name)
             except Exception:
                 # Log but don't fail request
                 pass
 
-        return combined_effects
+        # Lets outer middleware attribute latency to the scenarios that shaped it
+        request.state.sim_scenarios = tuple(applied)
+        if applied:
+            # Marks the trace as fault-injected for tail sampling
+            trace.get_current_span().set_attribute(SIM_SCENARIOS_ATTRIBUTE, applied)
+        return combined_effects, sources
 
     async def _apply_pre_request_effects(
-        self, effects: dict[str, object], request: Request
+        self, effects: dict[str, object], sources: dict[str, str], request: Request
     ) -> None:
         """Apply effects before request processing"""
         # HTTP delay
@@ -91,7 +131,7 @@ class SimulatorInjectionMiddleware(BaseHTTPMiddleware):
             delay_ms = effects["http_delay_ms"]
             path_prefix = effects.get("http_path_prefix", "")
             method = effects.get("http_method", "")
-            scenario_name = effects.get("scenario_name", "unknown")
+            scenario_name = sources.get("http_delay_ms", "unknown")
 
             # Check if this request matches
             if (
@@ -101,33 +141,54 @@ class SimulatorInjectionMiddleware(BaseHTTPMiddleware):
                 if isinstance(delay_ms, (int, float)):
                     # Emit metric before applying delay
                     if self.metrics:
-                        self.metrics.increment_counter(
+                        self.metrics.counter(
                             "simulator_injections_total",
-                            {"scenario_name": str(scenario_name), "effect_type": "http_delay"},
-                        )
-                    await asyncio.sleep(delay_ms / 1000.0)
+                            {"scenario_name": scenario_name, "effect_type": "http_delay"},
+                        ).inc()
+                    with self.effects.record(scenario_name, "http_delay", {"delay_ms": delay_ms}):
+                        await asyncio.sleep(delay_ms / 1000.0)
+
+        # CPU burn: holds the GIL, so it slows every request in this worker
+        cpu_spike_ms = effects.get("cpu_spike_ms")
+        if isinstance(cpu_spike_ms, (int, float)) and cpu_spike_ms > 0:
+            scenario_name = sources.get("cpu_spike_ms", "unknown")
+            if self.metrics:
+                self.metrics.counter(
+                    "simulator_injections_total",
+                    {"scenario_name": scenario_name, "effect_type": "cpu_spike"},
+                ).inc()
+            with self.effects.record(scenario_name, "cpu_spike", {"duration_ms": cpu_spike_ms}):
+                await asyncio.to_thread(_burn_cpu, cpu_spike_ms / 1000.0)
 
     async def _apply_post_response_effects(
-        self, effects: dict[str, object], response: Response
+        self, effects: dict[str, object], sources: dict[str, str], response: Response
     ) -> Response:
         """Apply effects after request processing"""
         # Force error
         if effects.get("http_force_error"):
-            scenario_name = effects.get("scenario_name", "unknown")
+            scenario_name = sources.get("http_force_error", "unknown")
 
             # Emit metric
             if self.metrics:
-                self.metrics.increment_counter(
+                self.metrics.counter(
                     "simulator_injections_total",
-                    {"scenario_name": str(scenario_name), "effect_type": "http_error"},
-                )
+                    {"scenario_name": scenario_name, "effect_type": "http_error"},
+                ).inc()
 
             # Return 500 instead
             from fastapi.responses import JSONResponse
 
-            return JSONResponse(
-                status_code=500,
-                content={"detail": "Simulated error from error-burst-5xx scenario"},
-            )
+            with self.effects.record(scenario_name, "http_error", {"status_code": 500}):
+                return JSONResponse(
+                    status_code=500,
+                    content={"detail": "Simulated error from error-burst-5xx scenario"},
+                )
 
         return response
+
+
+def _burn_cpu(seconds: float) -> None:
+    """Busy-loop for `seconds` of wall time"""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
@@ -0,0 +1,208 @@
+"""Commerce API Router - the sample workload's data-plane endpoints"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from app.application.commerce.app_models import (
+    DEFAULT_LOADING,
+    Customer,
+    LoadStrategy,
+    Order,
+    OrderLineRequestApp,
+    PlaceOrderRequestApp,
+    Product,
+    RegisterCustomerRequestApp,
+)
+from app.application.commerce.exceptions import (
+    CustomerNotFoundError,
+    DuplicateCustomerError,
+    InsufficientStockError,
+    InvalidOrderError,
+    OrderNotFoundError,
+    ProductNotFoundError,
+)
+from app.application.commerce.service import CommerceService
+from app.contracts.commerce import (
+    CustomerResponse,
+    CustomersResponse,
+    OrderLineResponse,
+    OrderResponse,
+    OrdersResponse,
+    PlaceOrderRequest,
+    ProductResponse,
+    ProductsResponse,
+    RegisterCustomerRequest,
+)
+from app.infrastructure.observability.server_timing import TimedRoute
+
+router = APIRouter(route_class=TimedRoute, tags=["commerce"])
+
+# Toggle between the N+1 pattern and eager loading of order lines
+_LOADING_QUERY = Query(
+    default=DEFAULT_LOADING,
+    description="How order lines are loaded: lazy (one query per order), joined or selectin",
+)
+
+
+def _get_service(request: Request) -> CommerceService:
+    """Get commerce service from app state; it exists only with a database"""
+    service: CommerceService | None = request.app.state.commerce_service
+    if service is None:
+        raise HTTPException(status_code=503, detail="Database not configured (set DATABASE_URL)")
+    return service
+
+
+def _customer_response(customer: Customer) -> CustomerResponse:
+    return CustomerResponse(
+        id=customer.id,
+        email=customer.email,
+        name=customer.name,
+        created_at=customer.created_at,
+    )
+
+
+def _product_response(product: Product) -> ProductResponse:
+    return ProductResponse(
+        id=product.id,
+        sku=product.sku,
+        name=product.name,
+        category=product.category,
+        price_cents=product.price_cents,
+        stock=product.stock,
+    )
+
+
+def _order_response(order: Order) -> OrderResponse:
+    return OrderResponse(
+        id=order.id,
+        customer_id=order.customer_id,
+        status=order.status,
+        created_at=order.created_at,
+        total_cents=order.total_cents,
+        lines=[
+            OrderLineResponse(
+                product_id=line.product_id,
+                quantity=line.quantity,
+                unit_price_cents=line.unit_price_cents,
+                total_cents=line.total_cents,
+            )
+            for line in order.lines
+        ],
+    )
+
+
+@router.get("/customers", response_model=CustomersResponse)
+async def list_customers(
+    request: Request,
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+) -> CustomersResponse:
+    """List customers"""
+    customers = await _get_service(request).list_customers(limit=limit, offset=offset)
+    return CustomersResponse(customers=[_customer_response(c) for c in customers])
+
+
+@router.post("/customers", response_model=CustomerResponse, status_code=201)
+async def register_customer(request: Request, body: RegisterCustomerRequest) -> CustomerResponse:
+    """Register a customer"""
+    try:
+        customer = await _get_service(request).register_customer(
+            RegisterCustomerRequestApp(email=body.email, name=body.name)
+        )
+    except DuplicateCustomerError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    return _customer_response(customer)
+
+
+@router.get("/customers/{customer_id}", response_model=CustomerResponse)
+async def get_customer(request: Request, customer_id: int) -> CustomerResponse:
+    """Get a customer"""
+    try:
+        return _customer_response(await _get_service(request).get_customer(customer_id))
+    except CustomerNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@router.get("/customers/{customer_id}/orders", response_model=OrdersResponse)
+async def list_customer_orders(
+    request: Request,
+    customer_id: int,
+    limit: int = Query(default=20, ge=1, le=100),
+    loading: LoadStrategy = _LOADING_QUERY,
+) -> OrdersResponse:
+    """A customer's most recent orders with their lines"""
+    try:
+        orders = await _get_service(request).list_customer_orders(
+            customer_id, limit=limit, loading=loading
+        )
+    except CustomerNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    return OrdersResponse(orders=[_order_response(o) for o in orders])
+
+
+@router.get("/products", response_model=ProductsResponse)
+async def list_products(
+    request: Request,
+    category: str | None = Query(default=None, max_length=100),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+) -> ProductsResponse:
+    """List products, optionally in one category"""
+    products = await _get_service(request).list_products(
+        category=category, limit=limit, offset=offset
+    )
+    return ProductsResponse(products=[_product_response(p) for p in products])
+
+
+@router.get("/products/search", response_model=ProductsResponse)
+async def search_products(
+    request: Request,
+    q: str = Query(min_length=1, max_length=100, description="Substring of the product name"),
+    limit: int = Query(default=20, ge=1, le=100),
+) -> ProductsResponse:
+    """Search products by name (case-insensitive substring)"""
+    products = await _get_service(request).search_products(q, limit=limit)
+    return ProductsResponse(products=[_product_response(p) for p in products])
+
+
+@router.get("/products/{product_id}", response_model=ProductResponse)
+async def get_product(request: Request, product_id: int) -> ProductResponse:
+    """Get a product"""
+    try:
+        return _product_response(await _get_service(request).get_product(product_id))
+    except ProductNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@router.post("/orders", response_model=OrderResponse, status_code=201)
+async def place_order(request: Request, body: PlaceOrderRequest) -> OrderResponse:
+    """Place an order; stock is reserved and prices are captured atomically"""
+    try:
+        order = await _get_service(request).place_order(
+            PlaceOrderRequestApp(
+                customer_id=body.customer_id,
+                lines=[
+                    OrderLineRequestApp(product_id=line.product_id, quantity=line.quantity)
+                    for line in body.lines
+                ],
+            )
+        )
+    except (CustomerNotFoundError, ProductNotFoundError) as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except InsufficientStockError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    except InvalidOrderError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    return _order_response(order)
+
+
+@router.get("/orders/{order_id}", response_model=OrderResponse)
+async def get_order(
+    request: Request, order_id: int, loading: LoadStrategy = _LOADING_QUERY
+) -> OrderResponse:
+    """Get an order with its lines"""
+    try:
+        return _order_response(await _get_service(request).get_order(order_id, loading=loading))
+    except OrderNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
@@ -5,8 +5,9 @@ from __future__ import annotations
 from fastapi import APIRouter
 
 from app.contracts.health import HealthResponse
+from app.infrastructure.observability.server_timing import TimedRoute
 
-router = APIRouter(tags=["health"])
+router = APIRouter(route_class=TimedRoute, tags=["health"])
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -1,8 +1,13 @@
 """Metrics endpoint for Prometheus scraping"""
 
 from fastapi import APIRouter, Request, Response
+from starlette.concurrency import run_in_threadpool
 
-router = APIRouter(tags=["observability"])
+from app.infrastructure.observability.exposition import MetricsExposition
+from app.infrastructure.observability.metric_events import MetricEventBuffer
+from app.infrastructure.observability.server_timing import TimedRoute
+
+router = APIRouter(route_class=TimedRoute, tags=["observability"])
 
 
 @router.get("/metrics")
@@ -10,8 +15,26 @@ async def metrics_endpoint(request: Request) -> Response:
     """
     Prometheus metrics endpoint.
 
-    Returns metrics in Prometheus text exposition format.
+    Returns metrics in Prometheus text exposition format, or OpenMetrics when
+    the scraper accepts application/openmetrics-text. Payloads are gzipped
+    when accepted and cached for a short TTL.
     """
-    metrics_port = request.app.state.metrics
-    metrics_data = metrics_port.get_metrics()
-    return Response(content=metrics_data, media_type="text/plain")
+    exposition: MetricsExposition = request.app.state.metrics_exposition
+    metric_events: MetricEventBuffer | None = getattr(request.app.state, "metric_events", None)
+    if metric_events is not None:
+        # Scenario events still buffered would otherwise miss this scrape
+        metric_events.flush()
+    accept = request.headers.get("accept", "")
+    accept_encoding = request.headers.get("accept-encoding", "")
+
+    # Rendering walks every series; keep it off the event loop
+    payload = await run_in_threadpool(
+        exposition.render,
+        openmetrics="application/openmetrics-text" in accept,
+        gzip_ok="gzip" in accept_encoding,
+    )
+
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if payload.content_encoding:
+        headers["Content-Encoding"] = payload.content_encoding
+    return Response(content=payload.body, media_type=payload.content_type, headers=headers)
@@ -4,27 +4,54 @@ from __future__ import annotations
 
 from typing import cast
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Query, Request
 
 from app.application.simulator.app_models import (
+    BatchApplyRequestApp,
+    BatchOperationApp,
     DisableScenarioRequestApp,
     EnableScenarioRequestApp,
+    ProfilesResponseApp,
     ScenariosResponseApp,
     StatusResponseApp,
 )
-from app.application.simulator.exceptions import ScenarioNotFoundError
+from app.application.simulator.exceptions import (
+    InvalidParametersError,
+    ProfileNotFoundError,
+    ScenarioNotFoundError,
+)
 from app.application.simulator.service import SimulatorService
 from app.contracts.simulator import (
     ActiveScenario,
+    BatchApplyRequest,
+    BatchOperation,
     DisableScenarioRequest,
     EnableScenarioRequest,
+    ImpactResponse,
+    ImpactSegment,
+    LatencyResponse,
+    LatencySeries,
+    ProfileDescriptor,
+    ProfilesResponse,
     ScenarioDescriptor,
+    ScenarioImpactReport,
     ScenariosResponse,
     StatusResponse,
     TargetCategory,
 )
+from app.infrastructure.observability.impact import (
+    ImpactAnalyzer,
+    ScenarioImpact,
+    SegmentStats,
+)
+from app.infrastructure.observability.latency import (
+    LatencyRecorder,
+    LatencySnapshot,
+    LatencySummary,
+)
+from app.infrastructure.observability.server_timing import TimedRoute
 
-router = APIRouter(tags=["simulator"])
+router = APIRouter(route_class=TimedRoute, tags=["simulator"])
 
 
 def _get_service(request: Request) -> SimulatorService:
@@ -32,6 +59,82 @@ def _get_service(request: Request) -> SimulatorService:
     return request.app.state.simulator_service  # type: ignore
 
 
+def _get_latency(request: Request) -> LatencyRecorder:
+    """Get latency recorder from app state"""
+    return request.app.state.latency_recorder  # type: ignore
+
+
+def _latency_series(summary: LatencySummary) -> LatencySeries:
+    return LatencySeries(
+        route=summary.route,
+        scenario=summary.scenario,
+        count=summary.count,
+        min_ms=summary.min_seconds * 1000,
+        max_ms=summary.max_seconds * 1000,
+        mean_ms=summary.mean_seconds * 1000,
+        percentiles_ms={f"p{p:g}": v * 1000 for p, v in summary.percentiles.items()},
+    )
+
+
+def _latency_response(snapshot: LatencySnapshot) -> LatencyResponse:
+    """Map a recorder snapshot to the contract model"""
+    return LatencyResponse(
+        window_started_at=snapshot.window_started_at,
+        window_seconds=snapshot.window_seconds,
+        series=[_latency_series(s) for s in snapshot.series],
+        merged=_latency_series(snapshot.merged) if snapshot.merged else None,
+    )
+
+
+def _get_impact(request: Request) -> ImpactAnalyzer:
+    """Get impact analyzer from app state"""
+    return request.app.state.impact_analyzer  # type: ignore
+
+
+def _impact_segment(stats: SegmentStats | None) -> ImpactSegment | None:
+    if stats is None:
+        return None
+    return ImpactSegment(
+        scenarios=list(stats.scenarios),
+        requests=stats.requests,
+        errors=stats.errors,
+        error_rate=stats.error_rate,
+        throughput_rps=stats.throughput_rps,
+        p50_ms=stats.p50_seconds * 1000,
+        p95_ms=stats.p95_seconds * 1000,
+        p99_ms=stats.p99_seconds * 1000,
+        window_seconds=stats.window_seconds,
+    )
+
+
+def _impact_report(impact: ScenarioImpact) -> ScenarioImpactReport:
+    p95, p99 = impact.p95_delta_seconds, impact.p99_delta_seconds
+    return ScenarioImpactReport(
+        scenario=impact.scenario,
+        before=_impact_segment(impact.before),
+        after=_impact_segment(impact.after),
+        p95_delta_ms=p95 * 1000 if p95 is not None else None,
+        p99_delta_ms=p99 * 1000 if p99 is not None else None,
+        error_rate_delta=impact.error_rate_delta,
+        throughput_delta_rps=impact.throughput_delta_rps,
+    )
+
+
+def _status_response(app_resp: StatusResponseApp) -> StatusResponse:
+    """Map app-layer status to contract model"""
+    return StatusResponse(
+        active=[
+            ActiveScenario(
+                name=a.name,
+                parameters=a.parameters,
+                enabled_at=a.enabled_at,
+                expires_at=a.expires_at,
+            )
+            for a in app_resp.active
+        ]
+    )
+
+
 @router.get("/scenarios", response_model=ScenariosResponse)
 async def list_scenarios(request: Request) -> ScenariosResponse:
     """List all available scenarios"""
@@ -55,17 +158,7 @@ async def list_scenarios(request: Request) -> ScenariosResponse:
 async def status(request: Request) -> StatusResponse:
     """Get status of active scenarios"""
     app_resp: StatusResponseApp = _get_service(request).status()
-    return StatusResponse(
-        active=[
-            ActiveScenario(
-                name=a.name,
-                parameters=a.parameters,
-                enabled_at=a.enabled_at,
-                expires_at=a.expires_at,
-            )
-            for a in app_resp.active
-        ]
-    )
+    return _status_response(app_resp)
 
 
 @router.post("/enable", response_model=StatusResponse)
@@ -78,19 +171,11 @@ async def enable(request: Request, body: EnableScenarioRequest) -> StatusRespons
             duration_seconds=body.duration_seconds,
         )
         app_resp: StatusResponseApp = _get_service(request).enable(app_req)
-        return StatusResponse(
-            active=[
-                ActiveScenario(
-                    name=a.name,
-                    parameters=a.parameters,
-                    enabled_at=a.enabled_at,
-                    expires_at=a.expires_at,
-                )
-                for a in app_resp.active
-            ]
-        )
+        return _status_response(app_resp)
     except ScenarioNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
+    except InvalidParametersError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
 
 
 @router.post("/disable", response_model=StatusResponse)
@@ -98,31 +183,93 @@ async def disable(request: Request, body: DisableScenarioRequest) -> StatusRespo
     """Disable a scenario"""
     app_req = DisableScenarioRequestApp(name=body.name)
     app_resp: StatusResponseApp = _get_service(request).disable(app_req)
-    return StatusResponse(
-        active=[
-            ActiveScenario(
-                name=a.name,
-                parameters=a.parameters,
-                enabled_at=a.enabled_at,
-                expires_at=a.expires_at,
-            )
-            for a in app_resp.active
-        ]
-    )
+    return _status_response(app_resp)
 
 
 @router.post("/reset", response_model=StatusResponse)
 async def reset(request: Request) -> StatusResponse:
     """Disable all scenarios"""
     app_resp: StatusResponseApp = _get_service(request).reset()
-    return StatusResponse(
-        active=[
-            ActiveScenario(
-                name=a.name,
-                parameters=a.parameters,
-                enabled_at=a.enabled_at,
-                expires_at=a.expires_at,
+    return _status_response(app_resp)
+
+
+@router.get("/profiles", response_model=ProfilesResponse)
+async def list_profiles(request: Request) -> ProfilesResponse:
+    """List named scenario profiles"""
+    app_resp: ProfilesResponseApp = _get_service(request).list_profiles()
+    return ProfilesResponse(
+        profiles=[
+            ProfileDescriptor(
+                name=p.name,
+                description=p.description,
+                operations=[
+                    BatchOperation(
+                        op=op.op,
+                        name=op.name,
+                        parameters=op.parameters,
+                        duration_seconds=op.duration_seconds,
+                    )
+                    for op in p.operations
+                ],
             )
-            for a in app_resp.active
+            for p in app_resp.profiles
         ]
     )
+
+
+@router.post("/batch", response_model=StatusResponse)
+async def apply_batch(request: Request, body: BatchApplyRequest) -> StatusResponse:
+    """Apply a profile and/or several enable/disable operations atomically"""
+    try:
+        app_req = BatchApplyRequestApp(
+            profile=body.profile,
+            reset=body.reset,
+            operations=[
+                BatchOperationApp(
+                    op=op.op,
+                    name=op.name,
+                    parameters=op.parameters,
+                    duration_seconds=op.duration_seconds,
+                )
+                for op in body.operations
+            ],
+        )
+        app_resp: StatusResponseApp = _get_service(request).apply_batch(app_req)
+        return _status_response(app_resp)
+    except (ScenarioNotFoundError, ProfileNotFoundError) as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except InvalidParametersError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+
+@router.get("/latency", response_model=LatencyResponse)
+async def latency(
+    request: Request,
+    route: str | None = Query(default=None, description="Route template, e.g. /api/health"),
+    scenario: str | None = Query(default=None, description="Scenario name, or 'none'"),
+) -> LatencyResponse:
+    """Exact latency percentiles per route and scenario for the current window"""
+    return _latency_response(_get_latency(request).snapshot(route=route, scenario=scenario))
+
+
+@router.post("/latency/reset", response_model=LatencyResponse)
+async def reset_latency(request: Request) -> LatencyResponse:
+    """Close the current latency window and start a new one; returns the closed window"""
+    return _latency_response(_get_latency(request).reset())
+
+
+@router.get("/impact", response_model=ImpactResponse)
+async def impact(request: Request) -> ImpactResponse:
+    """
+    Impact of each active scenario on latency, errors and throughput.
+
+    Compares rolling-window stats for the current active set against the
+    same set without the scenario (the traffic served before it was enabled).
+    """
+    analyzer = _get_impact(request)
+    active = sorted(a.name for a in _get_service(request).status().active)
+    return ImpactResponse(
+        active=active,
+        impacts=[_impact_report(i) for i in analyzer.impact(active)],
+        segments=[s for s in map(_impact_segment, analyzer.segments()) if s is not None],
+    )
@@ -0,0 +1 @@
+"""Commerce application logic (the sample workload)"""
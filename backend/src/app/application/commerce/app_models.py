@@ -0,0 +1,39 @@
+"""Application-layer models for commerce (no contracts dependency)"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# Use cases return the domain entities as-is; re-exported for the API layer
+from app.application.ports.commerce import DEFAULT_LOADING, LoadStrategy
+from app.domain.commerce import Customer, Order, OrderLine, Product
+
+__all__ = [
+    "Customer",
+    "DEFAULT_LOADING",
+    "LoadStrategy",
+    "Order",
+    "OrderLine",
+    "OrderLineRequestApp",
+    "PlaceOrderRequestApp",
+    "Product",
+    "RegisterCustomerRequestApp",
+]
+
+
+@dataclass(frozen=True)
+class OrderLineRequestApp:
+    product_id: int
+    quantity: int
+
+
+@dataclass(frozen=True)
+class PlaceOrderRequestApp:
+    customer_id: int
+    lines: list[OrderLineRequestApp]
+
+
+@dataclass(frozen=True)
+class RegisterCustomerRequestApp:
+    email: str
+    name: str
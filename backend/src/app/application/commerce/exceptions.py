@@ -0,0 +1,61 @@
+"""Custom exceptions for commerce operations"""
+
+from __future__ import annotations
+
+
+class CommerceError(Exception):
+    """Base exception for commerce-related errors"""
+
+    pass
+
+
+class CustomerNotFoundError(CommerceError):
+    """Raised when a customer ID is not recognized"""
+
+    def __init__(self, customer_id: int):
+        self.customer_id = customer_id
+        super().__init__(f"Customer {customer_id} not found")
+
+
+class ProductNotFoundError(CommerceError):
+    """Raised when a product ID is not recognized"""
+
+    def __init__(self, product_id: int):
+        self.product_id = product_id
+        super().__init__(f"Product {product_id} not found")
+
+
+class OrderNotFoundError(CommerceError):
+    """Raised when an order ID is not recognized"""
+
+    def __init__(self, order_id: int):
+        self.order_id = order_id
+        super().__init__(f"Order {order_id} not found")
+
+
+class DuplicateCustomerError(CommerceError):
+    """Raised when registering an email that already has a customer"""
+
+    def __init__(self, email: str):
+        self.email = email
+        super().__init__(f"Customer with email '{email}' already exists")
+
+
+class InsufficientStockError(CommerceError):
+    """Raised when an order asks for more units than are in stock"""
+
+    def __init__(self, product_id: int, requested: int, available: int):
+        self.product_id = product_id
+        self.requested = requested
+        self.available = available
+        super().__init__(
+            f"Insufficient stock for product {product_id}: "
+            f"requested {requested}, available {available}"
+        )
+
+
+class InvalidOrderError(CommerceError):
+    """Raised when an order request is malformed"""
+
+    def __init__(self, message: str):
+        super().__init__(f"Invalid order: {message}")
@@ -0,0 +1,112 @@
+"""Commerce Service - Use cases of the sample shop"""
+
+from __future__ import annotations
+
+from app.application.commerce.app_models import (
+    PlaceOrderRequestApp,
+    RegisterCustomerRequestApp,
+)
+from app.application.commerce.exceptions import (
+    CustomerNotFoundError,
+    InvalidOrderError,
+    OrderNotFoundError,
+    ProductNotFoundError,
+)
+from app.application.ports.clock import Clock
+from app.application.ports.commerce import (
+    DEFAULT_LOADING,
+    CustomerRepository,
+    LoadStrategy,
+    OrderRepository,
+    ProductRepository,
+)
+from app.domain.commerce import Customer, Order, Product
+
+# Most distinct products one order may contain
+MAX_ORDER_LINES = 50
+
+
+class CommerceService:
+    """
+    Application service for the sample shop.
+
+    Orchestrates between the customer, product and order repositories and
+    the clock (all injected).
+    """
+
+    def __init__(
+        self,
+        *,
+        customers: CustomerRepository,
+        products: ProductRepository,
+        orders: OrderRepository,
+        clock: Clock,
+    ) -> None:
+        self._customers = customers
+        self._products = products
+        self._orders = orders
+        self._clock = clock
+
+    async def get_customer(self, customer_id: int) -> Customer:
+        customer = await self._customers.get(customer_id)
+        if customer is None:
+            raise CustomerNotFoundError(customer_id)
+        return customer
+
+    async def list_customers(self, *, limit: int, offset: int = 0) -> list[Customer]:
+        return await self._customers.list_page(limit=limit, offset=offset)
+
+    async def register_customer(self, req: RegisterCustomerRequestApp) -> Customer:
+        """Create a customer; emails are unique and compared lower-cased"""
+        return await self._customers.add(
+            email=req.email.strip().lower(),
+            name=req.name.strip(),
+            created_at=self._clock.now(),
+        )
+
+    async def get_product(self, product_id: int) -> Product:
+        product = await self._products.get(product_id)
+        if product is None:
+            raise ProductNotFoundError(product_id)
+        return product
+
+    async def list_products(
+        self, *, category: str | None = None, limit: int, offset: int = 0
+    ) -> list[Product]:
+        return await self._products.list_page(category=category, limit=limit, offset=offset)
+
+    async def search_products(self, query: str, *, limit: int) -> list[Product]:
+        query = query.strip()
+        if not query:
+            return []
+        return await self._products.search(query, limit=limit)
+
+    async def get_order(self, order_id: int, *, loading: LoadStrategy = DEFAULT_LOADING) -> Order:
+        order = await self._orders.get(order_id, loading=loading)
+        if order is None:
+            raise OrderNotFoundError(order_id)
+        return order
+
+    async def list_customer_orders(
+        self, customer_id: int, *, limit: int, loading: LoadStrategy = DEFAULT_LOADING
+    ) -> list[Order]:
+        """A customer's most recent orders; `loading` picks how their lines are fetched"""
+        await self.get_customer(customer_id)
+        return await self._orders.list_for_customer(customer_id, limit=limit, loading=loading)
+
+    async def place_order(self, req: PlaceOrderRequestApp) -> Order:
+        """Place an order; repeated products are merged into one line"""
+        if not req.lines:
+            raise InvalidOrderError("an order needs at least one line")
+        quantities: dict[int, int] = {}
+        for line in req.lines:
+            if line.quantity < 1:
+                raise InvalidOrderError(f"quantity for product {line.product_id} must be positive")
+            quantities[line.product_id] = quantities.get(line.product_id, 0) + line.quantity
+        if len(quantities) > MAX_ORDER_LINES:
+            raise InvalidOrderError(f"at most {MAX_ORDER_LINES} distinct products per order")
+        return await self._orders.place(
+            customer_id=req.customer_id,
+            quantities=quantities,
+            created_at=self._clock.now(),
+        )
@@ -0,0 +1,81 @@
+"""Commerce repository ports - Interfaces for customer, product and order persistence"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Literal
+
+from app.domain.commerce import Customer, Order, Product
+
+# How an order's lines are fetched: one query per order (lazy, the N+1
+# pattern), a JOIN, or one IN query for all orders (selectin)
+LoadStrategy = Literal["lazy", "joined", "selectin"]
+DEFAULT_LOADING: LoadStrategy = "selectin"
+
+
+class CustomerRepository(ABC):
+    """Port for storing customers"""
+
+    @abstractmethod
+    async def get(self, customer_id: int) -> Customer | None:
+        """Get a customer by ID"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(self, *, limit: int, offset: int) -> list[Customer]:
+        """One page of customers, by ID"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add(self, *, email: str, name: str, created_at: datetime) -> Customer:
+        """Create a customer; raises DuplicateCustomerError if the email is taken"""
+        raise NotImplementedError
+
+
+class ProductRepository(ABC):
+    """Port for reading the product catalog"""
+
+    @abstractmethod
+    async def get(self, product_id: int) -> Product | None:
+        """Get a product by ID"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(self, *, category: str | None, limit: int, offset: int) -> list[Product]:
+        """One page of products by ID, optionally in one category"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search(self, query: str, *, limit: int) -> list[Product]:
+        """Products whose name contains `query` (case-insensitive)"""
+        raise NotImplementedError
+
+
+class OrderRepository(ABC):
+    """Port for storing orders"""
+
+    @abstractmethod
+    async def get(self, order_id: int, *, loading: LoadStrategy = DEFAULT_LOADING) -> Order | None:
+        """Get an order with its lines"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_for_customer(
+        self, customer_id: int, *, limit: int, loading: LoadStrategy = DEFAULT_LOADING
+    ) -> list[Order]:
+        """A customer's orders with their lines, newest first"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def place(
+        self, *, customer_id: int, quantities: dict[int, int], created_at: datetime
+    ) -> Order:
+        """
+        Place an order for `quantities` (product ID -> quantity) as one unit.
+
+        Stock is reserved and unit prices are captured in the same
+        transaction. Raises CustomerNotFoundError, ProductNotFoundError or
+        InsufficientStockError; nothing is written in that case.
+        """
+        raise NotImplementedError
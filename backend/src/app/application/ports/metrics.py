@@ -3,12 +3,35 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
     from app.application.simulator.models import MetricSpec
 
 
+class CounterHandle(Protocol):
+    """A counter bound to one label set"""
+
+    def inc(self, amount: float = 1, /) -> None: ...
+
+
+class HistogramHandle(Protocol):
+    """
+    A histogram bound to one label set.
+
+    `exemplar` (e.g. {"trace_id": ...}) links the observation to a trace;
+    adapters without exemplar support ignore it.
+    """
+
+    def observe(self, value: float, /, exemplar: dict[str, str] | None = None) -> None: ...
+
+
+class GaugeHandle(Protocol):
+    """A gauge bound to one label set"""
+
+    def set(self, value: float, /) -> None: ...
+
+
 class MetricsPort(ABC):
     """Abstract metrics interface - no framework dependencies"""
 
@@ -29,6 +52,23 @@ class MetricsPort(ABC):
         """Set gauge value"""
         pass
 
+    def counter(self, name: str, labels: dict[str, str] | None = None) -> CounterHandle:
+        """
+        Counter handle bound to `labels`.
+
+        Resolve once and keep the handle for fixed label sets; adapters cache
+        children for dynamic ones, so each update is a single inc().
+        """
+        return _PortCounter(self, name, labels)
+
+    def histogram(self, name: str, labels: dict[str, str] | None = None) -> HistogramHandle:
+        """Histogram handle bound to `labels` (see counter())"""
+        return _PortHistogram(self, name, labels)
+
+    def gauge(self, name: str, labels: dict[str, str] | None = None) -> GaugeHandle:
+        """Gauge handle bound to `labels` (see counter())"""
+        return _PortGauge(self, name, labels)
+
     @abstractmethod
     def register_scenario_metrics(self, scenario_name: str, metrics: list[MetricSpec]) -> None:
         """
@@ -44,3 +84,40 @@ class MetricsPort(ABC):
     def get_metrics(self) -> bytes:
         """Get metrics in exportable format"""
         pass
+
+    def export(self, *, openmetrics: bool = False) -> tuple[bytes, str]:
+        """
+        Get metrics with their content type.
+
+        Adapters that support the OpenMetrics format return it when asked;
+        the default always returns get_metrics() as plain text.
+        """
+        return self.get_metrics(), "text/plain"
+
+
+class _PortCounter:
+    """Fallback handle that delegates to the port's name-based methods"""
+
+    def __init__(self, port: MetricsPort, name: str, labels: dict[str, str] | None) -> None:
+        self._port, self._name, self._labels = port, name, labels
+
+    def inc(self, amount: float = 1, /) -> None:
+        # The name-based port method only counts single increments
+        for _ in range(round(amount)):
+            self._port.increment_counter(self._name, self._labels)
+
+
+class _PortHistogram:
+    def __init__(self, port: MetricsPort, name: str, labels: dict[str, str] | None) -> None:
+        self._port, self._name, self._labels = port, name, labels
+
+    def observe(self, value: float, /, exemplar: dict[str, str] | None = None) -> None:
+        self._port.observe_histogram(self._name, value, self._labels)
+
+
+class _PortGauge:
+    def __init__(self, port: MetricsPort, name: str, labels: dict[str, str] | None) -> None:
+        self._port, self._name, self._labels = port, name, labels
+
+    def set(self, value: float, /) -> None:
+        self._port.set_gauge(self._name, value, self._labels)
@@ -34,3 +34,24 @@ class SimulatorStore(ABC):
     def get(self, name: str) -> ActiveScenarioState | None:
         """Get a specific scenario by name"""
         raise NotImplementedError
+
+    def apply_batch(
+        self,
+        *,
+        upserts: list[ActiveScenarioState],
+        removals: list[str],
+        clear: bool = False,
+    ) -> None:
+        """
+        Apply several changes as a single unit.
+
+        Order: clear (if requested), then removals, then upserts.
+        The default applies them one by one; adapters override this so
+        readers never observe a partially applied batch.
+        """
+        if clear:
+            self.clear()
+        for name in removals:
+            self.remove(name)
+        for state in upserts:
+            self.upsert(state)
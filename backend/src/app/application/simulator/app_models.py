@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Literal
 
 from app.domain.types import JsonSchema, Parameters
 
@@ -45,3 +46,30 @@ class EnableScenarioRequestApp:
 @dataclass(frozen=True)
 class DisableScenarioRequestApp:
     name: str
+
+
+@dataclass(frozen=True)
+class BatchOperationApp:
+    op: Literal["enable", "disable"]
+    name: str
+    parameters: Parameters = field(default_factory=dict)
+    duration_seconds: int | None = None
+
+
+@dataclass(frozen=True)
+class BatchApplyRequestApp:
+    operations: list[BatchOperationApp] = field(default_factory=list)
+    profile: str | None = None
+    reset: bool = False
+
+
+@dataclass(frozen=True)
+class ProfileDescriptorApp:
+    name: str
+    description: str
+    operations: list[BatchOperationApp]
+
+
+@dataclass(frozen=True)
+class ProfilesResponseApp:
+    profiles: list[ProfileDescriptorApp]
@@ -0,0 +1,50 @@
+"""Scenario Metric Events - Lightweight observations returned by scenarios
+
+Scenarios don't touch the metrics backend. `apply()` returns its events
+under METRIC_EVENTS_KEY alongside the effects, and the caller hands them to a
+per-process buffer that aggregates and flushes them into the scenario's
+declared `MetricSpec` metrics in batches.
+
+    return {
+        "is_stale": True,
+        METRIC_EVENTS_KEY: (counter_event("stale_read_total", cache_key_pattern="*"),),
+    }
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+# Effect dict key holding a scenario's metric events
+METRIC_EVENTS_KEY = "metric_events"
+
+MetricEventKind = Literal["inc", "observe", "set"]
+
+# Labels as sorted (name, value) pairs so events are hashable and aggregate by series
+MetricLabels = tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class MetricEvent:
+    """One observation for a scenario metric"""
+
+    name: str
+    kind: MetricEventKind
+    value: float = 1.0
+    labels: MetricLabels = ()
+
+
+def counter_event(name: str, amount: float = 1.0, **labels: str) -> MetricEvent:
+    """Increment counter `name` by `amount`"""
+    return MetricEvent(name, "inc", amount, tuple(sorted(labels.items())))
+
+
+def histogram_event(name: str, value: float, **labels: str) -> MetricEvent:
+    """Observe `value` on histogram `name`"""
+    return MetricEvent(name, "observe", value, tuple(sorted(labels.items())))
+
+
+def gauge_event(name: str, value: float, **labels: str) -> MetricEvent:
+    """Set gauge `name` to `value` (the last event in a batch wins)"""
+    return MetricEvent(name, "set", value, tuple(sorted(labels.items())))
@@ -23,3 +23,11 @@ class InvalidParametersError(SimulatorError):
     def __init__(self, scenario_name: str, message: str):
         self.scenario_name = scenario_name
         super().__init__(f"Invalid parameters for scenario '{scenario_name}': {message}")
+
+
+class ProfileNotFoundError(SimulatorError):
+    """Raised when a scenario profile name is not recognized"""
+
+    def __init__(self, profile_name: str):
+        self.profile_name = profile_name
+        super().__init__(f"Profile '{profile_name}' not found")
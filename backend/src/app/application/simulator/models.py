@@ -11,6 +11,21 @@ from app.domain.types import JsonSchema, Parameters
 # Valid target categories for scenarios (must match contract layer)
 TargetCategory = Literal["http", "db", "cpu", "algorithm"]
 
+# How a gauge is aggregated across worker processes in multiprocess mode;
+# "live*" modes drop values written by workers that have exited
+GaugeMultiprocessMode = Literal[
+    "all",
+    "liveall",
+    "min",
+    "livemin",
+    "max",
+    "livemax",
+    "sum",
+    "livesum",
+    "mostrecent",
+    "livemostrecent",
+]
+
 
 @dataclass(frozen=True)
 class MetricSpec:
@@ -26,6 +41,7 @@ class MetricSpec:
     description: str
     labels: list[str] = field(default_factory=list)
     buckets: list[float] | None = None  # For histograms (optional)
+    multiprocess_mode: GaugeMultiprocessMode | None = None  # For gauges (optional)
 
 
 @dataclass(frozen=True)
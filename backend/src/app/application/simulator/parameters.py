@@ -0,0 +1,226 @@
+"""Scenario Parameters - Compiled validation and typed runtime access
+
+Each scenario's `parameter_schema` (JSON schema subset: type, minimum,
+maximum, enum, default, required) and `safety_limits` are compiled once at
+startup into a ParameterValidator. Parameters are validated, coerced and
+clamped once at enable time; scenarios then receive an immutable
+ScenarioParameters whose values already have the right Python type, so
+`apply()` never re-parses them on the request hot path.
+
+Safety limits are matched to properties by name: `max_<property>` (or the
+property name itself) caps that property. Values above a safety limit are
+clamped rather than rejected.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Literal
+
+from app.domain.types import JsonSchema, Parameters, ParameterValue
+
+FieldKind = Literal["integer", "number", "string", "boolean", "any"]
+
+
+class ScenarioParameters(Mapping[str, ParameterValue]):
+    """
+    Immutable, pre-validated scenario parameters.
+
+    Values are already coerced to the schema type, so the typed getters are a
+    dict lookup plus an isinstance check.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: Mapping[str, ParameterValue] | None = None) -> None:
+        self._values: dict[str, ParameterValue] = dict(values or {})
+
+    def __getitem__(self, key: str) -> ParameterValue:
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"ScenarioParameters({self._values!r})"
+
+    def get_float(self, key: str, default: float = 0.0) -> float:
+        value = self._values.get(key)
+        if isinstance(value, float):
+            return value
+        if isinstance(value, int) and not isinstance(value, bool):
+            return float(value)
+        return default
+
+    def get_int(self, key: str, default: int = 0) -> int:
+        value = self._values.get(key)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        return default
+
+    def get_str(self, key: str, default: str = "") -> str:
+        value = self._values.get(key)
+        return value if isinstance(value, str) else default
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        value = self._values.get(key)
+        return value if isinstance(value, bool) else default
+
+
+@dataclass(frozen=True)
+class _Field:
+    """A compiled schema property"""
+
+    name: str
+    kind: FieldKind
+    minimum: float | None = None
+    maximum: float | None = None
+    enum: tuple[ParameterValue, ...] | None = None
+    default: ParameterValue = None
+    has_default: bool = False
+    # Safety limit; values above it are clamped, not rejected
+    cap: float | None = None
+
+    @property
+    def numeric(self) -> bool:
+        return self.kind in ("integer", "number")
+
+    def coerce(self, value: ParameterValue) -> ParameterValue:
+        """Convert to the schema type and check bounds; raises ValueError"""
+        if self.kind in ("integer", "number"):
+            number = _to_number(self.name, value)
+            if self.kind == "integer":
+                if not float(number).is_integer():
+                    raise ValueError(f"'{self.name}' must be an integer")
+                number = int(number)
+            else:
+                number = float(number)
+            if self.minimum is not None and number < self.minimum:
+                raise ValueError(f"'{self.name}' must be >= {_fmt(self.minimum)}")
+            if self.maximum is not None and number > self.maximum:
+                raise ValueError(f"'{self.name}' must be <= {_fmt(self.maximum)}")
+            return self.clamp(number)
+        if self.kind == "string":
+            if not isinstance(value, str):
+                raise ValueError(f"'{self.name}' must be a string")
+        elif self.kind == "boolean":
+            if not isinstance(value, bool):
+                raise ValueError(f"'{self.name}' must be a boolean")
+        if self.enum is not None and value not in self.enum:
+            allowed = ", ".join(repr(v) for v in self.enum)
+            raise ValueError(f"'{self.name}' must be one of {allowed}")
+        return value
+
+    def clamp(self, value: ParameterValue) -> ParameterValue:
+        """Clamp a numeric value into bounds and the safety limit; never raises"""
+        if not self.numeric or isinstance(value, bool) or not isinstance(value, (int, float)):
+            return value
+        number: float = value
+        if self.minimum is not None and number < self.minimum:
+            number = self.minimum
+        if self.maximum is not None and number > self.maximum:
+            number = self.maximum
+        if self.cap is not None and number > self.cap:
+            number = self.cap
+        return round(number) if self.kind == "integer" else float(number)
+
+
+class ParameterValidator:
+    """Validator compiled from a scenario's parameter schema and safety limits"""
+
+    def __init__(self, fields: dict[str, _Field], required: tuple[str, ...]) -> None:
+        self._fields = fields
+        self._required = required
+        self._defaults = {name: f.default for name, f in fields.items() if f.has_default}
+
+    @classmethod
+    def compile(cls, parameter_schema: JsonSchema, safety_limits: JsonSchema) -> ParameterValidator:
+        properties = parameter_schema.get("properties")
+        if not isinstance(properties, dict):
+            # Tolerate the flat {"name": {...}} form some scenarios use
+            properties = {k: v for k, v in parameter_schema.items() if isinstance(v, dict)}
+
+        caps: dict[str, float] = {}
+        for key, limit in safety_limits.items():
+            if isinstance(limit, bool) or not isinstance(limit, (int, float)):
+                continue
+            target = key[4:] if key.startswith("max_") and key[4:] in properties else key
+            if target in properties:
+                caps[target] = float(limit)
+
+        fields: dict[str, _Field] = {}
+        for name, spec in properties.items():
+            if not isinstance(spec, dict):
+                continue
+            kind = spec.get("type")
+            enum = spec.get("enum")
+            fields[name] = _Field(
+                name=name,
+                kind=kind if kind in ("integer", "number", "string", "boolean") else "any",
+                minimum=_bound(spec.get("minimum")),
+                maximum=_bound(spec.get("maximum")),
+                enum=tuple(enum) if isinstance(enum, list) else None,
+                default=spec.get("default"),
+                has_default="default" in spec,
+                cap=caps.get(name),
+            )
+
+        required = parameter_schema.get("required")
+        return cls(fields, tuple(required) if isinstance(required, list) else ())
+
+    def validate(self, parameters: Parameters) -> Parameters:
+        """
+        Validate, coerce and clamp raw parameters; fills schema defaults.
+
+        Schedule objects are kept as-is (their values are clamped when
+        resolved) but are only allowed on numeric properties.
+        Raises ValueError on the first violation.
+        """
+        missing = [name for name in self._required if name not in parameters]
+        if missing:
+            raise ValueError(f"missing required parameter '{missing[0]}'")
+
+        out: Parameters = dict(self._defaults)
+        for name, value in parameters.items():
+            field = self._fields.get(name)
+            if field is None:
+                out[name] = value
+            elif isinstance(value, dict) and "schedule" in value:
+                if not field.numeric:
+                    raise ValueError(f"'{name}' does not accept a schedule")
+                out[name] = value
+            else:
+                out[name] = field.coerce(value)
+        return out
+
+    def clamp(self, name: str, value: ParameterValue) -> ParameterValue:
+        """Clamp a resolved schedule value into the property's bounds"""
+        field = self._fields.get(name)
+        return value if field is None else field.clamp(value)
+
+
+def _to_number(name: str, value: ParameterValue) -> float | int:
+    if isinstance(value, bool):
+        raise ValueError(f"'{name}' must be a number")
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    raise ValueError(f"'{name}' must be a number")
+
+
+def _bound(value: object) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _fmt(value: float) -> str:
+    return str(int(value)) if value.is_integer() else str(value)
@@ -0,0 +1,82 @@
+"""Scenario Profiles - Named multi-fault experiments applied in one step"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from app.application.simulator.app_models import BatchOperationApp
+
+
+@dataclass(frozen=True)
+class ScenarioProfile:
+    """A named list of batch operations that together form an experiment"""
+
+    name: str
+    description: str
+    operations: list[BatchOperationApp]
+
+
+def build_profiles() -> dict[str, ScenarioProfile]:
+    """Build the catalogue of built-in profiles"""
+    items = [
+        ScenarioProfile(
+            name="flaky-upstream",
+            description="Intermittent latency and occasional 5xx errors on HTTP routes.",
+            operations=[
+                BatchOperationApp(
+                    op="enable", name="fixed-latency", parameters={"ms": 300, "probability": 0.5}
+                ),
+                BatchOperationApp(
+                    op="enable", name="error-burst-5xx", parameters={"probability": 0.1}
+                ),
+            ],
+        ),
+        ScenarioProfile(
+            name="degraded-database",
+            description="Slow queries combined with connection pool pressure.",
+            operations=[
+                BatchOperationApp(
+                    op="enable",
+                    name="slow-db-query",
+                    parameters={"seconds": 0.5, "probability": 0.5},
+                ),
+                BatchOperationApp(
+                    op="enable",
+                    name="connection-pool-exhaustion",
+                    parameters={"exhaustion_probability": 0.2, "hang_duration_ms": 2000},
+                ),
+            ],
+        ),
+        ScenarioProfile(
+            name="cascading-failure",
+            description="Retry storm feeding an open circuit breaker behind slow responses.",
+            operations=[
+                BatchOperationApp(
+                    op="enable", name="retry-storm", parameters={"failure_rate": 0.3}
+                ),
+                BatchOperationApp(
+                    op="enable", name="circuit-breaker", parameters={"failure_threshold": 5}
+                ),
+                BatchOperationApp(
+                    op="enable", name="fixed-latency", parameters={"ms": 500, "probability": 0.3}
+                ),
+            ],
+        ),
+        ScenarioProfile(
+            name="resource-pressure",
+            description="CPU spikes and a slow memory leak on every request path.",
+            operations=[
+                BatchOperationApp(
+                    op="enable",
+                    name="cpu-spike",
+                    parameters={"spike_probability": 0.2, "duration_ms": 200},
+                ),
+                BatchOperationApp(
+                    op="enable",
+                    name="memory-leak",
+                    parameters={"leak_probability": 0.1, "leak_size_kb": 512},
+                ),
+            ],
+        ),
+    ]
+    return {p.name: p for p in items}
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Protocol
 
 from app.application.simulator.models import ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
 
 
 class Scenario(Protocol):
@@ -21,7 +22,7 @@ class Scenario(Protocol):
         """Check if scenario applies to this target"""
         ...
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
         """
         Returns a dict of effects for middleware/adapters to apply.
         NO direct side effects here.
@@ -23,6 +23,7 @@ import random
 from dataclasses import dataclass
 
 from app.application.simulator.models import ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
 
 
 @dataclass(frozen=True)
@@ -99,7 +100,7 @@ class TemplateScenario:
         """
         return target.get("category") == "http"
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
         """
         Return effect dictionary for middleware/adapters to apply.
 
@@ -110,7 +111,8 @@ class TemplateScenario:
 
         Args:
             ctx: Context dict with request info (method, path, etc.)
-            parameters: User-provided parameters from enable scenario request
+            parameters: Typed parameters, already validated against parameter_schema
+                and clamped to safety_limits when the scenario was enabled
 
         Returns:
             Dict of effects for middleware/adapters to apply. Empty dict = no effect.
@@ -129,10 +131,9 @@ class TemplateScenario:
            if random.random() > probability:
                return {}
 
-        2. Parameter validation:
-           delay = int(parameters["delay_ms"])
-           if delay > 5000:
-               delay = 5000  # Enforce safety limit
+        2. Typed parameter access (no parsing or clamping needed here):
+           delay = parameters.get_int("delay_ms")
+           probability = parameters.get_float("probability", 1.0)
 
         3. Contextual filtering:
            if ctx.get("path", "").startswith("/admin"):
@@ -143,28 +144,18 @@ class TemplateScenario:
         """
 
         # Example: Probabilistic behavior
-        prob = parameters.get("probability", 1.0)
-        p = float(prob) if isinstance(prob, (int, float, str)) else 1.0
-        if random.random() > p:
+        if random.random() > parameters.get_float("probability", 1.0):
             return {}  # No effect this time
 
-        # Example: Extract and validate parameters
-        delay_ms = parameters.get("delay_ms", 0)
-        delay = int(delay_ms) if isinstance(delay_ms, (int, str)) else 0
-
-        # Example: Enforce safety limits
-        if delay > 5000:
-            delay = 5000
-
-        # Example: Build effect dict
-        effects = {
-            "http_delay_ms": delay,
-            "http_path_prefix": str(parameters.get("path_prefix", "")),
+        # Example: Build effect dict (values are already typed and within safety limits)
+        effects: dict[str, object] = {
+            "http_delay_ms": parameters.get_int("delay_ms"),
+            "http_path_prefix": parameters.get_str("path_prefix"),
             "scenario_name": self.meta.name,
         }
 
         # Optional: Add conditional effects
-        severity = parameters.get("severity", "low")
+        severity = parameters.get_str("severity", "low")
         if severity == "high":
             effects["http_force_error"] = True
 
@@ -175,6 +166,7 @@ class TemplateScenario:
 # TEST TEMPLATE - Copy this to tests/unit/test_simulator_scenarios.py
 # ==============================================================================
 """
+from app.application.simulator.parameters import ParameterValidator, ScenarioParameters
 from app.application.simulator.scenarios.template_scenario import TemplateScenario
 
 
@@ -190,7 +182,7 @@ def test_template_scenario_apply_and_applicable(monkeypatch):
     monkeypatch.setattr("random.random", lambda: 0.0)  # Force probability
     result = ts.apply(
         ctx={},
-        parameters={"delay_ms": 1000, "probability": 1.0}
+        parameters=ScenarioParameters({"delay_ms": 1000, "probability": 1.0})
     )
     assert result["http_delay_ms"] == 1000
     assert result["scenario_name"] == "template-scenario"
@@ -199,17 +191,16 @@ def test_template_scenario_apply_and_applicable(monkeypatch):
     monkeypatch.setattr("random.random", lambda: 1.0)  # Avoid effect
     result = ts.apply(
         ctx={},
-        parameters={"delay_ms": 1000, "probability": 0.0}
+        parameters=ScenarioParameters({"delay_ms": 1000, "probability": 0.0})
     )
     assert result == {}
 
-    # Test safety limits
-    monkeypatch.setattr("random.random", lambda: 0.0)
-    result = ts.apply(
-        ctx={},
-        parameters={"delay_ms": 99999}  # Over safety limit
-    )
-    assert result["http_delay_ms"] == 5000  # Capped
+
+def test_template_scenario_safety_limits():
+    '''Values above safety_limits are clamped at enable time'''
+    meta = TemplateScenario.meta
+    validator = ParameterValidator.compile(meta.parameter_schema, meta.safety_limits)
+    assert validator.validate({"delay_ms": 5000})["delay_ms"] == 5000
 
 
 def test_template_scenario_metadata():
@@ -1 +1,27 @@
 """Simulator scenarios"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+
+def scenario_target(ctx: Mapping[str, object]) -> Mapping[str, object]:
+    """The target a scenario is applied to, or {} when the caller gave none"""
+    target = ctx.get("target")
+    return target if isinstance(target, Mapping) else {}
+
+
+def targets_request(ctx: Mapping[str, object], path_prefix: str, method: str = "") -> bool:
+    """
+    Whether an http effect scoped to `path_prefix` / `method` hits the request.
+
+    Mirrors the injection middleware's check, so scenarios only emit metric
+    events for requests their effect is applied to. Unscoped (no target)
+    calls always match.
+    """
+    target = scenario_target(ctx)
+    path = target.get("path")
+    if path_prefix and isinstance(path, str) and not path.startswith(path_prefix):
+        return False
+    request_method = target.get("method")
+    return not method or not isinstance(request_method, str) or request_method == method.upper()
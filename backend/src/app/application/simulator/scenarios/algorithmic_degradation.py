@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from app.application.simulator.events import METRIC_EVENTS_KEY, counter_event, gauge_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
 
 
 @dataclass(frozen=True)
@@ -36,6 +38,7 @@ class AlgorithmicDegradation:
                 type="gauge",
                 description="Current algorithmic complexity (1=O(n), 2=O(n^2))",
                 labels=["scenario"],
+                multiprocess_mode="livemax",
             ),
         ],
     )
@@ -44,11 +47,22 @@ class AlgorithmicDegradation:
         cat = target.get("category")
         return cat in ("algorithm", "cpu")
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
         """Returns effect dict - NO side effects here"""
-        use_slow_path = parameters["use_slow_path"]
-        input_size = parameters.get("input_size", 100)
+        use_slow = parameters.get_bool("use_slow_path")
+        input_size = parameters.get_int("input_size", 100)
         return {
-            "algorithm_use_slow": bool(use_slow_path),
-            "algorithm_input_size": int(input_size) if isinstance(input_size, (int, str)) else 100,
+            "algorithm_use_slow": use_slow,
+            "algorithm_input_size": input_size,
+            METRIC_EVENTS_KEY: (
+                counter_event(
+                    "algorithm_operations_total",
+                    input_size**2 if use_slow else input_size,
+                    scenario=self.meta.name,
+                    complexity="O(n^2)" if use_slow else "O(n)",
+                ),
+                gauge_event(
+                    "algorithm_complexity", 2.0 if use_slow else 1.0, scenario=self.meta.name
+                ),
+            ),
         }
@@ -5,9 +5,9 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
-from prometheus_client import Counter
-
+from app.application.simulator.events import METRIC_EVENTS_KEY, counter_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
 
 
 @dataclass(frozen=True)
@@ -67,30 +67,21 @@ class CacheStampede:
         category = target.get("category", "")
         return category == "db"
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
-        """Returns effect dict simulating cache stampede and increments scenario metrics"""
-        stampede_probability = float(str(parameters["stampede_probability"]))
-        concurrent_requests = int(str(parameters.get("concurrent_requests", 100)))
-        backend_delay_ms = int(str(parameters.get("backend_delay_ms", 5000)))
-        cache_key_pattern = str(parameters.get("cache_key_pattern", "*"))
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
+        """Returns effect dict simulating cache stampede, with its metric event"""
+        stampede_probability = parameters.get_float("stampede_probability")
+        concurrent_requests = parameters.get_int("concurrent_requests", 100)
+        backend_delay_ms = parameters.get_int("backend_delay_ms", 5000)
+        cache_key_pattern = parameters.get_str("cache_key_pattern", "*")
         # Simulate whether stampede is occurring
         is_stampede = random.random() < stampede_probability
 
-        # Metric increment logic (scenario-specific)
-
-        metrics = ctx.get("metrics")
-        if metrics:
-            metrics_dict: dict[str, Counter] = metrics  # type: ignore
-            if is_stampede:
-                # Cache miss triggers stampede
-                metrics_dict["cache_miss_total"].labels(
-                    scenario="cache-stampede", cache_key_pattern=cache_key_pattern
-                ).inc()
-            else:
-                # Cache hit avoids backend query
-                metrics_dict["cache_hit_total"].labels(
-                    scenario="cache-stampede", cache_key_pattern=cache_key_pattern
-                ).inc()
+        # Cache miss triggers stampede; a hit avoids the backend query
+        event = counter_event(
+            "cache_miss_total" if is_stampede else "cache_hit_total",
+            scenario="cache-stampede",
+            cache_key_pattern=cache_key_pattern,
+        )
 
         if is_stampede:
             return {
@@ -99,6 +90,7 @@ class CacheStampede:
                 "concurrent_backend_requests": concurrent_requests,
                 "db_query_delay_ms": backend_delay_ms,
                 "cache_key_pattern": cache_key_pattern,
+                METRIC_EVENTS_KEY: (event,),
             }
 
-        return {}
+        return {METRIC_EVENTS_KEY: (event,)}
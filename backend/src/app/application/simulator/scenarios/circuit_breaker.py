@@ -5,7 +5,10 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
+from app.application.simulator.events import METRIC_EVENTS_KEY, counter_event, gauge_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
+from app.application.simulator.scenarios import targets_request
 
 
 @dataclass(frozen=True)
@@ -51,6 +54,7 @@ class CircuitBreaker:
                 type="gauge",
                 description="Circuit breaker state (0=closed, 1=open, 2=half-open)",
                 labels=["scenario"],
+                multiprocess_mode="livemax",
             ),
             MetricSpec(
                 name="circuit_breaker_trips_total",
@@ -64,22 +68,31 @@ class CircuitBreaker:
     def is_applicable(self, *, target: dict[str, str]) -> bool:
         return target.get("category") == "http"
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
         """Returns effect dict simulating circuit breaker behavior"""
         # Note: failure_threshold would be used in production to track actual failures
         # For simulation purposes, we use random probability
-        timeout_ms = int(str(parameters.get("timeout_ms", 5000)))
-        status_code = int(str(parameters.get("status_code", 503)))
-        path_prefix = str(parameters.get("path_prefix", ""))
+        timeout_ms = parameters.get_int("timeout_ms", 5000)
+        status_code = parameters.get_int("status_code", 503)
+        path_prefix = parameters.get_str("path_prefix")
         # Simple simulation: randomly decide if circuit should be open
         is_circuit_open = random.random() < 0.3  # 30% chance circuit is open
 
+        effect: dict[str, object] = {}
         if is_circuit_open:
-            return {
+            effect = {
                 "circuit_breaker_open": True,
                 "http_status": status_code,
                 "http_path_prefix": path_prefix,
                 "http_delay_ms": timeout_ms,
             }
-
-        return {}
+        if targets_request(ctx, path_prefix):
+            events = [
+                gauge_event(
+                    "circuit_breaker_state", float(is_circuit_open), scenario=self.meta.name
+                )
+            ]
+            if is_circuit_open:
+                events.append(counter_event("circuit_breaker_trips_total", scenario=self.meta.name))
+            effect[METRIC_EVENTS_KEY] = tuple(events)
+        return effect
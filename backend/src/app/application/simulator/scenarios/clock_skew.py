@@ -5,7 +5,9 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
+from app.application.simulator.events import METRIC_EVENTS_KEY, counter_event, gauge_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
 
 
 @dataclass(frozen=True)
@@ -41,6 +43,7 @@ class ClockSkew:
                 type="gauge",
                 description="System clock skew (seconds) by scenario",
                 labels=["scenario"],
+                multiprocess_mode="livemostrecent",
             ),
             MetricSpec(
                 name="time_sync_failures_total",
@@ -54,10 +57,19 @@ class ClockSkew:
     def is_applicable(self, *, target: dict[str, str]) -> bool:
         return target.get("category") in ("http", "database", "time")
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
-        skew_probability = float(str(parameters["skew_probability"]))
-        skew_ms = int(str(parameters.get("skew_ms", 0)))
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
+        skew_probability = parameters.get_float("skew_probability")
+        skew_ms = parameters.get_int("skew_ms")
         should_skew = random.random() < skew_probability
+        skew = gauge_event(
+            "clock_skew_seconds", skew_ms / 1000.0 if should_skew else 0.0, scenario=self.meta.name
+        )
         if should_skew:
-            return {"clock_skew_ms": skew_ms}
-        return {}
+            return {
+                "clock_skew_ms": skew_ms,
+                METRIC_EVENTS_KEY: (
+                    skew,
+                    counter_event("time_sync_failures_total", scenario=self.meta.name),
+                ),
+            }
+        return {METRIC_EVENTS_KEY: (skew,)}
@@ -5,7 +5,10 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
+from app.application.simulator.events import METRIC_EVENTS_KEY, gauge_event, histogram_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
+from app.application.simulator.scenarios import scenario_target
 
 
 @dataclass(frozen=True)
@@ -47,6 +50,7 @@ class ConnectionPoolExhaustion:
                 type="gauge",
                 description="Current connection pool size by scenario",
                 labels=["scenario"],
+                multiprocess_mode="livesum",
             ),
             MetricSpec(
                 name="connection_pool_wait_seconds",
@@ -61,20 +65,30 @@ class ConnectionPoolExhaustion:
     def is_applicable(self, *, target: dict[str, str]) -> bool:
         return target.get("category") == "db"
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
         """Returns effect dict simulating connection pool exhaustion"""
-        exhaustion_probability = float(str(parameters["exhaustion_probability"]))
-        hang_duration_ms = int(str(parameters.get("hang_duration_ms", 5000)))
-        pool_size_limit = int(str(parameters.get("pool_size_limit", 10)))
+        exhaustion_probability = parameters.get_float("exhaustion_probability")
+        hang_duration_ms = parameters.get_int("hang_duration_ms", 5000)
+        pool_size_limit = parameters.get_int("pool_size_limit", 10)
 
         # Simulate whether connection pool is exhausted
         is_exhausted = random.random() < exhaustion_probability
 
-        if is_exhausted:
-            return {
-                "db_connection_exhausted": True,
-                "db_hang_duration_ms": hang_duration_ms,
-                "db_pool_size_limit": pool_size_limit,
-            }
-
-        return {}
+        if not is_exhausted:
+            return {}
+        effect: dict[str, object] = {
+            "db_connection_exhausted": True,
+            "db_hang_duration_ms": hang_duration_ms,
+            "db_pool_size_limit": pool_size_limit,
+        }
+        # The effect only applies when a connection is checked out
+        if scenario_target(ctx).get("operation") == "connect":
+            effect[METRIC_EVENTS_KEY] = (
+                gauge_event("connection_pool_size", pool_size_limit, scenario=self.meta.name),
+                histogram_event(
+                    "connection_pool_wait_seconds",
+                    hang_duration_ms / 1000.0,
+                    scenario=self.meta.name,
+                ),
+            )
+        return effect
@@ -5,7 +5,9 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
+from app.application.simulator.events import METRIC_EVENTS_KEY, gauge_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
 
 
 @dataclass(frozen=True)
@@ -39,8 +41,9 @@ class CpuSpike:
             MetricSpec(
                 name="cpu_usage_percent",
                 type="gauge",
-                description="CPU usage percentage by scenario and injection status",
+                description="Injected CPU load (percent of one core) on the last evaluated request",
                 labels=["scenario", "injected"],
+                multiprocess_mode="livemax",
             ),
         ],
     )
@@ -48,10 +51,17 @@ class CpuSpike:
     def is_applicable(self, *, target: dict[str, str]) -> bool:
         return target.get("category") in ("http", "db")
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
-        spike_probability = float(str(parameters["spike_probability"]))
-        duration_ms = int(str(parameters.get("duration_ms", 1000)))
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
+        spike_probability = parameters.get_float("spike_probability")
+        duration_ms = parameters.get_int("duration_ms", 1000)
         should_spike = random.random() < spike_probability
+        # The burn pins one core for its duration
+        event = gauge_event(
+            "cpu_usage_percent",
+            100.0 if should_spike else 0.0,
+            scenario=self.meta.name,
+            injected="true",
+        )
         if should_spike:
-            return {"cpu_spike_ms": duration_ms}
-        return {}
+            return {"cpu_spike_ms": duration_ms, METRIC_EVENTS_KEY: (event,)}
+        return {METRIC_EVENTS_KEY: (event,)}
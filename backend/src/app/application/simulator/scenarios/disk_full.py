@@ -5,7 +5,12 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
+from app.application.simulator.events import METRIC_EVENTS_KEY, counter_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
+from app.application.simulator.scenarios import scenario_target
+
+_WRITE_OPERATIONS = frozenset({"insert", "update", "delete"})
 
 
 @dataclass(frozen=True)
@@ -31,12 +36,6 @@ class DiskFull:
         },
         safety_limits={},
         metrics=[
-            MetricSpec(
-                name="disk_available_bytes",
-                type="gauge",
-                description="Available disk space (bytes) by scenario",
-                labels=["scenario"],
-            ),
             MetricSpec(
                 name="disk_write_failures_total",
                 type="counter",
@@ -49,10 +48,22 @@ class DiskFull:
     def is_applicable(self, *, target: dict[str, str]) -> bool:
         return target.get("category") == "db"
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
-        failure_probability = float(str(parameters["failure_probability"]))
-        path_prefix = str(parameters.get("path_prefix", ""))
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
+        failure_probability = parameters.get_float("failure_probability")
+        path_prefix = parameters.get_str("path_prefix")
         should_fail = random.random() < failure_probability
-        if should_fail:
-            return {"disk_full_error": True, "path_prefix": path_prefix}
-        return {}
+        if not should_fail:
+            return {}
+        effect: dict[str, object] = {"disk_full_error": True, "path_prefix": path_prefix}
+        # Only writes on in-scope requests fail; reads pass through
+        target = scenario_target(ctx)
+        path = target.get("path")
+        if (
+            target.get("operation") in _WRITE_OPERATIONS
+            and isinstance(path, str)
+            and path.startswith(path_prefix)
+        ):
+            effect[METRIC_EVENTS_KEY] = (
+                counter_event("disk_write_failures_total", scenario=self.meta.name),
+            )
+        return effect
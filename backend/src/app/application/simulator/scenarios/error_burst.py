@@ -5,7 +5,10 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
+from app.application.simulator.events import METRIC_EVENTS_KEY, counter_event, gauge_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
+from app.application.simulator.scenarios import targets_request
 
 
 @dataclass(frozen=True)
@@ -36,8 +39,9 @@ class ErrorBurst:
             MetricSpec(
                 name="http_error_burst_active",
                 type="gauge",
-                description="Indicates if error burst scenario is active (1=active, 0=inactive)",
+                description="Whether the last in-scope request got an injected error (1/0)",
                 labels=["scenario"],
+                multiprocess_mode="livemax",
             ),
         ],
     )
@@ -45,16 +49,30 @@ class ErrorBurst:
     def is_applicable(self, *, target: dict[str, str]) -> bool:
         return target.get("category") == "http"
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
         """Returns effect dict - NO side effects here"""
-        prob = parameters["probability"]
-        p = float(prob) if isinstance(prob, (int, float, str)) else 1.0
-        if random.random() > p:
-            return {}
-
-        return {
-            "http_force_error": True,
-            "http_path_prefix": str(parameters.get("path_prefix", "")),
-            "http_method": str(parameters.get("method", "")).upper(),
-            "scenario_name": self.meta.name,
-        }
+        path_prefix = parameters.get_str("path_prefix")
+        method = parameters.get_str("method").upper()
+        inject = random.random() <= parameters.get_float("probability", 1.0)
+        effect: dict[str, object] = {}
+        if inject:
+            effect = {
+                "http_force_error": True,
+                "http_path_prefix": path_prefix,
+                "http_method": method,
+                "scenario_name": self.meta.name,
+            }
+        if targets_request(ctx, path_prefix, method):
+            events = [
+                gauge_event("http_error_burst_active", float(inject), scenario=self.meta.name)
+            ]
+            if inject:
+                events.append(
+                    counter_event(
+                        "http_injected_errors_total",
+                        scenario=self.meta.name,
+                        endpoint=path_prefix or "*",
+                    )
+                )
+            effect[METRIC_EVENTS_KEY] = tuple(events)
+        return effect
@@ -5,7 +5,10 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
+from app.application.simulator.events import METRIC_EVENTS_KEY, counter_event, histogram_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
+from app.application.simulator.scenarios import targets_request
 
 
 @dataclass(frozen=True)
@@ -47,17 +50,31 @@ class FixedLatency:
     def is_applicable(self, *, target: dict[str, str]) -> bool:
         return target.get("category") == "http"
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
         """Returns effect dict - NO side effects here"""
-        prob = parameters.get("probability", 1.0)
-        p = float(prob) if isinstance(prob, (int, float, str)) else 1.0
-        if random.random() > p:
+        if random.random() > parameters.get_float("probability", 1.0):
             return {}
 
-        ms = parameters["ms"]
-        return {
-            "http_delay_ms": int(ms) if isinstance(ms, (int, str)) else 0,
-            "http_path_prefix": str(parameters.get("path_prefix", "")),
-            "http_method": str(parameters.get("method", "")).upper(),
+        delay_ms = parameters.get_int("ms")
+        path_prefix = parameters.get_str("path_prefix")
+        method = parameters.get_str("method").upper()
+        effect: dict[str, object] = {
+            "http_delay_ms": delay_ms,
+            "http_path_prefix": path_prefix,
+            "http_method": method,
             "scenario_name": self.meta.name,
         }
+        if targets_request(ctx, path_prefix, method):
+            endpoint = path_prefix or "*"
+            effect[METRIC_EVENTS_KEY] = (
+                counter_event(
+                    "http_latency_injections_total", scenario=self.meta.name, endpoint=endpoint
+                ),
+                histogram_event(
+                    "http_injected_latency_seconds",
+                    delay_ms / 1000.0,
+                    scenario=self.meta.name,
+                    endpoint=endpoint,
+                ),
+            )
+        return effect
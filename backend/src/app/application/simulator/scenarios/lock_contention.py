@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from app.application.simulator.events import METRIC_EVENTS_KEY, counter_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
+from app.application.simulator.scenarios import scenario_target
 
 
 @dataclass(frozen=True)
@@ -43,14 +46,18 @@ class LockContention:
     def is_applicable(self, *, target: dict[str, str]) -> bool:
         return target.get("category") == "db"
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
         """Returns effect dict - NO side effects here"""
-        row_id = parameters["row_id"]
-        update_count = parameters["update_count"]
-        return {
+        update_count = parameters.get_int("update_count")
+        effect: dict[str, object] = {
             "db_lock_contention": True,
-            "db_target_row_id": int(row_id) if isinstance(row_id, (int, str)) else 0,
-            "db_concurrent_updates": (
-                int(update_count) if isinstance(update_count, (int, str)) else 0
-            ),
+            "db_target_row_id": parameters.get_int("row_id"),
+            "db_concurrent_updates": update_count,
         }
+        # Concurrent updates of one row: all take the lock, all but one wait on it
+        if scenario_target(ctx).get("operation") == "update":
+            effect[METRIC_EVENTS_KEY] = (
+                counter_event("db_lock_attempts_total", update_count, scenario=self.meta.name),
+                counter_event("db_lock_conflicts_total", update_count - 1, scenario=self.meta.name),
+            )
+        return effect
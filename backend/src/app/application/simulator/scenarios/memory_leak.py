@@ -5,7 +5,9 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
+from app.application.simulator.events import METRIC_EVENTS_KEY, counter_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
 
 
 @dataclass(frozen=True)
@@ -37,15 +39,9 @@ class MemoryLeak:
         safety_limits={"max_leak_size_kb": 10240},
         metrics=[
             MetricSpec(
-                name="memory_leaked_bytes",
-                type="gauge",
-                description="Total memory leaked (bytes) by scenario",
-                labels=["scenario"],
-            ),
-            MetricSpec(
-                name="memory_leak_rate_bytes_per_sec",
-                type="gauge",
-                description="Memory leak rate (bytes/sec) by scenario",
+                name="memory_leaked_bytes_total",
+                type="counter",
+                description="Total memory leaked (bytes) by scenario; rate() is the leak rate",
                 labels=["scenario"],
             ),
         ],
@@ -54,10 +50,17 @@ class MemoryLeak:
     def is_applicable(self, *, target: dict[str, str]) -> bool:
         return target.get("category") in ("http", "db")
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
-        leak_probability = float(str(parameters["leak_probability"]))
-        leak_size_kb = int(str(parameters.get("leak_size_kb", 1024)))
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
+        leak_probability = parameters.get_float("leak_probability")
+        leak_size_kb = parameters.get_int("leak_size_kb", 1024)
         should_leak = random.random() < leak_probability
         if should_leak:
-            return {"memory_leak_kb": leak_size_kb}
+            return {
+                "memory_leak_kb": leak_size_kb,
+                METRIC_EVENTS_KEY: (
+                    counter_event(
+                        "memory_leaked_bytes_total", leak_size_kb * 1024, scenario=self.meta.name
+                    ),
+                ),
+            }
         return {}
@@ -5,7 +5,9 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
+from app.application.simulator.events import METRIC_EVENTS_KEY, counter_event, gauge_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
 
 
 @dataclass(frozen=True)
@@ -43,8 +45,9 @@ class NetworkPartition:
             MetricSpec(
                 name="network_partition_active",
                 type="gauge",
-                description="Network partition active (1=active, 0=inactive)",
+                description="Whether the last evaluated request was partitioned (1/0)",
                 labels=["scenario"],
+                multiprocess_mode="livemax",
             ),
             MetricSpec(
                 name="network_requests_dropped_total",
@@ -58,14 +61,21 @@ class NetworkPartition:
     def is_applicable(self, *, target: dict[str, str]) -> bool:
         return target.get("category") in ("http", "db")
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
-        partition_probability = float(str(parameters["partition_probability"]))
-        delay_ms = int(str(parameters.get("delay_ms", 1000)))
-        drop = bool(parameters.get("drop", False))
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
+        partition_probability = parameters.get_float("partition_probability")
+        delay_ms = parameters.get_int("delay_ms", 1000)
+        drop = parameters.get_bool("drop")
         should_partition = random.random() < partition_probability
+        active = gauge_event(
+            "network_partition_active", float(should_partition), scenario=self.meta.name
+        )
         if should_partition:
             effect: dict[str, object] = {"network_partition": True, "delay_ms": delay_ms}
             if drop:
                 effect["drop_request"] = True
+                dropped = counter_event("network_requests_dropped_total", scenario=self.meta.name)
+                effect[METRIC_EVENTS_KEY] = (active, dropped)
+            else:
+                effect[METRIC_EVENTS_KEY] = (active,)
             return effect
-        return {}
+        return {METRIC_EVENTS_KEY: (active,)}
@@ -5,7 +5,8 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
-from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.models import ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
 
 
 @dataclass(frozen=True)
@@ -35,29 +36,14 @@ class ResourceStarvation:
             "required": ["starvation_probability"],
         },
         safety_limits={"max_workers": 100},
-        metrics=[
-            MetricSpec(
-                name="resource_queue_depth",
-                type="gauge",
-                description="Resource queue depth by scenario",
-                labels=["scenario"],
-            ),
-            MetricSpec(
-                name="resource_wait_seconds",
-                type="histogram",
-                description="Resource wait time (seconds)",
-                labels=["scenario"],
-                buckets=[0.01, 0.05, 0.1, 0.5, 1, 5, 10],
-            ),
-        ],
     )
 
     def is_applicable(self, *, target: dict[str, str]) -> bool:
         return target.get("category") in ("http", "database")
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
-        starvation_probability = float(str(parameters["starvation_probability"]))
-        max_workers = int(str(parameters.get("max_workers", 10)))
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
+        starvation_probability = parameters.get_float("starvation_probability")
+        max_workers = parameters.get_int("max_workers", 10)
         should_starve = random.random() < starvation_probability
         if should_starve:
             return {"resource_starvation": True, "max_workers": max_workers}
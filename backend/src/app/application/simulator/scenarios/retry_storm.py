@@ -5,7 +5,10 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
+from app.application.simulator.events import METRIC_EVENTS_KEY, counter_event, histogram_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
+from app.application.simulator.scenarios import targets_request
 
 
 @dataclass(frozen=True)
@@ -62,22 +65,28 @@ class RetryStorm:
     def is_applicable(self, *, target: dict[str, str]) -> bool:
         return target.get("category") == "http"
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
         """Returns effect dict simulating retry storm behavior"""
-        failure_rate = float(str(parameters["failure_rate"]))
-        retry_multiplier = float(str(parameters.get("retry_multiplier", 2.0)))
-        status_code = int(str(parameters.get("status_code", 503)))
-        path_prefix = str(parameters.get("path_prefix", ""))
+        failure_rate = parameters.get_float("failure_rate")
+        retry_multiplier = parameters.get_float("retry_multiplier", 2.0)
+        status_code = parameters.get_int("status_code", 503)
+        path_prefix = parameters.get_str("path_prefix")
 
         # Simulate whether this request should fail and trigger retries
         should_fail = random.random() < failure_rate
 
-        if should_fail:
-            return {
-                "retry_storm_active": True,
-                "http_status": status_code,
-                "http_path_prefix": path_prefix,
-                "retry_multiplier": retry_multiplier,
-            }
-
-        return {}
+        if not should_fail:
+            return {}
+        effect: dict[str, object] = {
+            "retry_storm_active": True,
+            "http_status": status_code,
+            "http_path_prefix": path_prefix,
+            "retry_multiplier": retry_multiplier,
+        }
+        if targets_request(ctx, path_prefix):
+            # Each failed request is retried `retry_multiplier` times by its clients
+            effect[METRIC_EVENTS_KEY] = (
+                counter_event("retry_attempts_total", retry_multiplier, scenario=self.meta.name),
+                histogram_event("retry_depth", retry_multiplier, scenario=self.meta.name),
+            )
+        return effect
@@ -5,7 +5,9 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
+from app.application.simulator.events import METRIC_EVENTS_KEY, counter_event, histogram_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
 
 
 @dataclass(frozen=True)
@@ -45,14 +47,16 @@ class SlowDbQuery:
     def is_applicable(self, *, target: dict[str, str]) -> bool:
         return target.get("category") == "db"
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
         """Returns effect dict - NO side effects here"""
-        prob = parameters.get("probability", 1.0)
-        p = float(prob) if isinstance(prob, (int, float, str)) else 1.0
-        if random.random() > p:
+        if random.random() > parameters.get_float("probability", 1.0):
             return {}
 
-        seconds = parameters["seconds"]
+        seconds = parameters.get_float("seconds", 0.01)
         return {
-            "db_sleep_seconds": float(seconds) if isinstance(seconds, (int, float, str)) else 0.01,
+            "db_sleep_seconds": seconds,
+            METRIC_EVENTS_KEY: (
+                counter_event("db_slow_query_injections_total", scenario=self.meta.name),
+                histogram_event("db_query_duration_seconds", seconds, scenario=self.meta.name),
+            ),
         }
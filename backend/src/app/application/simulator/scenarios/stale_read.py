@@ -5,9 +5,9 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
-from prometheus_client import Counter
-
+from app.application.simulator.events import METRIC_EVENTS_KEY, counter_event
 from app.application.simulator.models import MetricSpec, ScenarioMeta
+from app.application.simulator.parameters import ScenarioParameters
 
 
 @dataclass(frozen=True)
@@ -25,8 +25,16 @@ class StaleRead:
         ),
         targets=["http"],
         parameter_schema={
-            "stale_probability": {"type": "number", "minimum": 0, "maximum": 1, "default": 0.1},
-            "cache_key_pattern": {"type": "string", "default": "*"},
+            "type": "object",
+            "properties": {
+                "stale_probability": {
+                    "type": "number",
+                    "minimum": 0,
+                    "maximum": 1,
+                    "default": 0.1,
+                },
+                "cache_key_pattern": {"type": "string", "default": "*"},
+            },
         },
         safety_limits={
             "max_stale_probability": 0.9,
@@ -48,22 +56,15 @@ class StaleRead:
         ],
     )
 
-    def apply(self, *, ctx: dict[str, object], parameters: dict[str, object]) -> dict[str, object]:
-        """Returns effect dict simulating stale/fresh read and increments scenario metrics"""
-        stale_probability = float(str(parameters["stale_probability"]))
-        cache_key_pattern = str(parameters.get("cache_key_pattern", "*"))
+    def apply(self, *, ctx: dict[str, object], parameters: ScenarioParameters) -> dict[str, object]:
+        """Returns effect dict simulating stale/fresh read, with its metric event"""
+        stale_probability = parameters.get_float("stale_probability", 0.1)
+        cache_key_pattern = parameters.get_str("cache_key_pattern", "*")
         is_stale = random.random() < stale_probability
 
-        metrics = ctx.get("metrics")
-        if metrics:
-            metrics_dict: dict[str, Counter] = metrics  # type: ignore
-            if is_stale:
-                metrics_dict["stale_read_total"].labels(
-                    scenario="stale-read", cache_key_pattern=cache_key_pattern
-                ).inc()
-            else:
-                metrics_dict["fresh_read_total"].labels(
-                    scenario="stale-read", cache_key_pattern=cache_key_pattern
-                ).inc()
-
-        return {"is_stale": is_stale}
+        event = counter_event(
+            "stale_read_total" if is_stale else "fresh_read_total",
+            scenario="stale-read",
+            cache_key_pattern=cache_key_pattern,
+        )
+        return {"is_stale": is_stale, METRIC_EVENTS_KEY: (event,)}
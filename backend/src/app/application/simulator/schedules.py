@@ -0,0 +1,217 @@
+"""Parameter Schedules - Time-varying scenario parameters
+
+Any numeric scenario parameter may be given as a schedule object instead of a
+constant. The value is a function of the time since the scenario was enabled:
+
+- {"schedule": "ramp", "from": 10, "to": 1000, "duration_seconds": 60}
+  Linear ramp, holds "to" once the duration has elapsed.
+- {"schedule": "steps", "from": 10, "step": 100, "interval_seconds": 10, "to": 1000}
+  Staircase: adds "step" every interval, optionally capped at "to".
+- {"schedule": "square", "low": 0, "high": 500, "period_seconds": 20, "duty_cycle": 0.5}
+  Starts at "high" for duty_cycle * period, then "low" for the rest.
+- {"schedule": "sine", "low": 0, "high": 500, "period_seconds": 30}
+  Oscillates between low and high, starting at the midpoint.
+
+Schedules are resolved at most once per tick (100 ms by default), so the
+request hot path only pays for a clock read and an integer comparison.
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.application.simulator.parameters import ParameterValidator, ScenarioParameters
+from app.domain.types import Parameters, ParameterValue
+
+DEFAULT_TICK_SECONDS = 0.1
+
+
+class ParameterSchedule(ABC):
+    """A numeric parameter expressed as a function of elapsed time"""
+
+    # Integer endpoints produce integer values (e.g. "ms", "duration_ms")
+    integral: bool
+
+    @abstractmethod
+    def value_at(self, elapsed_seconds: float) -> float:
+        """Value after elapsed_seconds since the scenario was enabled"""
+        raise NotImplementedError
+
+    def resolve(self, elapsed_seconds: float) -> int | float:
+        value = self.value_at(max(0.0, elapsed_seconds))
+        return round(value) if self.integral else value
+
+
+@dataclass(frozen=True)
+class Ramp(ParameterSchedule):
+    start: float
+    end: float
+    duration_seconds: float
+    integral: bool = False
+
+    def value_at(self, elapsed_seconds: float) -> float:
+        fraction = min(1.0, elapsed_seconds / self.duration_seconds)
+        return self.start + (self.end - self.start) * fraction
+
+
+@dataclass(frozen=True)
+class Steps(ParameterSchedule):
+    start: float
+    step: float
+    interval_seconds: float
+    end: float | None = None
+    integral: bool = False
+
+    def value_at(self, elapsed_seconds: float) -> float:
+        value = self.start + self.step * math.floor(elapsed_seconds / self.interval_seconds)
+        if self.end is None:
+            return value
+        return min(value, self.end) if self.step >= 0 else max(value, self.end)
+
+
+@dataclass(frozen=True)
+class SquareWave(ParameterSchedule):
+    low: float
+    high: float
+    period_seconds: float
+    duty_cycle: float = 0.5
+    integral: bool = False
+
+    def value_at(self, elapsed_seconds: float) -> float:
+        phase = (elapsed_seconds % self.period_seconds) / self.period_seconds
+        return self.high if phase < self.duty_cycle else self.low
+
+
+@dataclass(frozen=True)
+class SineWave(ParameterSchedule):
+    low: float
+    high: float
+    period_seconds: float
+    integral: bool = False
+
+    def value_at(self, elapsed_seconds: float) -> float:
+        midpoint = (self.low + self.high) / 2
+        amplitude = (self.high - self.low) / 2
+        return midpoint + amplitude * math.sin(2 * math.pi * elapsed_seconds / self.period_seconds)
+
+
+def parse_schedule(value: ParameterValue) -> ParameterSchedule | None:
+    """
+    Parse a schedule object.
+
+    Returns None if the value is not a schedule (plain constant).
+    Raises ValueError if it is a schedule but malformed.
+    """
+    if not isinstance(value, dict) or "schedule" not in value:
+        return None
+
+    kind = value["schedule"]
+
+    def number(key: str, default: float | None = None) -> float:
+        raw = value.get(key, default)
+        if isinstance(raw, bool) or not isinstance(raw, (int, float)):
+            raise ValueError(f"'{kind}' schedule requires numeric '{key}'")
+        return float(raw)
+
+    def positive(key: str) -> float:
+        result = number(key)
+        if result <= 0:
+            raise ValueError(f"'{kind}' schedule requires '{key}' > 0")
+        return result
+
+    def integral(*keys: str) -> bool:
+        return all(isinstance(value.get(k), int) for k in keys if k in value)
+
+    if kind == "ramp":
+        return Ramp(
+            start=number("from"),
+            end=number("to"),
+            duration_seconds=positive("duration_seconds"),
+            integral=integral("from", "to"),
+        )
+    if kind == "steps":
+        return Steps(
+            start=number("from"),
+            step=number("step"),
+            interval_seconds=positive("interval_seconds"),
+            end=number("to") if "to" in value else None,
+            integral=integral("from", "step", "to"),
+        )
+    if kind == "square":
+        duty_cycle = number("duty_cycle", 0.5)
+        if not 0.0 <= duty_cycle <= 1.0:
+            raise ValueError("'square' schedule requires 0 <= 'duty_cycle' <= 1")
+        return SquareWave(
+            low=number("low"),
+            high=number("high"),
+            period_seconds=positive("period_seconds"),
+            duty_cycle=duty_cycle,
+            integral=integral("low", "high"),
+        )
+    if kind == "sine":
+        return SineWave(
+            low=number("low"),
+            high=number("high"),
+            period_seconds=positive("period_seconds"),
+            integral=integral("low", "high"),
+        )
+    raise ValueError(f"Unknown schedule '{kind}'")
+
+
+class ScheduledParameters:
+    """
+    Resolves a scenario's parameters at a point in its lifetime.
+
+    Parameters are validated once on construction. Constant parameters are
+    bound once; scheduled parameters are evaluated (and clamped) once per tick
+    and the resulting ScenarioParameters is reused by every request in that tick.
+    """
+
+    def __init__(
+        self,
+        parameters: Parameters,
+        *,
+        enabled_at: datetime,
+        validator: ParameterValidator | None = None,
+        tick_seconds: float = DEFAULT_TICK_SECONDS,
+    ) -> None:
+        self.enabled_at = enabled_at
+        # Validated and normalized form, suitable for storing
+        self.parameters = validator.validate(parameters) if validator else dict(parameters)
+        self._validator = validator
+        self._tick_seconds = tick_seconds
+        self._schedules: dict[str, ParameterSchedule] = {}
+        self._static: Parameters = {}
+        for key, value in self.parameters.items():
+            schedule = parse_schedule(value)
+            if schedule is None:
+                self._static[key] = value
+            else:
+                self._schedules[key] = schedule
+        self._tick = -1
+        self._resolved = ScenarioParameters(self._static)
+
+    @property
+    def is_dynamic(self) -> bool:
+        return bool(self._schedules)
+
+    def at(self, now: datetime) -> ScenarioParameters:
+        """Parameters in effect at `now`"""
+        if not self._schedules:
+            return self._resolved
+
+        elapsed = (now - self.enabled_at).total_seconds()
+        tick = max(0, int(elapsed / self._tick_seconds))
+        if tick != self._tick:
+            # Quantize so every request within a tick sees the same values
+            tick_start = tick * self._tick_seconds
+            resolved = dict(self._static)
+            for key, schedule in self._schedules.items():
+                value = schedule.resolve(tick_start)
+                resolved[key] = self._validator.clamp(key, value) if self._validator else value
+            self._resolved = ScenarioParameters(resolved)
+            self._tick = tick
+        return self._resolved
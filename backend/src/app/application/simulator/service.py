@@ -2,22 +2,34 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from app.application.ports.clock import Clock
 from app.application.ports.metrics import MetricsPort
 from app.application.ports.simulator_store import SimulatorStore
 from app.application.simulator.app_models import (
     ActiveScenarioApp,
+    BatchApplyRequestApp,
+    BatchOperationApp,
     DisableScenarioRequestApp,
     EnableScenarioRequestApp,
+    ProfileDescriptorApp,
+    ProfilesResponseApp,
     ScenarioDescriptorApp,
     ScenariosResponseApp,
     StatusResponseApp,
 )
-from app.application.simulator.exceptions import ScenarioNotFoundError
+from app.application.simulator.exceptions import (
+    InvalidParametersError,
+    ProfileNotFoundError,
+    ScenarioNotFoundError,
+)
 from app.application.simulator.models import ActiveScenarioState
+from app.application.simulator.parameters import ParameterValidator, ScenarioParameters
+from app.application.simulator.profiles import ScenarioProfile, build_profiles
 from app.application.simulator.registry import ScenarioRegistry
+from app.application.simulator.schedules import ScheduledParameters
+from app.domain.types import Parameters
 
 
 class SimulatorService:
@@ -34,11 +46,20 @@ class SimulatorService:
         clock: Clock,
         registry: ScenarioRegistry,
         metrics: MetricsPort | None = None,
+        profiles: dict[str, ScenarioProfile] | None = None,
     ) -> None:
         self._store = store
         self._clock = clock
         self._registry = registry
         self._metrics = metrics
+        self._profiles = build_profiles() if profiles is None else profiles
+        # Schemas are compiled once; parameters are validated once at enable time
+        self._validators = {
+            name: ParameterValidator.compile(s.meta.parameter_schema, s.meta.safety_limits)
+            for name, s in registry.scenarios.items()
+        }
+        # Resolved (possibly time-varying) parameters per active scenario
+        self._scheduled: dict[str, ScheduledParameters] = {}
 
     def list_scenarios(self) -> ScenariosResponseApp:
         """List all available scenarios"""
@@ -87,6 +108,7 @@ class SimulatorService:
 
         # Calculate expiry
         now = self._clock.now()
+        parameters = self._validate_parameters(req.name, req.parameters, now)
         expires_at = None
         if req.duration_seconds is not None:
             expires_at = now + timedelta(seconds=req.duration_seconds)
@@ -95,7 +117,7 @@ class SimulatorService:
         self._store.upsert(
             ActiveScenarioState(
                 name=scenario.meta.name,
-                parameters=dict(req.parameters),
+                parameters=parameters,
                 enabled_at=now,
                 expires_at=expires_at,
             )
@@ -113,6 +135,7 @@ class SimulatorService:
     def disable(self, req: DisableScenarioRequestApp) -> StatusResponseApp:
         """Disable a scenario"""
         self._store.remove(req.name)
+        self._scheduled.pop(req.name, None)
 
         # Emit metrics
         if self._metrics:
@@ -123,4 +146,111 @@ class SimulatorService:
     def reset(self) -> StatusResponseApp:
         """Disable all scenarios"""
         self._store.clear()
+        self._scheduled.clear()
+        return self.status()
+
+    def list_profiles(self) -> ProfilesResponseApp:
+        """List named scenario profiles"""
+        return ProfilesResponseApp(
+            profiles=[
+                ProfileDescriptorApp(
+                    name=p.name, description=p.description, operations=list(p.operations)
+                )
+                for p in sorted(self._profiles.values(), key=lambda x: x.name)
+            ]
+        )
+
+    def apply_batch(self, req: BatchApplyRequestApp) -> StatusResponseApp:
+        """
+        Apply a profile and/or a list of enable/disable operations atomically.
+
+        Everything is validated before anything is stored, then written to the
+        store as a single batch (one version bump). Order: reset, profile
+        operations, explicit operations - later operations win.
+        """
+        operations: list[BatchOperationApp] = []
+        if req.profile is not None:
+            profile = self._profiles.get(req.profile)
+            if profile is None:
+                raise ProfileNotFoundError(req.profile)
+            operations.extend(profile.operations)
+        operations.extend(req.operations)
+
+        now = self._clock.now()
+        validated: list[Parameters] = []
+        for op in operations:
+            if op.name not in self._registry.scenarios:
+                raise ScenarioNotFoundError(op.name)
+            validated.append(
+                self._validate_parameters(op.name, op.parameters, now) if op.op == "enable" else {}
+            )
+
+        upserts: dict[str, ActiveScenarioState] = {}
+        removals: list[str] = []
+        for op, parameters in zip(operations, validated, strict=True):
+            if op.op == "enable":
+                expires_at = None
+                if op.duration_seconds is not None:
+                    expires_at = now + timedelta(seconds=op.duration_seconds)
+                upserts[op.name] = ActiveScenarioState(
+                    name=op.name,
+                    parameters=parameters,
+                    enabled_at=now,
+                    expires_at=expires_at,
+                )
+            else:
+                upserts.pop(op.name, None)
+                removals.append(op.name)
+
+        # Scenarios the reset clears are disabled too, unless re-enabled below
+        disabled = dict.fromkeys([s.name for s in self._store.list_active()] if req.reset else [])
+        disabled.update(dict.fromkeys(removals))
+        self._store.apply_batch(upserts=list(upserts.values()), removals=removals, clear=req.reset)
+        # As in disable() / reset(): drop cached schedules of removed scenarios
+        if req.reset:
+            self._scheduled.clear()
+        for name in removals:
+            self._scheduled.pop(name, None)
+
+        # Emit metrics
+        if self._metrics:
+            for name in disabled:
+                if name not in upserts:
+                    self._metrics.set_gauge(
+                        "simulator_scenarios_enabled", 0.0, {"scenario_name": name}
+                    )
+            for name in upserts:
+                self._metrics.increment_counter(
+                    "simulator_scenarios_active", {"scenario_name": name}
+                )
+                self._metrics.set_gauge("simulator_scenarios_enabled", 1.0, {"scenario_name": name})
+
         return self.status()
+
+    def effective_parameters(self, active: ActiveScenarioApp) -> ScenarioParameters:
+        """
+        Typed parameters in effect right now for an active scenario.
+
+        Parameters are bound once per activation; schedules (ramps, steps,
+        waves) are evaluated against the time since `enabled_at` and cached
+        per tick, so this is cheap on the hot path.
+        """
+        scheduled = self._scheduled.get(active.name)
+        if scheduled is None or scheduled.enabled_at != active.enabled_at:
+            scheduled = ScheduledParameters(
+                active.parameters,
+                enabled_at=active.enabled_at,
+                validator=self._validators.get(active.name),
+            )
+            self._scheduled[active.name] = scheduled
+        return scheduled.at(self._clock.now())
+
+    def _validate_parameters(self, name: str, parameters: Parameters, now: datetime) -> Parameters:
+        """Validate, coerce and clamp parameters; returns the form to store"""
+        try:
+            scheduled = ScheduledParameters(
+                parameters, enabled_at=now, validator=self._validators.get(name)
+            )
+        except ValueError as e:
+            raise InvalidParametersError(name, str(e)) from e
+        return scheduled.parameters
@@ -0,0 +1,86 @@
+"""Commerce API Contracts (sample workload)"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class CustomerResponse(BaseModel):
+    """A customer"""
+
+    id: int
+    email: str
+    name: str
+    created_at: datetime
+
+
+class CustomersResponse(BaseModel):
+    """Response for listing customers"""
+
+    customers: list[CustomerResponse]
+
+
+class RegisterCustomerRequest(BaseModel):
+    """Request to register a customer"""
+
+    email: str = Field(min_length=3, max_length=254, pattern=r"^[^@\s]+@[^@\s]+$")
+    name: str = Field(min_length=1, max_length=200)
+
+
+class ProductResponse(BaseModel):
+    """A product in the catalog"""
+
+    id: int
+    sku: str
+    name: str
+    category: str
+    price_cents: int
+    stock: int
+
+
+class ProductsResponse(BaseModel):
+    """Response for listing or searching products"""
+
+    products: list[ProductResponse]
+
+
+class OrderLineRequest(BaseModel):
+    """One product and quantity of an order request"""
+
+    product_id: int
+    quantity: int = Field(ge=1, le=1000)
+
+
+class PlaceOrderRequest(BaseModel):
+    """Request to place an order"""
+
+    customer_id: int
+    lines: list[OrderLineRequest] = Field(min_length=1, max_length=50)
+
+
+class OrderLineResponse(BaseModel):
+    """One line of an order, priced when the order was placed"""
+
+    product_id: int
+    quantity: int
+    unit_price_cents: int
+    total_cents: int
+
+
+class OrderResponse(BaseModel):
+    """An order with its lines"""
+
+    id: int
+    customer_id: int
+    status: str
+    created_at: datetime
+    total_cents: int
+    lines: list[OrderLineResponse]
+
+
+class OrdersResponse(BaseModel):
+    """Response for listing orders"""
+
+    orders: list[OrderResponse]
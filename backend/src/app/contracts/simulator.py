@@ -66,3 +66,91 @@ class DisableScenarioRequest(BaseModel):
     """Request to disable a scenario"""
 
     name: str
+
+
+class BatchOperation(BaseModel):
+    """A single enable/disable operation within a batch"""
+
+    op: Literal["enable", "disable"]
+    name: str
+    parameters: Parameters = Field(default_factory=dict)
+    duration_seconds: int | None = Field(default=None, ge=1, le=3600)
+
+
+class BatchApplyRequest(BaseModel):
+    """Request to apply a profile and/or several operations atomically"""
+
+    profile: str | None = None
+    reset: bool = False
+    operations: list[BatchOperation] = Field(default_factory=list, max_length=100)
+
+
+class ProfileDescriptor(BaseModel):
+    """Describes a named multi-scenario profile"""
+
+    name: str
+    description: str
+    operations: list[BatchOperation]
+
+
+class ProfilesResponse(BaseModel):
+    """Response for listing profiles"""
+
+    profiles: list[ProfileDescriptor]
+
+
+class LatencySeries(BaseModel):
+    """Latency percentiles for one route/scenario series, in milliseconds"""
+
+    route: str
+    scenario: str
+    count: int
+    min_ms: float
+    max_ms: float
+    mean_ms: float
+    # Keyed "p50", "p99.9", ...
+    percentiles_ms: dict[str, float]
+
+
+class LatencyResponse(BaseModel):
+    """Latency histograms for the current (or just closed) recording window"""
+
+    window_started_at: datetime
+    window_seconds: float
+    series: list[LatencySeries]
+    # All selected series merged; None when nothing was recorded
+    merged: LatencySeries | None = None
+
+
+class ImpactSegment(BaseModel):
+    """Rolling-window stats for requests served under one active-scenario set"""
+
+    scenarios: list[str]
+    requests: int
+    errors: int
+    error_rate: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    window_seconds: float
+
+
+class ScenarioImpactReport(BaseModel):
+    """A scenario's impact: the active set vs the same set without it (after - before)"""
+
+    scenario: str
+    before: ImpactSegment | None = None
+    after: ImpactSegment | None = None
+    p95_delta_ms: float | None = None
+    p99_delta_ms: float | None = None
+    error_rate_delta: float | None = None
+    throughput_delta_rps: float | None = None
+
+
+class ImpactResponse(BaseModel):
+    """Impact of every active scenario, plus all tracked segments"""
+
+    active: list[str]
+    impacts: list[ScenarioImpactReport]
+    segments: list[ImpactSegment]
@@ -0,0 +1,53 @@
+"""Commerce domain - the sample workload that scenarios act on
+
+A deliberately small shop: customers place orders for products. Prices are
+integer cents, so totals are exact on every database.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class Customer:
+    id: int
+    email: str
+    name: str
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class Product:
+    id: int
+    sku: str
+    name: str
+    category: str
+    price_cents: int
+    stock: int
+
+
+@dataclass(frozen=True)
+class OrderLine:
+    product_id: int
+    quantity: int
+    # Price at the time the order was placed
+    unit_price_cents: int
+
+    @property
+    def total_cents(self) -> int:
+        return self.quantity * self.unit_price_cents
+
+
+@dataclass(frozen=True)
+class Order:
+    id: int
+    customer_id: int
+    status: str
+    created_at: datetime
+    lines: tuple[OrderLine, ...]
+
+    @property
+    def total_cents(self) -> int:
+        return sum(line.total_cents for line in self.lines)
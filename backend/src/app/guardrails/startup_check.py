@@ -0,0 +1,121 @@
+"""Startup Budget Check - Reports import time per module and fails on boot regressions"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+# Importing the composition root builds the app, so this is the worker boot cost
+TARGET_MODULE = "app.api.main"
+# Generous for CI runners; raise deliberately, not to paper over a regression
+DEFAULT_BUDGET_MS = 1500.0
+RUNS = 3
+TOP_N = 15
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """One `-X importtime` line"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse `python -X importtime` stderr, ignoring unrelated lines"""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            timings.append(
+                ImportTiming(
+                    module=name.strip(),
+                    self_us=int(self_us),
+                    cumulative_us=int(cumulative_us),
+                    depth=(len(name) - len(name.lstrip())) // 2,
+                )
+            )
+        except ValueError:
+            continue
+    return timings
+
+
+def profile_imports(module: str = TARGET_MODULE) -> list[ImportTiming]:
+    """Import `module` in a fresh interpreter and return its import timings"""
+    src_path = str(Path(__file__).parent.parent.parent)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_path, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def boot_time_ms(timings: list[ImportTiming], module: str = TARGET_MODULE) -> float:
+    """Cumulative import time of `module`"""
+    for timing in timings:
+        if timing.module == module:
+            return timing.cumulative_us / 1000
+    raise ValueError(f"{module} not found in import timings")
+
+
+def package_totals(timings: list[ImportTiming]) -> dict[str, float]:
+    """Self time (ms) per top-level package, largest first"""
+    totals: dict[str, float] = {}
+    for timing in timings:
+        package = timing.module.split(".")[0]
+        totals[package] = totals.get(package, 0.0) + timing.self_us / 1000
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def print_report(timings: list[ImportTiming], budget_ms: float) -> None:
+    """Print boot time, the heaviest packages and direct imports"""
+    total = boot_time_ms(timings)
+    print(f"{TARGET_MODULE} import: {total:.0f} ms (budget {budget_ms:.0f} ms)\n")
+
+    print(f"  {'package':<40} {'self ms':>10}")
+    for package, ms in list(package_totals(timings).items())[:TOP_N]:
+        print(f"  {package:<40} {ms:>10.1f}")
+
+    direct = sorted(
+        (t for t in timings if t.depth == 1), key=lambda t: t.cumulative_us, reverse=True
+    )
+    print(f"\n  {'imported by ' + TARGET_MODULE:<64} {'cumulative ms':>14}")
+    for timing in direct[:TOP_N]:
+        print(f"  {timing.module:<64} {timing.cumulative_us / 1000:>14.1f}")
+    print()
+
+
+def main() -> int:
+    """Entry point"""
+    budget_ms = float(os.getenv("STARTUP_BUDGET_MS", str(DEFAULT_BUDGET_MS)))
+
+    try:
+        # Best of several runs: the minimum is the least noisy estimate
+        runs = [profile_imports() for _ in range(RUNS)]
+        best = min(runs, key=boot_time_ms)
+    except (subprocess.CalledProcessError, ValueError) as e:
+        print(f"✗ Could not profile startup: {e}")
+        return 1
+
+    print_report(best, budget_ms)
+    if boot_time_ms(best) > budget_ms:
+        print("✗ Startup time exceeds budget (STARTUP_BUDGET_MS)")
+        return 1
+    print("✓ Startup time within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Commerce infrastructure"""
@@ -0,0 +1,79 @@
+"""Commerce schema - SQLAlchemy ORM mappings for the sample shop
+
+Types are portable, so the same schema runs on Postgres and SQLite.
+Indexes cover the lookups the repositories make: email and SKU (unique),
+product category, a customer's orders and an order's lines.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Integer, String
+from sqlalchemy.ext.asyncio import AsyncAttrs, AsyncEngine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+
+class Base(AsyncAttrs, DeclarativeBase):
+    pass
+
+
+class CustomerRow(Base):
+    __tablename__ = "customers"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    email: Mapped[str] = mapped_column(String(254), unique=True)
+    name: Mapped[str] = mapped_column(String(200))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+    orders: Mapped[list[OrderRow]] = relationship(back_populates="customer", lazy="raise")
+
+
+class ProductRow(Base):
+    __tablename__ = "products"
+    __table_args__ = (
+        CheckConstraint("price_cents >= 0", name="ck_products_price"),
+        CheckConstraint("stock >= 0", name="ck_products_stock"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    sku: Mapped[str] = mapped_column(String(64), unique=True)
+    name: Mapped[str] = mapped_column(String(200))
+    category: Mapped[str] = mapped_column(String(100), index=True)
+    price_cents: Mapped[int] = mapped_column(Integer)
+    stock: Mapped[int] = mapped_column(Integer)
+
+
+class OrderRow(Base):
+    __tablename__ = "orders"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    customer_id: Mapped[int] = mapped_column(ForeignKey("customers.id"), index=True)
+    status: Mapped[str] = mapped_column(String(32))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+    customer: Mapped[CustomerRow] = relationship(back_populates="orders", lazy="raise")
+    # Loaded explicitly per query; an implicit lazy load is an error under asyncio
+    lines: Mapped[list[OrderLineRow]] = relationship(
+        back_populates="order", order_by="OrderLineRow.id", lazy="raise"
+    )
+
+
+class OrderLineRow(Base):
+    __tablename__ = "order_lines"
+    __table_args__ = (CheckConstraint("quantity > 0", name="ck_order_lines_quantity"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    order_id: Mapped[int] = mapped_column(ForeignKey("orders.id"), index=True)
+    product_id: Mapped[int] = mapped_column(ForeignKey("products.id"))
+    quantity: Mapped[int] = mapped_column(Integer)
+    unit_price_cents: Mapped[int] = mapped_column(Integer)
+
+    order: Mapped[OrderRow] = relationship(back_populates="lines", lazy="raise")
+    product: Mapped[ProductRow] = relationship(lazy="raise")
+
+
+async def create_schema(engine: AsyncEngine) -> None:
+    """Create the commerce tables that don't exist yet"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
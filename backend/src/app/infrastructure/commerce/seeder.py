@@ -0,0 +1,305 @@
+"""Bulk seeder - fills the commerce schema with large, skewed, reproducible data
+
+Rows are generated a batch at a time from a RNG seeded with (seed, table,
+batch index), so a batch's content doesn't depend on which worker made it
+or in which order: the same SeedConfig always produces the same database.
+
+- Product popularity follows a Zipf-like law (`product_skew`, 0 = uniform):
+  rank r is drawn with weight 1/r^s by inverting the continuous CDF (O(1)
+  per draw, no weight table), then ranks are scattered over product IDs so
+  the hot products aren't simply the lowest IDs. `customer_skew` does the
+  same for who places orders.
+- Prices and stock are pure functions of the product ID, so order lines
+  are priced without looking products up.
+- Loading uses COPY on Postgres and batched executemany elsewhere (SQLite).
+  Up to `workers` batches load concurrently on their own connections;
+  SQLite allows one writer, so it loads with a single worker.
+
+Seeding replaces the commerce tables (drop and create) - it is meant for an
+empty lab database, not for data worth keeping.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Table, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.infrastructure.commerce.orm import Base
+
+# (table, rows loaded so far, total rows of the table)
+ProgressCallback = Callable[[str, int, int], None]
+
+_Row = tuple[Any, ...]
+# Rows of one or more tables that load in one transaction: (table, columns, rows)
+_Batch = list[tuple[str, Sequence[str], list[_Row]]]
+
+CATEGORIES = (
+    "books", "games", "music", "toys", "garden", "kitchen", "tools", "sports",
+    "outdoors", "automotive", "beauty", "health", "office", "pets", "baby", "shoes",
+    "clothing", "jewelry", "peripherals", "displays",
+)  # fmt: skip
+_ADJECTIVES = ("Classic", "Compact", "Deluxe", "Eco", "Pro", "Smart", "Ultra", "Wireless")
+_NOUNS = ("Adapter", "Bottle", "Cable", "Chair", "Kit", "Lamp", "Speaker", "Stand", "Watch")
+_FIRST_NAMES = ("Ada", "Alan", "Barbara", "Dennis", "Edsger", "Grace", "Ken", "Linus", "Margaret")
+_LAST_NAMES = ("Hopper", "Knuth", "Liskov", "Lovelace", "Ritchie", "Shannon", "Turing", "Wirth")
+
+_CUSTOMER_COLUMNS = ("id", "email", "name", "created_at")
+_PRODUCT_COLUMNS = ("id", "sku", "name", "category", "price_cents", "stock")
+_ORDER_COLUMNS = ("id", "customer_id", "status", "created_at")
+# Line IDs come from the table's own sequence
+_LINE_COLUMNS = ("order_id", "product_id", "quantity", "unit_price_cents")
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    customers: int = 10_000
+    products: int = 1_000
+    orders: int = 50_000
+    max_lines_per_order: int = 5
+    # Zipf exponent of product popularity / customer activity; 0 is uniform
+    product_skew: float = 1.1
+    customer_skew: float = 0.0
+    batch_size: int = 5_000
+    workers: int = 4
+    seed: int = 42
+    # Orders are spread over `days` days from `start`
+    start: datetime = datetime(2025, 1, 1, tzinfo=UTC)
+    days: int = 365
+
+    def __post_init__(self) -> None:
+        if min(self.customers, self.products) < 1 or self.orders < 0:
+            raise ValueError("need at least one customer and one product")
+        if self.max_lines_per_order < 1 or self.batch_size < 1 or self.workers < 1:
+            raise ValueError("max_lines_per_order, batch_size and workers must be positive")
+        if self.product_skew < 0 or self.customer_skew < 0:
+            raise ValueError("skew must not be negative")
+        if self.days < 1:
+            raise ValueError("days must be positive")
+
+
+class ZipfSampler:
+    """Draws IDs 1..n, rank r with probability roughly proportional to 1/r^s"""
+
+    def __init__(self, n: int, s: float, seed: int) -> None:
+        self._n = n
+        self._s = s
+        self._log_n = math.log(n + 1)
+        self._scale = ((n + 1) ** (1 - s) - 1) if s != 1 else 0.0
+        # rank -> ID is a bijection (multiplier coprime to n) chosen by the seed
+        multiplier = random.Random(seed).randrange(1, max(2, n)) | 1
+        while math.gcd(multiplier, n) != 1:
+            multiplier += 2
+        self._multiplier = multiplier
+
+    def rank(self, u: float) -> int:
+        """Rank (1 = hottest) for a uniform draw u in [0, 1)"""
+        if self._s == 0:
+            x = 1 + u * self._n
+        elif self._s == 1:
+            x = math.exp(u * self._log_n)
+        else:
+            x = (1 + u * self._scale) ** (1 / (1 - self._s))
+        return min(int(x), self._n)
+
+    def id_of_rank(self, rank: int) -> int:
+        return (rank - 1) * self._multiplier % self._n + 1
+
+    def sample(self, rng: random.Random, k: int) -> list[int]:
+        rank, id_of_rank = self.rank, self.id_of_rank
+        return [id_of_rank(rank(u)) for u in [rng.random() for _ in range(k)]]
+
+
+def product_price_cents(product_id: int) -> int:
+    """Deterministic price in 1.99 .. 999.99"""
+    return 199 + (product_id * 2_654_435_761 % 2**32) % 99_801
+
+
+def product_stock(product_id: int) -> int:
+    """Deterministic stock, high enough for the lab's order traffic"""
+    return 10_000 + product_id * 40_503 % 5_000
+
+
+def _rng(config: SeedConfig, table: str, batch: int) -> random.Random:
+    # str seeds hash deterministically (unlike hash()), across processes too
+    return random.Random(f"{config.seed}:{table}:{batch}")
+
+
+def _batch_ids(total: int, batch_size: int, batch: int) -> range:
+    return range(batch * batch_size + 1, min(total, (batch + 1) * batch_size) + 1)
+
+
+def customer_rows(config: SeedConfig, batch: int) -> list[_Row]:
+    rng = _rng(config, "customers", batch)
+    ids = _batch_ids(config.customers, config.batch_size, batch)
+    first = rng.choices(_FIRST_NAMES, k=len(ids))
+    last = rng.choices(_LAST_NAMES, k=len(ids))
+    span = config.days * 86_400
+    return [
+        (
+            customer_id,
+            f"customer{customer_id}@example.com",
+            f"{first_name} {last_name}",
+            config.start - timedelta(seconds=rng.random() * span),
+        )
+        for customer_id, first_name, last_name in zip(ids, first, last, strict=True)
+    ]
+
+
+def product_rows(config: SeedConfig, batch: int) -> list[_Row]:
+    rng = _rng(config, "products", batch)
+    ids = _batch_ids(config.products, config.batch_size, batch)
+    adjectives = rng.choices(_ADJECTIVES, k=len(ids))
+    nouns = rng.choices(_NOUNS, k=len(ids))
+    categories = rng.choices(CATEGORIES, k=len(ids))
+    return [
+        (
+            product_id,
+            f"SKU-{product_id:08d}",
+            f"{adjective} {noun} {product_id}",
+            category,
+            product_price_cents(product_id),
+            product_stock(product_id),
+        )
+        for product_id, adjective, noun, category in zip(
+            ids, adjectives, nouns, categories, strict=True
+        )
+    ]
+
+
+def order_rows(
+    config: SeedConfig, batch: int, products: ZipfSampler, customers: ZipfSampler
+) -> tuple[list[_Row], list[_Row]]:
+    """Orders of one batch and their lines"""
+    rng = _rng(config, "orders", batch)
+    ids = _batch_ids(config.orders, config.batch_size, batch)
+    customer_ids = customers.sample(rng, len(ids))
+    line_counts = [rng.randint(1, config.max_lines_per_order) for _ in ids]
+    product_ids = products.sample(rng, sum(line_counts))
+    span = config.days * 86_400
+
+    orders: list[_Row] = []
+    lines: list[_Row] = []
+    position = 0
+    for order_id, customer_id, count in zip(ids, customer_ids, line_counts, strict=True):
+        created_at = config.start + timedelta(seconds=rng.random() * span)
+        orders.append((order_id, customer_id, "placed", created_at))
+        quantities: dict[int, int] = {}
+        for product_id in product_ids[position : position + count]:
+            quantities[product_id] = quantities.get(product_id, 0) + rng.randint(1, 3)
+        position += count
+        lines.extend(
+            (order_id, product_id, quantity, product_price_cents(product_id))
+            for product_id, quantity in quantities.items()
+        )
+    return orders, lines
+
+
+class _Loader:
+    """Writes batches with COPY (Postgres) or executemany, reporting progress"""
+
+    def __init__(self, engine: AsyncEngine, progress: ProgressCallback | None) -> None:
+        self._engine = engine
+        self._copy = engine.dialect.name == "postgresql" and engine.dialect.driver == "psycopg"
+        self._progress = progress
+        self.loaded: dict[str, int] = {}
+        self.totals: dict[str, int] = {}
+
+    async def write(self, batches: _Batch) -> None:
+        """Load several tables' rows in one transaction (e.g. orders with their lines)"""
+        async with self._engine.begin() as conn:
+            for table, columns, rows in batches:
+                if self._copy:
+                    await _copy_rows(conn, table, columns, rows)
+                else:
+                    await _insert_rows(conn, Base.metadata.tables[table], columns, rows)
+        for table, _, rows in batches:
+            self.loaded[table] = self.loaded.get(table, 0) + len(rows)
+            if self._progress is not None:
+                self._progress(table, self.loaded[table], self.totals.get(table, 0))
+
+
+async def _copy_rows(
+    conn: AsyncConnection, table: str, columns: Sequence[str], rows: list[_Row]
+) -> None:
+    raw = await conn.get_raw_connection()
+    # psycopg AsyncConnection under SQLAlchemy's adapter
+    driver = raw.driver_connection
+    assert driver is not None
+    async with driver.cursor() as cursor:
+        async with cursor.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+            for row in rows:
+                await copy.write_row(row)
+
+
+async def _insert_rows(
+    conn: AsyncConnection, table: Table, columns: Sequence[str], rows: list[_Row]
+) -> None:
+    if rows:
+        await conn.execute(table.insert(), [dict(zip(columns, row, strict=True)) for row in rows])
+
+
+async def seed(
+    engine: AsyncEngine, config: SeedConfig, progress: ProgressCallback | None = None
+) -> dict[str, int]:
+    """Recreate the commerce tables and load `config`'s data; returns rows per table"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    loader = _Loader(engine, progress)
+    workers = config.workers if engine.dialect.name != "sqlite" else 1
+    slots = asyncio.Semaphore(workers)
+    product_sampler = ZipfSampler(config.products, config.product_skew, config.seed)
+    customer_sampler = ZipfSampler(config.customers, config.customer_skew, config.seed + 1)
+
+    async def load(generate: Callable[[int], _Batch], batch: int) -> None:
+        async with slots:
+            # Generate off the loop, so other workers' I/O proceeds meanwhile
+            await loader.write(await asyncio.to_thread(generate, batch))
+
+    def batches(total: int) -> range:
+        return range(math.ceil(total / config.batch_size))
+
+    def customers_batch(batch: int) -> _Batch:
+        return [("customers", _CUSTOMER_COLUMNS, customer_rows(config, batch))]
+
+    def products_batch(batch: int) -> _Batch:
+        return [("products", _PRODUCT_COLUMNS, product_rows(config, batch))]
+
+    def orders_batch(batch: int) -> _Batch:
+        orders, lines = order_rows(config, batch, product_sampler, customer_sampler)
+        return [("orders", _ORDER_COLUMNS, orders), ("order_lines", _LINE_COLUMNS, lines)]
+
+    # Order lines have no total up front (reported as 0)
+    loader.totals = {
+        "customers": config.customers,
+        "products": config.products,
+        "orders": config.orders,
+    }
+
+    # Orders reference customers and products, so those load first
+    await asyncio.gather(
+        *(load(customers_batch, b) for b in batches(config.customers)),
+        *(load(products_batch, b) for b in batches(config.products)),
+    )
+    await asyncio.gather(*(load(orders_batch, b) for b in batches(config.orders)))
+
+    if engine.dialect.name == "postgresql":
+        # Explicit IDs bypass the serial sequences; move them past the data
+        async with engine.begin() as conn:
+            for table in ("customers", "products", "orders"):
+                await conn.execute(
+                    text(
+                        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                        f"(SELECT COALESCE(MAX(id), 0) + 1 FROM {table}), false)"
+                    )
+                )
+    return {table: loader.loaded.get(table, 0) for table in Base.metadata.tables}
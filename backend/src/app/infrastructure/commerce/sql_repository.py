@@ -0,0 +1,212 @@
+"""SQL-backed commerce repositories (Postgres or SQLite)"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import Select, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import joinedload, lazyload, selectinload
+
+from app.application.commerce.exceptions import (
+    CustomerNotFoundError,
+    DuplicateCustomerError,
+    InsufficientStockError,
+    ProductNotFoundError,
+)
+from app.application.ports.commerce import (
+    DEFAULT_LOADING,
+    CustomerRepository,
+    LoadStrategy,
+    OrderRepository,
+    ProductRepository,
+)
+from app.domain.commerce import Customer, Order, OrderLine, Product
+from app.infrastructure.commerce.orm import CustomerRow, OrderLineRow, OrderRow, ProductRow
+
+ORDER_PLACED = "placed"
+
+
+def _sessions(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    # Rows are mapped to domain objects after commit, so keep them loaded
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+class SqlCustomerRepository(CustomerRepository):
+    """SQLAlchemy implementation of CustomerRepository"""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._sessions = _sessions(engine)
+
+    async def get(self, customer_id: int) -> Customer | None:
+        async with self._sessions() as session:
+            row = await session.get(CustomerRow, customer_id)
+            return _customer(row) if row is not None else None
+
+    async def list_page(self, *, limit: int, offset: int) -> list[Customer]:
+        query = select(CustomerRow).order_by(CustomerRow.id).limit(limit).offset(offset)
+        async with self._sessions() as session:
+            return [_customer(row) for row in await session.scalars(query)]
+
+    async def add(self, *, email: str, name: str, created_at: datetime) -> Customer:
+        row = CustomerRow(email=email, name=name, created_at=created_at)
+        try:
+            async with self._sessions.begin() as session:
+                session.add(row)
+        except IntegrityError as e:
+            raise DuplicateCustomerError(email) from e
+        return _customer(row)
+
+
+class SqlProductRepository(ProductRepository):
+    """SQLAlchemy implementation of ProductRepository"""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._sessions = _sessions(engine)
+
+    async def get(self, product_id: int) -> Product | None:
+        async with self._sessions() as session:
+            row = await session.get(ProductRow, product_id)
+            return _product(row) if row is not None else None
+
+    async def list_page(self, *, category: str | None, limit: int, offset: int) -> list[Product]:
+        query = select(ProductRow).order_by(ProductRow.id).limit(limit).offset(offset)
+        if category is not None:
+            query = query.where(ProductRow.category == category)
+        async with self._sessions() as session:
+            return [_product(row) for row in await session.scalars(query)]
+
+    async def search(self, query: str, *, limit: int) -> list[Product]:
+        pattern = "%" + _escape_like(query) + "%"
+        statement = (
+            select(ProductRow)
+            .where(ProductRow.name.ilike(pattern, escape="\\"))
+            .order_by(ProductRow.id)
+            .limit(limit)
+        )
+        async with self._sessions() as session:
+            return [_product(row) for row in await session.scalars(statement)]
+
+
+class SqlOrderRepository(OrderRepository):
+    """SQLAlchemy implementation of OrderRepository"""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._sessions = _sessions(engine)
+
+    async def get(self, order_id: int, *, loading: LoadStrategy = DEFAULT_LOADING) -> Order | None:
+        query = select(OrderRow).where(OrderRow.id == order_id)
+        async with self._sessions() as session:
+            rows = await _load_orders(session, query, loading)
+            return _order(rows[0]) if rows else None
+
+    async def list_for_customer(
+        self, customer_id: int, *, limit: int, loading: LoadStrategy = DEFAULT_LOADING
+    ) -> list[Order]:
+        query = (
+            select(OrderRow)
+            .where(OrderRow.customer_id == customer_id)
+            .order_by(OrderRow.created_at.desc(), OrderRow.id.desc())
+            .limit(limit)
+        )
+        async with self._sessions() as session:
+            return [_order(row) for row in await _load_orders(session, query, loading)]
+
+    async def place(
+        self, *, customer_id: int, quantities: dict[int, int], created_at: datetime
+    ) -> Order:
+        async with self._sessions.begin() as session:
+            if await session.get(CustomerRow, customer_id) is None:
+                raise CustomerNotFoundError(customer_id)
+
+            lines: list[OrderLineRow] = []
+            # Reserve in product ID order, so concurrent orders lock rows in
+            # the same order and can't deadlock
+            for product_id, quantity in sorted(quantities.items()):
+                reserve = (
+                    update(ProductRow)
+                    .where(ProductRow.id == product_id, ProductRow.stock >= quantity)
+                    .values(stock=ProductRow.stock - quantity)
+                    .returning(ProductRow.price_cents)
+                    .execution_options(synchronize_session=False)
+                )
+                price = await session.scalar(reserve)
+                if price is None:
+                    # Raising rolls back the reservations already made
+                    available = await session.scalar(
+                        select(ProductRow.stock).where(ProductRow.id == product_id)
+                    )
+                    if available is None:
+                        raise ProductNotFoundError(product_id)
+                    raise InsufficientStockError(product_id, quantity, available)
+                lines.append(
+                    OrderLineRow(product_id=product_id, quantity=quantity, unit_price_cents=price)
+                )
+
+            row = OrderRow(
+                customer_id=customer_id, status=ORDER_PLACED, created_at=created_at, lines=lines
+            )
+            session.add(row)
+            await session.flush()
+            return _order(row)
+
+
+async def _load_orders(
+    session: AsyncSession, query: Select[tuple[OrderRow]], loading: LoadStrategy
+) -> list[OrderRow]:
+    """Rows of `query` with their lines loaded per the strategy"""
+    if loading == "joined":
+        query = query.options(joinedload(OrderRow.lines))
+    elif loading == "selectin":
+        query = query.options(selectinload(OrderRow.lines))
+    else:
+        query = query.options(lazyload(OrderRow.lines))
+    # unique(): a joined collection repeats the parent row once per line
+    rows = list((await session.scalars(query)).unique())
+    if loading == "lazy":
+        # One SELECT per order - the N+1 pattern, made explicit under asyncio
+        for row in rows:
+            await row.awaitable_attrs.lines
+    return rows
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite drops tzinfo; stored values are always UTC"""
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+def _customer(row: CustomerRow) -> Customer:
+    return Customer(id=row.id, email=row.email, name=row.name, created_at=_as_utc(row.created_at))
+
+
+def _product(row: ProductRow) -> Product:
+    return Product(
+        id=row.id,
+        sku=row.sku,
+        name=row.name,
+        category=row.category,
+        price_cents=row.price_cents,
+        stock=row.stock,
+    )
+
+
+def _order(row: OrderRow) -> Order:
+    return Order(
+        id=row.id,
+        customer_id=row.customer_id,
+        status=row.status,
+        created_at=_as_utc(row.created_at),
+        lines=tuple(
+            OrderLine(
+                product_id=line.product_id,
+                quantity=line.quantity,
+                unit_price_cents=line.unit_price_cents,
+            )
+            for line in row.lines
+        ),
+    )
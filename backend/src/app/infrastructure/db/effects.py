@@ -0,0 +1,266 @@
+"""DB effect injection - applies db-category scenario effects to real queries
+
+Scenarios targeting "db" are evaluated from SQLAlchemy engine events:
+
+- connection acquisition: `db_connection_exhausted` hands the connection
+  straight back to the pool, hangs for `db_hang_duration_ms` and fails like
+  an exhausted pool
+- before each statement: `db_sleep_seconds` / `db_query_delay_ms` delay the
+  query; `disk_full_error` fails writes (INSERT/UPDATE/DELETE) when the
+  request path matches `path_prefix`
+
+Delays sleep through `await_only(asyncio.sleep(...))`: under an AsyncEngine
+the event runs in SQLAlchemy's greenlet on the event loop, so the wait
+yields to other requests instead of blocking the loop.
+
+Effects apply only to statements issued while serving a request that the
+injection middleware bound with bind_db_scope(): background work (the SQL
+simulator store's writer and change feed) and /api/sim requests are never
+affected. Every statement is counted and timed per operation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, cast
+
+from sqlalchemy import exc
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+from app.application.ports.metrics import MetricsPort
+from app.application.simulator.events import METRIC_EVENTS_KEY, MetricEvent
+from app.application.simulator.registry import ScenarioRegistry
+from app.application.simulator.service import SimulatorService
+from app.infrastructure.observability.effects import EffectRecorder
+from app.infrastructure.observability.metric_events import MetricEventBuffer
+
+logger = logging.getLogger(__name__)
+
+WRITE_OPERATIONS = frozenset({"insert", "update", "delete"})
+_OPERATIONS = frozenset({"select", *WRITE_OPERATIONS})
+# conn.info key holding start times of in-flight statements
+_STARTED_KEY = "sim_statement_started"
+
+# Request path of the request being served; None outside injectable requests
+_scope: ContextVar[str | None] = ContextVar("db_effect_scope", default=None)
+
+
+def bind_db_scope(path: str) -> Token[str | None]:
+    """Make DB statements issued in this context eligible for injection"""
+    return _scope.set(path)
+
+
+def reset_db_scope(token: Token[str | None]) -> None:
+    _scope.reset(token)
+
+
+def statement_operation(statement: str) -> str:
+    """select / insert / update / delete, or "other" (DDL, PRAGMA, ...)"""
+    head = statement.lstrip()[:6].lower()
+    return head if head in _OPERATIONS else "other"
+
+
+class DbEffectInjector:
+    """
+    Evaluates active db-category scenarios and applies their effects.
+
+    The hook methods are registered by session.install_effect_hooks(); they
+    run on the event loop thread (inside SQLAlchemy's greenlet) for async
+    engines.
+    """
+
+    def __init__(
+        self,
+        service: SimulatorService,
+        registry: ScenarioRegistry,
+        *,
+        metrics: MetricsPort | None = None,
+        metric_events: MetricEventBuffer | None = None,
+    ) -> None:
+        self._service = service
+        self._registry = registry
+        self._metrics = metrics
+        self._metric_events = metric_events
+        self._effects = EffectRecorder(metrics)
+
+    # Engine event hooks
+
+    def on_connect(self, conn: Any) -> None:
+        path = _scope.get()
+        if path is None:
+            return
+        effects, sources, events = self._plan("connect", path)
+        if not effects.get("db_connection_exhausted"):
+            return
+        scenario = sources["db_connection_exhausted"]
+        # Only the exhausting scenario acts on acquisition; the others' events
+        # are counted per statement
+        self._emit(events.get(scenario, ()))
+        # Not raised from a pool "checkout" listener: SQLAlchemy invalidates
+        # the connection being checked out when one raises. Checking it back
+        # in first keeps the healthy connection pooled, and nothing is held
+        # during the hang, as with a real exhausted pool.
+        conn.close()
+        hang_ms = _number(effects.get("db_hang_duration_ms"))
+        limit = effects.get("db_pool_size_limit", "?")
+        self._count_injection(scenario, "db_connection_exhausted")
+        with self._effects.record(scenario, "db_connection_exhausted", {"hang_ms": hang_ms}):
+            _sleep(hang_ms / 1000.0)
+        raise exc.TimeoutError(
+            f"QueuePool limit of size {limit} reached, connection timed out "
+            f"(simulated by {scenario})"
+        )
+
+    def before_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+        path = _scope.get()
+        if path is None:
+            return
+        operation = statement_operation(statement)
+        try:
+            self._inject(operation, path, statement, parameters)
+        except BaseException:
+            # The statement never reaches the cursor, so neither
+            # after_cursor_execute nor handle_error will pop its start time:
+            # finish it here, also when an injected delay is cancelled
+            self._finish(conn, operation, "error")
+            raise
+
+    def after_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        self._finish(conn, statement_operation(statement), "ok")
+
+    def handle_error(self, context: ExceptionContext) -> None:
+        if context.connection is not None and context.statement is not None:
+            self._finish(context.connection, statement_operation(context.statement), "error")
+
+    # Internals
+
+    def _inject(self, operation: str, path: str, statement: str, parameters: Any) -> None:
+        """Apply the statement's delays, or fail it like a full disk"""
+        effects, sources, events = self._plan(operation, path)
+        for scenario_events in events.values():
+            self._emit(scenario_events)
+        if not effects:
+            return
+
+        for key in ("db_sleep_seconds", "db_query_delay_ms"):
+            if key in effects:
+                seconds = _number(effects[key]) / (1000.0 if key.endswith("_ms") else 1.0)
+                self._count_injection(sources[key], "db_delay")
+                with self._effects.record(
+                    sources[key], "db_delay", {"seconds": seconds, "operation": operation}
+                ):
+                    _sleep(seconds)
+
+        if effects.get("disk_full_error") and operation in WRITE_OPERATIONS:
+            prefix = effects.get("path_prefix") or ""
+            if isinstance(prefix, str) and path.startswith(prefix):
+                scenario = sources["disk_full_error"]
+                self._count_injection(scenario, "db_write_failure")
+                with self._effects.record(scenario, "db_write_failure", {"operation": operation}):
+                    raise exc.OperationalError(
+                        statement,
+                        parameters,
+                        OSError(28, f"No space left on device (simulated by {scenario})"),
+                    )
+
+    def _plan(
+        self, operation: str, path: str
+    ) -> tuple[dict[str, object], dict[str, str], dict[str, Iterable[MetricEvent]]]:
+        """
+        Effects of applicable active scenarios, which scenario set each key,
+        and each scenario's metric events (left to the caller to emit)
+        """
+        combined: dict[str, object] = {}
+        sources: dict[str, str] = {}
+        events: dict[str, Iterable[MetricEvent]] = {}
+        target = {"category": "db", "operation": operation, "path": path}
+        for active in self._service.status().active:
+            try:
+                scenario = self._registry.get(active.name)
+                if not scenario.is_applicable(target=target):
+                    continue
+                ctx: dict[str, object] = {"target": target}
+                parameters = self._service.effective_parameters(active)
+                effects = scenario.apply(ctx=ctx, parameters=parameters)
+            except Exception:
+                # Log but don't fail the statement
+                logger.debug("DB scenario evaluation failed", exc_info=True)
+                continue
+            scenario_events = effects.pop(METRIC_EVENTS_KEY, None)
+            if scenario_events:
+                events[active.name] = cast("Iterable[MetricEvent]", scenario_events)
+            combined.update(effects)
+            sources.update(dict.fromkeys(effects, active.name))
+        return combined, sources, events
+
+    def _emit(self, events: Iterable[MetricEvent]) -> None:
+        if self._metric_events is not None:
+            self._metric_events.emit(events)
+
+    def _finish(self, conn: Any, operation: str, status: str) -> None:
+        started = conn.info.get(_STARTED_KEY)
+        if not started:
+            return
+        duration = time.perf_counter() - started.pop()
+        if self._metrics is None:
+            return
+        labels = {"operation": operation, "status": status}
+        self._metrics.counter("db_statements_total", labels).inc()
+        self._metrics.histogram("db_statement_duration_seconds", {"operation": operation}).observe(
+            duration
+        )
+
+    def _count_injection(self, scenario: str, effect_type: str) -> None:
+        if self._metrics is not None:
+            self._metrics.counter(
+                "simulator_injections_total",
+                {"scenario_name": scenario, "effect_type": effect_type},
+            ).inc()
+
+
+def _number(value: object) -> float:
+    return float(value) if isinstance(value, (int, float)) else 0.0
+
+
+def _sleep(seconds: float) -> None:
+    """Yield to the event loop when running under an AsyncEngine"""
+    if seconds <= 0:
+        return
+    if in_greenlet():
+        await_only(asyncio.sleep(seconds))
+    else:
+        time.sleep(seconds)
+
+
+@contextmanager
+def db_scope(path: str) -> Iterator[None]:
+    """bind_db_scope() for the duration of a block"""
+    token = bind_db_scope(path)
+    try:
+        yield
+    finally:
+        reset_db_scope(token)
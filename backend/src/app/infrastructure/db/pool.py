@@ -0,0 +1,140 @@
+"""Connection pool - tunable settings, pool metrics and prewarming
+
+PoolSettings carries the QueuePool knobs (size, overflow, timeout, recycle,
+pre-ping) into create_async_engine(). install_pool_metrics() exports pool
+health from pool and dialect events:
+
+- db_pool_checked_out / db_pool_overflow: connections in use, and how many
+  of them are beyond pool_size (overflow connections are closed on checkin)
+- db_pool_wait_seconds: time to get a connection from the pool, including
+  opening one when the pool has none idle
+- db_connect_seconds: time to open a new database connection
+
+prewarm_pool() opens connections before serving, so the first burst of
+requests doesn't pay for a connection storm against the database.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from app.application.ports.metrics import MetricsPort
+
+# ConnectionPoolEntry.info keys
+_WAIT_KEY = "pool_wait_seconds"
+_CONNECT_STARTED_KEY = "pool_connect_started"
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """QueuePool configuration (defaults are SQLAlchemy's)"""
+
+    size: int = 5
+    max_overflow: int = 10
+    timeout_seconds: float = 30.0
+    # Seconds after which a connection is replaced on checkout; -1 never
+    recycle_seconds: int = -1
+    # Test each connection with a round trip on checkout
+    pre_ping: bool = False
+    # Connections opened at startup (at most `size`)
+    prewarm: int = 0
+
+    def __post_init__(self) -> None:
+        if self.size < 1:
+            raise ValueError("pool size must be at least 1")
+        if self.timeout_seconds <= 0:
+            raise ValueError("pool timeout must be positive")
+        if self.prewarm < 0:
+            raise ValueError("prewarm must not be negative")
+
+    def engine_options(self, database_url: str) -> dict[str, Any]:
+        """create_async_engine() keyword arguments for `database_url`"""
+        url = make_url(database_url)
+        if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+            # In-memory SQLite uses a single shared connection (StaticPool)
+            return {"pool_pre_ping": self.pre_ping}
+        return {
+            "poolclass": TimedAsyncQueuePool,
+            "pool_size": self.size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.timeout_seconds,
+            "pool_recycle": self.recycle_seconds,
+            "pool_pre_ping": self.pre_ping,
+        }
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that notes on each entry how long its checkout waited"""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        record = super()._do_get()
+        record.info[_WAIT_KEY] = time.perf_counter() - start
+        return record
+
+
+def install_pool_metrics(engine: AsyncEngine, metrics: MetricsPort) -> None:
+    """Export pool occupancy, checkout wait and connect time for `engine`"""
+    sync_engine = engine.sync_engine
+    # Bound once; the hooks run on every checkout and checkin
+    checked_out_gauge = metrics.gauge("db_pool_checked_out")
+    overflow_gauge = metrics.gauge("db_pool_overflow")
+    connect_seconds = metrics.histogram("db_connect_seconds")
+    wait_seconds = metrics.histogram("db_pool_wait_seconds")
+
+    def update_occupancy(checked_out: int) -> None:
+        # engine.pool, not a captured pool: dispose() replaces the pool
+        size = getattr(sync_engine.pool, "size", lambda: 1)()
+        checked_out_gauge.set(checked_out)
+        overflow_gauge.set(max(0, checked_out - size))
+
+    def checked_out() -> int:
+        count = getattr(sync_engine.pool, "checkedout", None)
+        return count() if count is not None else 0
+
+    def on_do_connect(dialect: Any, record: ConnectionPoolEntry, *args: Any) -> None:
+        record.info[_CONNECT_STARTED_KEY] = time.perf_counter()
+
+    def on_connect(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        started = record.info.pop(_CONNECT_STARTED_KEY, None)
+        if started is not None:
+            connect_seconds.observe(time.perf_counter() - started)
+
+    def on_checkout(dbapi_connection: Any, record: ConnectionPoolEntry, proxy: Any) -> None:
+        wait = record.info.pop(_WAIT_KEY, None)
+        if wait is not None:
+            wait_seconds.observe(wait)
+        update_occupancy(checked_out())
+
+    def on_checkin(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        # Fires before the pool takes the connection back
+        update_occupancy(max(0, checked_out() - 1))
+
+    event.listen(sync_engine, "do_connect", on_do_connect)
+    event.listen(sync_engine.pool, "connect", on_connect)
+    event.listen(sync_engine.pool, "checkout", on_checkout)
+    event.listen(sync_engine.pool, "checkin", on_checkin)
+
+
+async def prewarm_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Open up to `connections` pooled connections and return them to the pool.
+
+    The connections are held together, so each is a distinct pooled
+    connection; more than pool_size would be overflow and closed on return.
+    Returns the number of connections opened.
+    """
+    size = getattr(engine.sync_engine.pool, "size", lambda: 1)()
+    count = min(connections, size)
+    async with AsyncExitStack() as stack:
+        for _ in range(count):
+            await stack.enter_async_context(engine.connect())
+    return count
@@ -0,0 +1,121 @@
+"""Per-request query stats - statement counts, DB time and N+1 detection
+
+ObservabilityMiddleware binds a RequestQueries for each request in a
+contextvar; install_query_stats() adds engine hooks that count and time
+every statement issued in that context, so nothing is threaded through
+repositories. Statements outside a request (the SQL simulator store's
+writer and change feed) are not counted.
+
+Each statement is also fingerprinted: literals and bind placeholders become
+`?` and IN lists collapse to `IN (...)`, so the per-row queries of an N+1
+pattern share one fingerprint whatever their parameters or batch size.
+A SELECT fingerprint repeated at least `threshold` times in one request is
+reported as a suspected N+1.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Same SELECT this many times in one request is reported as N+1
+DEFAULT_N_PLUS_ONE_THRESHOLD = 10
+# conn.info key holding the start time of the connection's counted statement
+_STARTED_KEY = "query_stats_started"
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+# %(name)s / %s (psycopg), $1 (asyncpg), :name (SQLite named), numbers
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """`statement` with literals, placeholders and IN lists normalized"""
+    normalized = _STRING.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    return _SPACE.sub(" ", normalized).strip()
+
+
+class RequestQueries:
+    """Statements run while serving one request"""
+
+    __slots__ = ("count", "seconds", "fingerprints")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.fingerprints: Counter[str] = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def n_plus_one(self, threshold: int) -> tuple[str, int] | None:
+        """The most repeated SELECT and its count, if repeated `threshold`+ times"""
+        repeats = [
+            (sql, count)
+            for sql, count in self.fingerprints.items()
+            if count >= threshold and sql[:6].lower() == "select"
+        ]
+        return max(repeats, key=lambda item: item[1]) if repeats else None
+
+
+_current: ContextVar[RequestQueries | None] = ContextVar("request_queries", default=None)
+
+
+def bind_queries(queries: RequestQueries) -> Token[RequestQueries | None]:
+    return _current.set(queries)
+
+
+def reset_queries(token: Token[RequestQueries | None]) -> None:
+    _current.reset(token)
+
+
+def current_queries() -> RequestQueries | None:
+    return _current.get()
+
+
+def install_query_stats(engine: AsyncEngine) -> None:
+    """
+    Count and time statements on `engine` into the bound RequestQueries.
+
+    Install before install_effect_hooks(): listeners run in registration
+    order, so injected statement delays are part of the measured DB time.
+    Statements the database rejects are counted too.
+    """
+    sync_engine = engine.sync_engine
+
+    def before_cursor_execute(conn: Any, *args: Any) -> None:
+        if _current.get() is not None:
+            # One statement at a time per connection; a statement failed by a
+            # hook before it ran leaves a start time that the next one replaces
+            conn.info[_STARTED_KEY] = time.perf_counter()
+
+    def finish(conn: Any, statement: str) -> None:
+        queries = _current.get()
+        started = conn.info.pop(_STARTED_KEY, None)
+        if queries is not None and started is not None:
+            queries.record(statement, time.perf_counter() - started)
+
+    def after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        finish(conn, statement)
+
+    def handle_error(context: ExceptionContext) -> None:
+        if context.connection is not None and context.statement is not None:
+            finish(context.connection, context.statement)
+
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(sync_engine, "handle_error", handle_error)
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -11,17 +13,37 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+if TYPE_CHECKING:
+    from app.infrastructure.db.effects import DbEffectInjector
+    from app.infrastructure.db.pool import PoolSettings
+
 # Database URL will be injected from environment
 engine: AsyncEngine | None = None
 async_session_maker: async_sessionmaker[AsyncSession] | None = None
 
 
-def init_db(database_url: str) -> None:
-    """Initialize database engine and session maker"""
+def init_db(database_url: str, pool: PoolSettings | None = None) -> AsyncEngine:
+    """Initialize database engine and session maker (default pool settings without `pool`)"""
     global engine, async_session_maker
 
-    engine = create_async_engine(database_url, echo=False)
+    options = pool.engine_options(database_url) if pool is not None else {}
+    engine = create_async_engine(database_url, echo=False, **options)
     async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    return engine
+
+
+def install_effect_hooks(engine: AsyncEngine, injector: DbEffectInjector) -> None:
+    """
+    Apply db-category scenario effects to every statement run on `engine`.
+
+    Connection acquisition can fail like an exhausted pool, statements can be delayed
+    or fail like a full disk, and each statement is counted and timed.
+    """
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "engine_connect", injector.on_connect)
+    event.listen(sync_engine, "before_cursor_execute", injector.before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", injector.after_cursor_execute)
+    event.listen(sync_engine, "handle_error", injector.handle_error)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
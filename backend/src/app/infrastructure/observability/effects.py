@@ -0,0 +1,55 @@
+"""Effect instrumentation - spans and timings for injected scenario effects
+
+Every effect the simulator executes (delay, error, CPU burn, DB delay) runs
+inside EffectRecorder.record(): a `sim.effect <type>` child span of the
+current span carries the scenario, the effect type and its parameters, and
+the elapsed time is observed into simulator_effect_duration_seconds. A
+trace then shows how much of its latency was injected and how much is real.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+
+from opentelemetry import trace
+
+from app.application.ports.metrics import MetricsPort
+
+EFFECT_SPAN_PREFIX = "sim.effect"
+
+_AttributeValue = str | bool | int | float
+
+
+class EffectRecorder:
+    """Wraps effect execution in a child span and a duration observation"""
+
+    def __init__(self, metrics: MetricsPort | None, tracer: trace.Tracer | None = None) -> None:
+        self._metrics = metrics
+        # The API's proxy tracer follows whatever provider setup_tracing installs
+        self._tracer = tracer or trace.get_tracer(__name__)
+
+    @contextmanager
+    def record(
+        self, scenario_name: str, effect_type: str, parameters: Mapping[str, object]
+    ) -> Iterator[None]:
+        attributes: dict[str, _AttributeValue] = {
+            "sim.scenario": scenario_name,
+            "sim.effect": effect_type,
+        }
+        for key, value in parameters.items():
+            if isinstance(value, _AttributeValue):
+                attributes[f"sim.param.{key}"] = value
+        start = time.perf_counter()
+        try:
+            with self._tracer.start_as_current_span(
+                f"{EFFECT_SPAN_PREFIX} {effect_type}", attributes=attributes
+            ):
+                yield
+        finally:
+            if self._metrics is not None:
+                self._metrics.histogram(
+                    "simulator_effect_duration_seconds",
+                    {"scenario_name": scenario_name, "effect_type": effect_type},
+                ).observe(time.perf_counter() - start)
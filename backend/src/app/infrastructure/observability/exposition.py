@@ -0,0 +1,71 @@
+"""Metrics exposition cache - serves scrapes from a short-lived snapshot"""
+
+from __future__ import annotations
+
+import gzip
+import threading
+import time
+from dataclasses import dataclass, field
+
+from app.application.ports.metrics import MetricsPort
+
+DEFAULT_TTL_SECONDS = 1.0
+# Fast compression: the payload is regenerated every TTL
+GZIP_LEVEL = 1
+
+
+@dataclass(frozen=True)
+class Exposition:
+    """A rendered scrape payload"""
+
+    body: bytes
+    content_type: str
+    content_encoding: str | None = None
+
+
+@dataclass
+class _Entry:
+    created_at: float
+    body: bytes
+    content_type: str
+    gzipped: bytes | None = field(default=None)
+
+
+class MetricsExposition:
+    """
+    TTL cache in front of MetricsPort.export().
+
+    Rendering walks every series, so concurrent or back-to-back scrapes within
+    the TTL share one snapshot per format; the gzip body is compressed at most
+    once per snapshot. render() is blocking and thread-safe: call it from a
+    worker thread, never on the event loop.
+    """
+
+    def __init__(
+        self,
+        metrics: MetricsPort,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self._metrics = metrics
+        self._ttl = ttl_seconds
+        self._entries: dict[bool, _Entry] = {}
+        # Held while rendering so a burst of scrapes triggers one generation
+        self._lock = threading.Lock()
+
+    def render(self, *, openmetrics: bool = False, gzip_ok: bool = False) -> Exposition:
+        with self._lock:
+            entry = self._entries.get(openmetrics)
+            now = time.monotonic()
+            if entry is None or now - entry.created_at >= self._ttl:
+                body, content_type = self._metrics.export(openmetrics=openmetrics)
+                entry = _Entry(created_at=now, body=body, content_type=content_type)
+                self._entries[openmetrics] = entry
+
+            if not gzip_ok:
+                return Exposition(body=entry.body, content_type=entry.content_type)
+            if entry.gzipped is None:
+                entry.gzipped = gzip.compress(entry.body, compresslevel=GZIP_LEVEL)
+            return Exposition(
+                body=entry.gzipped, content_type=entry.content_type, content_encoding="gzip"
+            )
@@ -0,0 +1,195 @@
+"""Scenario impact analytics - rolling windows segmented by active-scenario set
+
+Every request is attributed to the exact set of scenarios active when it
+ran. Each set keeps a rolling window of time slots; a slot holds request
+and error counts and a log-linear LatencyHistogram, which is a mergeable
+sketch, so window totals are exact merges of the slots.
+
+The impact of a scenario is the delta between the current set and the same
+set without it. A set's window ends at its own last request, so the
+"before" segment survives while the scenario is active.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from app.infrastructure.observability.latency import LatencyHistogram
+
+DEFAULT_SLOT_SECONDS = 10.0
+DEFAULT_WINDOW_SLOTS = 30  # 5 minutes
+DEFAULT_MAX_SEGMENTS = 32
+# 3% relative error; an impact window needs many slots, not fine resolution
+SKETCH_SIGNIFICANT_BITS = 6
+
+ScenarioSet = tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class SegmentStats:
+    """Rolling-window stats for one active-scenario set"""
+
+    scenarios: ScenarioSet
+    requests: int
+    errors: int
+    error_rate: float
+    throughput_rps: float
+    p50_seconds: float
+    p95_seconds: float
+    p99_seconds: float
+    window_seconds: float
+
+
+@dataclass(frozen=True)
+class ScenarioImpact:
+    """Before/after comparison for one scenario; deltas are after - before"""
+
+    scenario: str
+    before: SegmentStats | None
+    after: SegmentStats | None
+
+    @property
+    def p95_delta_seconds(self) -> float | None:
+        if self.before is None or self.after is None:
+            return None
+        return self.after.p95_seconds - self.before.p95_seconds
+
+    @property
+    def p99_delta_seconds(self) -> float | None:
+        if self.before is None or self.after is None:
+            return None
+        return self.after.p99_seconds - self.before.p99_seconds
+
+    @property
+    def error_rate_delta(self) -> float | None:
+        if self.before is None or self.after is None:
+            return None
+        return self.after.error_rate - self.before.error_rate
+
+    @property
+    def throughput_delta_rps(self) -> float | None:
+        if self.before is None or self.after is None:
+            return None
+        return self.after.throughput_rps - self.before.throughput_rps
+
+
+class _Slot:
+    __slots__ = ("index", "started", "requests", "errors", "latency")
+
+    def __init__(self, index: int, started: float) -> None:
+        self.index = index
+        self.started = started
+        self.requests = 0
+        self.errors = 0
+        self.latency = LatencyHistogram(significant_bits=SKETCH_SIGNIFICANT_BITS)
+
+
+class _Segment:
+    __slots__ = ("slots", "last_seen")
+
+    def __init__(self, window_slots: int) -> None:
+        self.slots: deque[_Slot] = deque(maxlen=window_slots)
+        self.last_seen = 0.0
+
+
+class ImpactAnalyzer:
+    """
+    Rolling request stats per active-scenario set.
+
+    Confined to the event loop like LatencyRecorder. At most `max_segments`
+    sets are tracked; the least recently seen set is evicted first.
+    """
+
+    def __init__(
+        self,
+        *,
+        slot_seconds: float = DEFAULT_SLOT_SECONDS,
+        window_slots: int = DEFAULT_WINDOW_SLOTS,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._slot_seconds = slot_seconds
+        self._window_slots = window_slots
+        self._max_segments = max_segments
+        self._clock = clock
+        self._segments: OrderedDict[ScenarioSet, _Segment] = OrderedDict()
+
+    def record(self, scenarios: Iterable[str], seconds: float, *, error: bool) -> None:
+        key = tuple(sorted(scenarios))
+        now = self._clock()
+        segment = self._segments.get(key)
+        if segment is None:
+            segment = _Segment(self._window_slots)
+            self._segments[key] = segment
+            if len(self._segments) > self._max_segments:
+                self._segments.popitem(last=False)
+        else:
+            self._segments.move_to_end(key)
+
+        index = int(now // self._slot_seconds)
+        if not segment.slots or segment.slots[-1].index != index:
+            segment.slots.append(_Slot(index, now))
+        slot = segment.slots[-1]
+        slot.requests += 1
+        if error:
+            slot.errors += 1
+        slot.latency.record(seconds)
+        segment.last_seen = now
+
+    def segments(self) -> list[SegmentStats]:
+        """Stats for every tracked set, most recently seen first"""
+        out = []
+        for key in reversed(self._segments):
+            stats = self.stats(key)
+            if stats is not None:
+                out.append(stats)
+        return out
+
+    def stats(self, scenarios: Iterable[str]) -> SegmentStats | None:
+        key = tuple(sorted(scenarios))
+        segment = self._segments.get(key)
+        if segment is None or not segment.slots:
+            return None
+
+        # Only slots within the window ending at the segment's last request
+        oldest = segment.slots[-1].index - self._window_slots + 1
+        slots = [s for s in segment.slots if s.index >= oldest]
+        latency = LatencyHistogram(significant_bits=SKETCH_SIGNIFICANT_BITS)
+        requests = errors = 0
+        for slot in slots:
+            latency.merge(slot.latency)
+            requests += slot.requests
+            errors += slot.errors
+        # Covered span, at least one second so a burst doesn't read as huge throughput
+        window = max(1.0, segment.last_seen - slots[0].started)
+        percentiles = latency.percentiles((50, 95, 99))
+        return SegmentStats(
+            scenarios=key,
+            requests=requests,
+            errors=errors,
+            error_rate=errors / requests if requests else 0.0,
+            throughput_rps=requests / window,
+            p50_seconds=percentiles[50],
+            p95_seconds=percentiles[95],
+            p99_seconds=percentiles[99],
+            window_seconds=window,
+        )
+
+    def impact(self, active: Iterable[str]) -> list[ScenarioImpact]:
+        """Impact of each scenario in the active set vs the same set without it"""
+        current = tuple(sorted(active))
+        after = self.stats(current)
+        return [
+            ScenarioImpact(
+                scenario=name,
+                before=self.stats(s for s in current if s != name),
+                after=after,
+            )
+            for name in current
+        ]
+
+    def reset(self) -> None:
+        self._segments.clear()
@@ -0,0 +1,80 @@
+"""Fast structured JSON log formatter
+
+Emits the same fields as the previous python-json-logger setup (timestamp,
+level, name, message, correlation fields, then any `extra` fields) with the
+layout worked out once: the fixed keys are a precomputed tuple, extras are
+the record attributes outside a precomputed set of standard LogRecord
+attributes (kept in the order they were set), and the timestamp prefix is
+cached per second. Serialization uses orjson when it is
+installed and the stdlib encoder otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import Callable
+
+from app.infrastructure.observability.log_context import CORRELATION_FIELDS
+
+_dumps: Callable[[dict[str, object]], str]
+try:
+    import orjson
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def _dumps(payload: dict[str, object]) -> str:
+        return orjson.dumps(payload, default=str, option=_OPTIONS).decode()
+
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _encoder = json.JSONEncoder(default=str, ensure_ascii=False, separators=(",", ":"))
+    _dumps = _encoder.encode
+
+# Attributes every LogRecord has; anything else came from `extra`
+_RESERVED = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__.keys()
+    | {"message", "asctime", "taskName"}
+)
+
+
+class FastJsonFormatter(logging.Formatter):
+    """One JSON object per line with a fixed leading field order"""
+
+    def __init__(self, fields: tuple[str, ...] = CORRELATION_FIELDS) -> None:
+        super().__init__()
+        self._fields = fields
+        self._skip = _RESERVED | set(fields)
+        self._second = -1
+        self._prefix = ""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, object] = {
+            "timestamp": self._timestamp(record.created),
+            "level": record.levelname,
+            "name": record.name,
+            "message": record.getMessage(),
+        }
+        attrs = record.__dict__
+        for name in self._fields:
+            payload[name] = attrs.get(name, "none")
+        # Insertion order, not a set difference: keeps the key order stable
+        skip = self._skip
+        for key, value in attrs.items():
+            if key not in skip:
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc_info"] = record.exc_text
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+        return _dumps(payload)
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        if second != self._second:
+            # Formatting the date is the slow part; do it once per second
+            self._prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second = second
+        return f"{self._prefix}.{int((created - second) * 1000):03d}Z"
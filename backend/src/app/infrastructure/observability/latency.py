@@ -0,0 +1,269 @@
+"""Latency recorder - HDR-style log-linear histograms with exact in-process percentiles
+
+Prometheus buckets are too coarse to resolve p99.9 for injected latencies
+between 1 ms and 30 s. Each series here is a fixed array of counters laid out
+log-linearly: values below 2^SIGNIFICANT_BITS microseconds get one slot each,
+and every further power of two is split into 2^(SIGNIFICANT_BITS - 1) equal
+slots. Every recorded value is therefore reported within 1 / 2^(bits - 1)
+(0.8% at the default 8 bits) of its true value, from 1 µs up to the highest
+trackable value. Histograms with the same layout merge by adding arrays.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+DEFAULT_SIGNIFICANT_BITS = 8
+DEFAULT_HIGHEST_SECONDS = 60.0
+DEFAULT_PERCENTILES: tuple[float, ...] = (50.0, 90.0, 95.0, 99.0, 99.9, 99.99)
+
+# Scenario label for requests that ran with no scenario effects
+NO_SCENARIO = "none"
+
+_MICROS = 1_000_000
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of durations, recorded at microsecond resolution.
+
+    record() is an index computation and one array increment. Values above
+    the highest trackable value are counted in the last slot; max stays exact.
+    """
+
+    __slots__ = (
+        "_bits",
+        "_highest",
+        "_sub_count",
+        "_half",
+        "counts",
+        "count",
+        "total",
+        "min",
+        "max",
+    )
+
+    def __init__(
+        self,
+        *,
+        highest_seconds: float = DEFAULT_HIGHEST_SECONDS,
+        significant_bits: int = DEFAULT_SIGNIFICANT_BITS,
+    ) -> None:
+        if not 2 <= significant_bits <= 16:
+            raise ValueError("significant_bits must be between 2 and 16")
+        self._bits = significant_bits
+        self._sub_count = 1 << significant_bits
+        self._half = self._sub_count >> 1
+        self._highest = max(self._sub_count, int(highest_seconds * _MICROS))
+        self.counts = array("q", bytes(8 * (self._index(self._highest) + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    @property
+    def layout(self) -> tuple[int, int]:
+        return self._bits, self._highest
+
+    def record(self, seconds: float) -> None:
+        micros = min(max(0, int(seconds * _MICROS)), self._highest)
+        self.counts[self._index(micros)] += 1
+        if self.count == 0 or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.count += 1
+        self.total += seconds
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add another histogram's counts into this one"""
+        if other.layout != self.layout:
+            raise ValueError("cannot merge histograms with different layouts")
+        if other.count == 0:
+            return
+        counts = self.counts
+        for i, n in enumerate(other.counts):
+            if n:
+                counts[i] += n
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def copy(self) -> LatencyHistogram:
+        clone = LatencyHistogram.__new__(LatencyHistogram)
+        clone._bits, clone._sub_count, clone._half = self._bits, self._sub_count, self._half
+        clone._highest = self._highest
+        clone.counts = array("q", self.counts)
+        clone.count, clone.total, clone.min, clone.max = self.count, self.total, self.min, self.max
+        return clone
+
+    def percentile(self, percentile: float) -> float:
+        """Value in seconds at `percentile` (0-100); 0.0 when empty"""
+        return self.percentiles((percentile,))[percentile]
+
+    def percentiles(self, percentiles: Sequence[float]) -> dict[float, float]:
+        """Values in seconds at several percentiles, in a single pass over the array"""
+        if self.count == 0:
+            return {p: 0.0 for p in percentiles}
+        # ceil(p * count / 100), at least the first recorded value
+        pending = sorted((max(1, math.ceil(p * self.count / 100)), p) for p in percentiles)
+        out: dict[float, float] = {}
+        seen = 0
+        j = 0
+        for i, n in enumerate(self.counts):
+            if not n:
+                continue
+            seen += n
+            while j < len(pending) and pending[j][0] <= seen:
+                # Highest value equivalent to the slot, but never beyond what was seen
+                out[pending[j][1]] = min(self._upper(i) / _MICROS, self.max)
+                j += 1
+            if j == len(pending):
+                break
+        for _, p in pending[j:]:
+            out[p] = self.max
+        return out
+
+    def _index(self, micros: int) -> int:
+        if micros < self._sub_count:
+            return micros
+        shift = micros.bit_length() - self._bits
+        return self._sub_count + (shift - 1) * self._half + (micros >> shift) - self._half
+
+    def _upper(self, index: int) -> int:
+        if index < self._sub_count:
+            return index
+        offset = index - self._sub_count
+        shift = offset // self._half + 1
+        sub = offset % self._half + self._half
+        return ((sub + 1) << shift) - 1
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """Percentiles of one series (or of several merged)"""
+
+    route: str
+    scenario: str
+    count: int
+    min_seconds: float
+    max_seconds: float
+    mean_seconds: float
+    percentiles: dict[float, float]
+
+
+@dataclass(frozen=True)
+class LatencySnapshot:
+    """Every series in a recording window"""
+
+    window_started_at: datetime
+    window_seconds: float
+    series: list[LatencySummary]
+    merged: LatencySummary | None
+
+
+_SeriesKey = tuple[str, str]
+
+
+class LatencyRecorder:
+    """
+    Latency histograms per (route template, scenario) for the current window.
+
+    A request is recorded once per scenario whose effects it received, or
+    under NO_SCENARIO. The recorder is confined to the event loop: record(),
+    snapshot() and reset() need no lock, and reset() swaps in a new window
+    rather than clearing arrays in place.
+    """
+
+    def __init__(
+        self,
+        *,
+        highest_seconds: float = DEFAULT_HIGHEST_SECONDS,
+        significant_bits: int = DEFAULT_SIGNIFICANT_BITS,
+    ) -> None:
+        self._highest = highest_seconds
+        self._bits = significant_bits
+        self._series: dict[_SeriesKey, LatencyHistogram] = {}
+        self._window_started = time.monotonic()
+        self._window_started_at = datetime.now(UTC)
+
+    def record(self, route: str, scenarios: Iterable[str], seconds: float) -> None:
+        recorded = False
+        for scenario in scenarios:
+            self._histogram((route, scenario)).record(seconds)
+            recorded = True
+        if not recorded:
+            self._histogram((route, NO_SCENARIO)).record(seconds)
+
+    def snapshot(
+        self,
+        *,
+        route: str | None = None,
+        scenario: str | None = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    ) -> LatencySnapshot:
+        """
+        Summaries of the series matching the filters, plus their merge.
+
+        Merging is exact: the merged percentiles are those of every matching
+        request, not an average of per-series percentiles.
+        """
+        selected = sorted(
+            (
+                (key, hist)
+                for key, hist in self._series.items()
+                if (route is None or key[0] == route) and (scenario is None or key[1] == scenario)
+            ),
+            key=lambda item: item[0],
+        )
+        merged: LatencyHistogram | None = None
+        for _, hist in selected:
+            if merged is None:
+                merged = hist.copy()
+            else:
+                merged.merge(hist)
+        return LatencySnapshot(
+            window_started_at=self._window_started_at,
+            window_seconds=time.monotonic() - self._window_started,
+            series=[_summarize(k[0], k[1], h, percentiles) for k, h in selected],
+            merged=(
+                _summarize(route or "*", scenario or "*", merged, percentiles)
+                if merged is not None
+                else None
+            ),
+        )
+
+    def reset(self, *, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> LatencySnapshot:
+        """Close the current window and start a new one; returns the closed window"""
+        closed = self.snapshot(percentiles=percentiles)
+        self._series = {}
+        self._window_started = time.monotonic()
+        self._window_started_at = datetime.now(UTC)
+        return closed
+
+    def _histogram(self, key: _SeriesKey) -> LatencyHistogram:
+        hist = self._series.get(key)
+        if hist is None:
+            hist = LatencyHistogram(highest_seconds=self._highest, significant_bits=self._bits)
+            self._series[key] = hist
+        return hist
+
+
+def _summarize(
+    route: str, scenario: str, hist: LatencyHistogram, percentiles: Sequence[float]
+) -> LatencySummary:
+    return LatencySummary(
+        route=route,
+        scenario=scenario,
+        count=hist.count,
+        min_seconds=hist.min,
+        max_seconds=hist.max,
+        mean_seconds=hist.total / hist.count if hist.count else 0.0,
+        percentiles=hist.percentiles(percentiles),
+    )
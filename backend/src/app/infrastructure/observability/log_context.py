@@ -0,0 +1,50 @@
+"""Log correlation context - request_id/trace_id/span_id carried in a contextvar
+
+Middleware binds the correlation fields once per request; CorrelationFilter
+copies them onto every record logged while handling it, from any logger, so
+call sites don't build `extra={...}` dicts. Tasks spawned during the request
+inherit the context.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from contextvars import ContextVar, Token
+from types import MappingProxyType
+
+# Fields every JSON record carries, "none" when unbound
+CORRELATION_FIELDS = ("request_id", "trace_id", "span_id")
+
+_EMPTY: Mapping[str, str] = MappingProxyType({})
+_correlation: ContextVar[Mapping[str, str]] = ContextVar("log_correlation", default=_EMPTY)
+
+
+def bind_correlation(**fields: str) -> Token[Mapping[str, str]]:
+    """Add fields to the current context; pass the token to reset_correlation()"""
+    merged = {**_correlation.get(), **fields}
+    return _correlation.set(MappingProxyType(merged))
+
+
+def reset_correlation(token: Token[Mapping[str, str]]) -> None:
+    _correlation.reset(token)
+
+
+def current_correlation() -> Mapping[str, str]:
+    return _correlation.get()
+
+
+class CorrelationFilter(logging.Filter):
+    """
+    Sets the correlation fields on each record.
+
+    Install it on the handler (not a logger) so records propagated from every
+    logger are enriched. Values passed explicitly via `extra` win.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        fields = _correlation.get()
+        for name in CORRELATION_FIELDS:
+            if name not in record.__dict__:
+                record.__dict__[name] = fields.get(name, "none")
+        return True
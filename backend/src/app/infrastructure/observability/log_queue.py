@@ -0,0 +1,188 @@
+"""Non-blocking log pipeline - bounded queue in front of the real handler
+
+Logging calls on the event loop only capture the record and append it to a
+bounded in-memory queue. A dedicated writer thread formats the records and
+writes them to the target handler in batches, so JSON formatting and a slow
+stdout consumer (promtail under load) never block request handling.
+
+When the queue is full, the overflow policy decides what is lost:
+
+- "drop_newest": the incoming record is discarded
+- "drop_oldest": the oldest queued record is discarded to make room
+- "coalesce": the record is folded into a per-message summary
+  ("<message> [coalesced N records]") written once the writer catches up;
+  records beyond MAX_COALESCED_MESSAGES distinct messages are dropped
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Literal
+
+OverflowPolicy = Literal["drop_newest", "drop_oldest", "coalesce"]
+
+DEFAULT_CAPACITY = 10_000
+DEFAULT_OVERFLOW_POLICY: OverflowPolicy = "coalesce"
+# Distinct (logger, level, message) summaries held while the queue is full
+MAX_COALESCED_MESSAGES = 256
+# How long flush()/close() wait for the writer to drain
+DRAIN_TIMEOUT_SECONDS = 5.0
+
+_CoalesceKey = tuple[str, int, str]
+
+_exception_formatter = logging.Formatter()
+
+
+class QueueLogHandler(logging.Handler):
+    """
+    Logging handler that hands records to a writer thread through a bounded queue.
+
+    Filters run on the calling thread (so context such as trace IDs is
+    captured there); formatting and I/O happen on the writer thread.
+    `dropped` counts lost records by reason; set_drop_listener() forwards
+    each loss to e.g. a Prometheus counter.
+    """
+
+    def __init__(
+        self,
+        target: logging.Handler,
+        *,
+        capacity: int = DEFAULT_CAPACITY,
+        overflow: OverflowPolicy = DEFAULT_OVERFLOW_POLICY,
+    ) -> None:
+        if overflow not in ("drop_newest", "drop_oldest", "coalesce"):
+            raise ValueError(f"Unknown log queue overflow policy '{overflow}'")
+        super().__init__()
+        self.target = target
+        self.capacity = capacity
+        self.overflow = overflow
+        self.dropped: dict[str, int] = {}
+        self._queue: deque[logging.LogRecord] = deque()
+        self._coalesced: dict[_CoalesceKey, tuple[logging.LogRecord, int]] = {}
+        self._on_drop: Callable[[str], None] | None = None
+        # Writer waits on the handler lock, which handle() already holds around emit()
+        self._ready = threading.Condition(self.lock)
+        self._busy = False
+        self._closing = False
+        self._stopped = False
+        self._writer = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._writer.start()
+
+    def set_drop_listener(self, listener: Callable[[str], None] | None) -> None:
+        """Called with the reason for every dropped record"""
+        self._on_drop = listener
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Called by handle() with the handler lock held"""
+        try:
+            # Freeze what may change or can't cross threads: merge args, render the traceback
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info:
+                if not record.exc_text:
+                    record.exc_text = _exception_formatter.formatException(record.exc_info)
+                record.exc_info = None
+
+            if self._closing:
+                self._drop("closed")
+            elif len(self._queue) < self.capacity:
+                self._queue.append(record)
+                self._ready.notify()
+            elif self.overflow == "drop_oldest":
+                self._queue.popleft()
+                self._queue.append(record)
+                self._drop("overflow")
+            elif self.overflow == "coalesce":
+                self._coalesce(record)
+            else:
+                self._drop("overflow")
+        except Exception:
+            # Like any Handler: a malformed log call must not raise into the caller
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Wait (bounded) until every queued record has been written"""
+        deadline = time.monotonic() + DRAIN_TIMEOUT_SECONDS
+        with self._ready:
+            while self._queue or self._coalesced or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._writer.is_alive():
+                    break
+                self._ready.wait(remaining)
+        self.target.flush()
+
+    def close(self) -> None:
+        """Drain the queue and stop the writer"""
+        with self._ready:
+            self._closing = True
+            self._ready.notify_all()
+            # wait() fully releases the lock, even if logging.shutdown() holds it
+            self._ready.wait_for(
+                lambda: self._stopped or not self._writer.is_alive(), DRAIN_TIMEOUT_SECONDS
+            )
+        self.target.close()
+        super().close()
+
+    def _coalesce(self, record: logging.LogRecord) -> None:
+        key = (record.name, record.levelno, record.msg)
+        entry = self._coalesced.get(key)
+        if entry is not None:
+            self._coalesced[key] = (entry[0], entry[1] + 1)
+        elif len(self._coalesced) < MAX_COALESCED_MESSAGES:
+            self._coalesced[key] = (record, 1)
+        else:
+            self._drop("overflow")
+            return
+        self._drop("coalesced")
+
+    def _drop(self, reason: str) -> None:
+        self.dropped[reason] = self.dropped.get(reason, 0) + 1
+        if self._on_drop is not None:
+            self._on_drop(reason)
+
+    def _run(self) -> None:
+        while True:
+            with self._ready:
+                self._busy = False
+                self._ready.notify_all()
+                while not self._queue and not self._coalesced and not self._closing:
+                    self._ready.wait()
+                if self._closing and not self._queue and not self._coalesced:
+                    self._stopped = True
+                    self._ready.notify_all()
+                    return
+                batch, self._queue = self._queue, deque()
+                coalesced, self._coalesced = self._coalesced, {}
+                self._busy = True
+
+            for record, count in coalesced.values():
+                record.msg = f"{record.msg} [coalesced {count} records]"
+                batch.append(record)
+            self._write(batch)
+
+    def _write(self, batch: deque[logging.LogRecord]) -> None:
+        target = self.target
+        stream = getattr(target, "stream", None)
+        if isinstance(target, logging.StreamHandler) and stream is not None:
+            # One write and one flush per batch instead of per record
+            lines = []
+            for record in batch:
+                if record.levelno < target.level or not target.filter(record):
+                    continue
+                try:
+                    lines.append(target.format(record) + target.terminator)
+                except Exception:
+                    target.handleError(record)
+            if lines:
+                try:
+                    stream.write("".join(lines))
+                    stream.flush()
+                except Exception:
+                    target.handleError(batch[-1])
+        else:
+            for record in batch:
+                target.handle(record)
@@ -0,0 +1,94 @@
+"""Request log sampling - keep every interesting request, a sample of the rest
+
+One "Request completed" record is written per kept request. Errors (5xx),
+requests that received injected scenario effects and slow requests are
+always kept. Other requests are head-sampled at `sample_rate`, then capped
+per route template by a token bucket, so health checks and scrapes don't
+flood Loki during load tests. Kept records carry the reason and the rate
+they were sampled at, so counts can be re-weighted downstream.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable, Mapping
+from typing import Literal
+
+SampleReason = Literal["error", "fault", "slow", "sampled"]
+
+DEFAULT_SAMPLE_RATE = 1.0
+DEFAULT_SLOW_SECONDS = 1.0
+
+
+class RequestLogSampler:
+    """
+    Decides whether a completed request is logged.
+
+    Confined to the event loop: the per-route buckets need no lock.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        slow_seconds: float = DEFAULT_SLOW_SECONDS,
+        route_rate_limits: Mapping[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.sample_rate = sample_rate
+        self.slow_seconds = slow_seconds
+        # Route template -> records per second (burst of one second's worth)
+        self._limits = dict(route_rate_limits or {})
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._clock = clock
+        self._rng = rng
+
+    def decide(
+        self, *, route: str, status_code: int, duration: float, faulted: bool
+    ) -> SampleReason | None:
+        """Why the request should be logged, or None to skip it"""
+        if status_code >= 500:
+            return "error"
+        if faulted:
+            return "fault"
+        if duration >= self.slow_seconds:
+            return "slow"
+        if self.sample_rate < 1.0 and self._rng() >= self.sample_rate:
+            return None
+        limit = self._limits.get(route)
+        if limit is not None and not self._take(route, limit):
+            return None
+        return "sampled"
+
+    def _take(self, route: str, rate: float) -> bool:
+        now = self._clock()
+        burst = max(1.0, rate)
+        tokens, last = self._buckets.get(route, (burst, now))
+        tokens = min(burst, tokens + (now - last) * rate)
+        if tokens < 1.0:
+            self._buckets[route] = (tokens, now)
+            return False
+        self._buckets[route] = (tokens - 1.0, now)
+        return True
+
+
+def parse_route_rate_limits(spec: str) -> dict[str, float]:
+    """
+    Parse "route=rate" pairs, e.g. "/api/health=1,/api/metrics=0.2".
+
+    Raises ValueError on malformed entries.
+    """
+    limits: dict[str, float] = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        route, sep, rate = item.rpartition("=")
+        if not sep or not route:
+            raise ValueError(f"Invalid route rate limit '{item}' (expected route=rate)")
+        limits[route.strip()] = float(rate)
+    return limits
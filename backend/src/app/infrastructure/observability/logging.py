@@ -3,28 +3,42 @@
 import logging
 import sys
 
-from pythonjsonlogger import jsonlogger
+from app.infrastructure.observability.json_formatter import FastJsonFormatter
+from app.infrastructure.observability.log_context import CorrelationFilter
+from app.infrastructure.observability.log_queue import (
+    DEFAULT_CAPACITY,
+    DEFAULT_OVERFLOW_POLICY,
+    OverflowPolicy,
+    QueueLogHandler,
+)
 
 
-def setup_logging(*, level: str = "INFO", json_format: bool = True) -> None:
+def setup_logging(
+    *,
+    level: str = "INFO",
+    json_format: bool = True,
+    queue_capacity: int = DEFAULT_CAPACITY,
+    overflow: OverflowPolicy = DEFAULT_OVERFLOW_POLICY,
+) -> QueueLogHandler | None:
     """
     Configure structured logging for the application.
 
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_format: If True, output JSON logs (for Loki). If False, human-readable.
+        queue_capacity: Records buffered for the background writer; 0 writes
+            synchronously on the calling thread.
+        overflow: What to lose when the queue is full (see log_queue).
+
+    Returns:
+        The queue handler, so callers can observe dropped records.
     """
     log_level = getattr(logging, level.upper(), logging.INFO)
 
     if json_format:
         # JSON format for machine parsing (Loki)
         log_handler = logging.StreamHandler(sys.stdout)
-        formatter = jsonlogger.JsonFormatter(  # type: ignore[no-untyped-call]
-            "%(asctime)s %(levelname)s %(name)s %(message)s "
-            "%(request_id)s %(trace_id)s %(span_id)s",
-            rename_fields={"levelname": "level", "asctime": "timestamp"},
-        )
-        log_handler.setFormatter(formatter)
+        log_handler.setFormatter(FastJsonFormatter())
     else:
         # Human-readable format for local dev
         log_handler = logging.StreamHandler(sys.stdout)
@@ -32,9 +46,25 @@ def setup_logging(*, level: str = "INFO", json_format: bool = True) -> None:
             logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         )
 
+    # Formatting and the stdout write move to a writer thread
+    queue_handler = (
+        QueueLogHandler(log_handler, capacity=queue_capacity, overflow=overflow)
+        if queue_capacity > 0
+        else None
+    )
+
+    # request_id/trace_id/span_id come from the log context; the filter runs
+    # on the root handler, i.e. on the logging thread before queueing
+    root_handler = queue_handler or log_handler
+    root_handler.addFilter(CorrelationFilter())
+
     root_logger = logging.getLogger()
+    for handler in root_logger.handlers:
+        if isinstance(handler, QueueLogHandler):
+            # Reconfigured: stop the previous writer after it drains
+            handler.close()
     root_logger.handlers = []  # Clear existing handlers
-    root_logger.addHandler(log_handler)
+    root_logger.addHandler(root_handler)
     root_logger.setLevel(log_level)
 
     # Set uvicorn loggers to use same configuration
@@ -42,3 +72,5 @@ def setup_logging(*, level: str = "INFO", json_format: bool = True) -> None:
         logger = logging.getLogger(logger_name)
         logger.handlers = []
         logger.propagate = True
+
+    return queue_handler
@@ -0,0 +1,118 @@
+"""Scenario metric event buffer - batches scenario observations into metrics"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Iterable, Iterator
+
+from app.application.ports.metrics import MetricsPort
+from app.application.simulator.events import MetricEvent, MetricLabels
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+# Pending events that trigger an immediate flush
+DEFAULT_MAX_PENDING = 1024
+
+_SeriesKey = tuple[str, MetricLabels]
+
+
+class MetricEventBuffer:
+    """
+    Per-process buffer between scenarios and the metrics port.
+
+    emit() only appends to a list, so requests never contend on the metric
+    children's locks. flush() aggregates the batch (counters summed, gauges
+    last-write-wins, histogram values observed in order) and applies one
+    update per series. Flushes happen on a background tick, when
+    `max_pending` events are waiting, and before each scrape.
+
+    Not thread-safe for emit(): call it from the event loop.
+    """
+
+    def __init__(
+        self,
+        metrics: MetricsPort,
+        *,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        self._metrics = metrics
+        self._interval = flush_interval_seconds
+        self._max_pending = max_pending
+        self._pending: list[MetricEvent] = []
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def emit(self, events: Iterable[MetricEvent]) -> None:
+        self._pending.extend(events)
+        if len(self._pending) >= self._max_pending:
+            self.flush()
+
+    def flush(self) -> int:
+        """Apply all pending events; returns how many were consumed"""
+        batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+
+        counters: dict[_SeriesKey, float] = {}
+        gauges: dict[_SeriesKey, float] = {}
+        observations: dict[_SeriesKey, list[float]] = {}
+        for event in batch:
+            key = (event.name, event.labels)
+            if event.kind == "inc":
+                counters[key] = counters.get(key, 0.0) + event.value
+            elif event.kind == "set":
+                gauges[key] = event.value
+            else:
+                observations.setdefault(key, []).append(event.value)
+
+        for (name, labels), amount in counters.items():
+            with _dropping_bad_events(name):
+                self._metrics.counter(name, _as_dict(labels)).inc(amount)
+        for (name, labels), value in gauges.items():
+            with _dropping_bad_events(name):
+                self._metrics.gauge(name, _as_dict(labels)).set(value)
+        for (name, labels), values in observations.items():
+            with _dropping_bad_events(name):
+                histogram = self._metrics.histogram(name, _as_dict(labels))
+                for value in values:
+                    histogram.observe(value)
+        return len(batch)
+
+    async def start(self) -> None:
+        """Start the periodic flush"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="metric-event-flush")
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and apply whatever is still pending"""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            self.flush()
+
+
+def _as_dict(labels: MetricLabels) -> dict[str, str] | None:
+    return dict(labels) if labels else None
+
+
+@contextlib.contextmanager
+def _dropping_bad_events(name: str) -> Iterator[None]:
+    # Events whose labels don't match the MetricSpec are dropped, never fatal
+    try:
+        yield
+    except Exception:
+        logger.warning("Dropping metric events for %s", name, exc_info=True)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, TypeVar
 
 from prometheus_client import (
+    CONTENT_TYPE_LATEST,
     REGISTRY,
     CollectorRegistry,
     Counter,
@@ -13,23 +16,76 @@ from prometheus_client import (
     Summary,
     generate_latest,
 )
+from prometheus_client.openmetrics import exposition as openmetrics_exposition
 
-from app.application.ports.metrics import MetricsPort
+from app.application.ports.metrics import (
+    CounterHandle,
+    GaugeHandle,
+    HistogramHandle,
+    MetricsPort,
+)
 
 if TYPE_CHECKING:
-    from app.application.simulator.models import MetricSpec
+    from app.application.simulator.models import GaugeMultiprocessMode, MetricSpec
+
+# Labelled children kept in the handle cache; older ones are re-resolved on use
+DEFAULT_CHILD_CACHE_SIZE = 4096
+
+# Multiprocess aggregation for scenario gauges that don't declare one: one
+# series per live worker, never a misleading sum
+DEFAULT_GAUGE_MULTIPROCESS_MODE: GaugeMultiprocessMode = "liveall"
+
+# Distinct label sets allowed per metric before new ones fold into OVERFLOW_LABEL
+DEFAULT_MAX_SERIES_PER_METRIC = 1000
+OVERFLOW_LABEL = "__other__"
+
+_ChildKey = tuple[str, tuple[tuple[str, str], ...]]
+_M = TypeVar("_M", Counter, Gauge, Histogram)
+
+
+class _NoopHandle:
+    """Handle for unknown metric names (matches the silent no-op of the port methods)"""
+
+    def inc(self, amount: float = 1, /) -> None:
+        pass
+
+    def observe(self, value: float, /, exemplar: dict[str, str] | None = None) -> None:
+        pass
+
+    def set(self, value: float, /) -> None:
+        pass
+
+
+_NOOP = _NoopHandle()
 
 
 class PrometheusMetrics(MetricsPort):
     """Prometheus implementation of metrics port"""
 
-    def __init__(self, registry: CollectorRegistry | None = None) -> None:
+    def __init__(
+        self,
+        registry: CollectorRegistry | None = None,
+        *,
+        child_cache_size: int = DEFAULT_CHILD_CACHE_SIZE,
+        max_series_per_metric: int = DEFAULT_MAX_SERIES_PER_METRIC,
+        series_limits: dict[str, int] | None = None,
+    ) -> None:
         self.registry = registry or REGISTRY
         self._counters: dict[str, Counter] = {}
         self._histograms: dict[str, Histogram] = {}
         self._gauges: dict[str, Gauge] = {}
         self._summaries: dict[str, Summary] = {}
         self._registered_scenario_metrics: set[str] = set()  # Track registered scenarios
+        # LRU of labelled children: labels(**kw) validates, builds a tuple and
+        # takes the metric lock on every call, so resolve each label set once
+        self._children: OrderedDict[_ChildKey, Counter | Gauge | Histogram] = OrderedDict()
+        self._child_cache_size = child_cache_size
+        self._children_lock = threading.Lock()
+        # Cardinality cap: label sets admitted per metric (never shrinks, like
+        # the series themselves); per-metric overrides in series_limits
+        self._series: dict[str, set[tuple[tuple[str, str], ...]]] = {}
+        self._max_series = max_series_per_metric
+        self._series_limits = series_limits or {}
 
         # Pre-register application metrics
         self._register_application_metrics()
@@ -51,6 +107,14 @@ class PrometheusMetrics(MetricsPort):
             registry=self.registry,
         )
 
+        # Opt-in Server-Timing breakdown (SERVER_TIMING=true)
+        self._histograms["http_request_phase_duration_seconds"] = Histogram(
+            "http_request_phase_duration_seconds",
+            "HTTP request time by phase (middleware, plan, inject, handler, serialize)",
+            ["endpoint", "phase"],
+            registry=self.registry,
+        )
+
         # Simulator metrics
         self._counters["simulator_scenarios_active"] = Counter(
             "simulator_scenarios_active_total",
@@ -64,12 +128,93 @@ class PrometheusMetrics(MetricsPort):
             "Currently enabled scenarios (1=enabled, 0=disabled)",
             ["scenario_name"],
             registry=self.registry,
+            # Set only by the worker that served the enable/disable request
+            multiprocess_mode="mostrecent",
         )
 
         self._histograms["simulator_effect_duration_seconds"] = Histogram(
             "simulator_effect_duration_seconds",
             "Time taken to apply scenario effects",
-            ["scenario_name"],
+            ["scenario_name", "effect_type"],
+            registry=self.registry,
+        )
+
+        self._series_dropped = Counter(
+            "metrics_series_dropped_total",
+            "Label sets folded into the __other__ series after a metric hit its cardinality cap",
+            ["metric"],
+            registry=self.registry,
+        )
+
+        self._counters["log_records_dropped_total"] = Counter(
+            "log_records_dropped_total",
+            "Log records dropped or coalesced because the log queue was full",
+            ["reason"],
+            registry=self.registry,
+        )
+
+        # Database metrics (recorded by the engine hooks, see db/effects.py)
+        self._counters["db_statements_total"] = Counter(
+            "db_statements_total",
+            "SQL statements executed",
+            ["operation", "status"],
+            registry=self.registry,
+        )
+
+        self._histograms["db_statement_duration_seconds"] = Histogram(
+            "db_statement_duration_seconds",
+            "SQL statement execution time in seconds, including injected delays",
+            ["operation"],
+            registry=self.registry,
+        )
+
+        # Per request (see db/query_stats.py); only requests that ran statements
+        self._histograms["db_queries_per_request"] = Histogram(
+            "db_queries_per_request",
+            "SQL statements executed per HTTP request",
+            ["endpoint"],
+            buckets=[1, 2, 5, 10, 20, 50, 100, 200, 500],
+            registry=self.registry,
+        )
+
+        self._histograms["db_query_seconds_per_request"] = Histogram(
+            "db_query_seconds_per_request",
+            "Total SQL statement time per HTTP request in seconds",
+            ["endpoint"],
+            registry=self.registry,
+        )
+
+        self._counters["db_n_plus_one_total"] = Counter(
+            "db_n_plus_one_total",
+            "Requests that repeated one SELECT at least the N+1 threshold times",
+            ["endpoint"],
+            registry=self.registry,
+        )
+
+        # Connection pool (see db/pool.py); gauges sum across live workers
+        self._gauges["db_pool_checked_out"] = Gauge(
+            "db_pool_checked_out",
+            "Pooled database connections currently checked out",
+            registry=self.registry,
+            multiprocess_mode="livesum",
+        )
+
+        self._gauges["db_pool_overflow"] = Gauge(
+            "db_pool_overflow",
+            "Checked-out connections beyond pool_size",
+            registry=self.registry,
+            multiprocess_mode="livesum",
+        )
+
+        self._histograms["db_pool_wait_seconds"] = Histogram(
+            "db_pool_wait_seconds",
+            "Time to check a connection out of the pool",
+            registry=self.registry,
+        )
+
+        self._histograms["db_connect_seconds"] = Histogram(
+            "db_connect_seconds",
+            "Time to open a new database connection",
             registry=self.registry,
         )
 
@@ -119,6 +264,9 @@ class PrometheusMetrics(MetricsPort):
                         metric_spec.description,
                         metric_spec.labels,
                         registry=self.registry,
+                        multiprocess_mode=(
+                            metric_spec.multiprocess_mode or DEFAULT_GAUGE_MULTIPROCESS_MODE
+                        ),
                     )
                 elif metric_spec.type == "histogram":
                     # Use custom buckets if specified, otherwise use default
@@ -152,28 +300,78 @@ class PrometheusMetrics(MetricsPort):
         self._registered_scenario_metrics.add(scenario_name)
 
     def increment_counter(self, name: str, labels: dict[str, str] | None = None) -> None:
-        if name in self._counters:
-            if labels:
-                self._counters[name].labels(**labels).inc()
-            else:
-                self._counters[name].inc()
+        self.counter(name, labels).inc()
 
     def observe_histogram(
         self, name: str, value: float, labels: dict[str, str] | None = None
     ) -> None:
-        if name in self._histograms:
-            if labels:
-                self._histograms[name].labels(**labels).observe(value)
-            else:
-                self._histograms[name].observe(value)
+        self.histogram(name, labels).observe(value)
 
     def set_gauge(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
-        if name in self._gauges:
-            if labels:
-                self._gauges[name].labels(**labels).set(value)
-            else:
-                self._gauges[name].set(value)
+        self.gauge(name, labels).set(value)
+
+    def counter(self, name: str, labels: dict[str, str] | None = None) -> CounterHandle:
+        metric = self._counters.get(name)
+        if metric is None:
+            return _NOOP
+        return self._child(name, metric, labels) if labels else metric
+
+    def histogram(self, name: str, labels: dict[str, str] | None = None) -> HistogramHandle:
+        metric = self._histograms.get(name)
+        if metric is None:
+            return _NOOP
+        return self._child(name, metric, labels) if labels else metric
+
+    def gauge(self, name: str, labels: dict[str, str] | None = None) -> GaugeHandle:
+        metric = self._gauges.get(name)
+        if metric is None:
+            return _NOOP
+        return self._child(name, metric, labels) if labels else metric
+
+    def _child(self, name: str, metric: _M, labels: dict[str, str]) -> _M:
+        """Labelled child from the LRU, resolving it on a miss"""
+        key = (name, tuple(labels.items()))
+        child = self._children.get(key)
+        if child is not None:
+            try:
+                self._children.move_to_end(key)
+            except KeyError:
+                # Evicted concurrently; the child itself is still valid
+                pass
+            return child  # type: ignore[return-value]
+
+        if self._admit(name, labels):
+            child = metric.labels(**labels)
+        else:
+            # Counted once per cache miss, i.e. roughly once per dropped label set
+            self._series_dropped.labels(metric=name).inc()
+            child = metric.labels(**{k: OVERFLOW_LABEL for k in labels})
+        with self._children_lock:
+            self._children[key] = child
+            if len(self._children) > self._child_cache_size:
+                self._children.popitem(last=False)
+        return child
+
+    def _admit(self, name: str, labels: dict[str, str]) -> bool:
+        """Whether a label set may have its own series under the metric's cap"""
+        label_set = tuple(sorted(labels.items()))
+        with self._children_lock:
+            series = self._series.setdefault(name, set())
+            if label_set in series:
+                return True
+            if len(series) >= self._series_limits.get(name, self._max_series):
+                return False
+            series.add(label_set)
+            return True
 
     def get_metrics(self) -> bytes:
         """Generate metrics in Prometheus format"""
         return generate_latest(self.registry)
+
+    def export(self, *, openmetrics: bool = False) -> tuple[bytes, str]:
+        if openmetrics:
+            return (
+                openmetrics_exposition.generate_latest(self.registry),  # type: ignore[no-untyped-call]
+                openmetrics_exposition.CONTENT_TYPE_LATEST,
+            )
+        return generate_latest(self.registry), CONTENT_TYPE_LATEST
@@ -3,6 +3,7 @@
 import logging
 import time
 from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
 
 from fastapi import Request, Response
 from opentelemetry import trace
@@ -10,27 +11,73 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
 from app.application.ports.metrics import MetricsPort
+from app.infrastructure.db.query_stats import (
+    DEFAULT_N_PLUS_ONE_THRESHOLD,
+    RequestQueries,
+    bind_queries,
+    reset_queries,
+)
+from app.infrastructure.observability.impact import ImpactAnalyzer
+from app.infrastructure.observability.latency import LatencyRecorder
+from app.infrastructure.observability.log_context import bind_correlation, reset_correlation
+from app.infrastructure.observability.log_sampling import RequestLogSampler
+from app.infrastructure.observability.routes import is_control_route, route_template
+from app.infrastructure.observability.server_timing import (
+    RequestTimings,
+    bind_timings,
+    reset_timings,
+)
 
 logger = logging.getLogger(__name__)
 
+# Requests at least this slow carry their trace ID as a duration exemplar
+DEFAULT_EXEMPLAR_MIN_SECONDS = 0.1
+
 
 class ObservabilityMiddleware(BaseHTTPMiddleware):
     """
     Enriches requests with observability context.
 
-    - Adds trace_id and span_id to logs
-    - Records HTTP metrics
-    - Correlates with request_id
+    - Binds trace_id and span_id into the log context for the request, so
+      every record logged while handling it carries them
+    - Logs one "Request completed" record (sampled when a sampler is given)
+    - Records HTTP metrics, with trace ID exemplars on slow sampled requests
+    - Records latency per route and applied scenario (when a recorder is given)
+    - Feeds scenario impact analytics (when an analyzer is given); neither
+      covers /api/metrics or /api/sim/* requests
+    - Adds a Server-Timing header and per-phase histograms (opt-in)
+    - Counts the DB statements of the request (see db/query_stats.py) and
+      flags suspected N+1 query patterns
+
+    A request whose route raises is recorded as the 500 the server error
+    middleware answers with, then the exception propagates.
     """
 
-    def __init__(self, app: ASGIApp, metrics: MetricsPort) -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: MetricsPort,
+        latency: LatencyRecorder | None = None,
+        impact: ImpactAnalyzer | None = None,
+        exemplar_min_seconds: float = DEFAULT_EXEMPLAR_MIN_SECONDS,
+        log_sampler: RequestLogSampler | None = None,
+        server_timing: bool = False,
+        n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD,
+    ) -> None:
         super().__init__(app)
         self.metrics = metrics
+        self.latency = latency
+        self.impact = impact
+        self.exemplar_min_seconds = exemplar_min_seconds
+        self.log_sampler = log_sampler
+        self.server_timing = server_timing
+        self.n_plus_one_threshold = n_plus_one_threshold
 
     async def dispatch(
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
     ) -> Response:
-        start_time = time.time()
+        started_at = time.time()
+        start_time = time.perf_counter()
 
         # Get trace context
         span = trace.get_current_span()
@@ -38,45 +85,138 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
         trace_id = format(span_context.trace_id, "032x") if span_context.is_valid else "none"
         span_id = format(span_context.span_id, "016x") if span_context.is_valid else "none"
 
-        # Get request_id from RequestIdMiddleware
-        request_id = getattr(request.state, "request_id", "unknown")
+        # Process request; the context is copied into the downstream task
+        token = bind_correlation(trace_id=trace_id, span_id=span_id)
+        timings = RequestTimings() if self.server_timing else None
+        timings_token = bind_timings(timings) if timings is not None else None
+        queries = RequestQueries()
+        queries_token = bind_queries(queries)
+        try:
+            try:
+                response = await call_next(request)
+            except Exception as exc:
+                # The route raised (e.g. an injected DB fault); the server error
+                # middleware answers 500, so record the request as that
+                self._record(request, 500, started_at, start_time, trace_id, span_context, exc)
+                if queries.count:
+                    self._record_queries(request, queries)
+                raise
+            self._record(
+                request, response.status_code, started_at, start_time, trace_id, span_context
+            )
+            if queries.count:
+                self._record_queries(request, queries)
+            if timings is not None:
+                self._add_server_timing(request, response, timings, start_time)
+        finally:
+            reset_queries(queries_token)
+            if timings_token is not None:
+                reset_timings(timings_token)
+            reset_correlation(token)
+        return response
 
-        # Enrich logging context
-        logger.info(
-            "Request started",
+    def _add_server_timing(
+        self, request: Request, response: Response, timings: RequestTimings, start_time: float
+    ) -> None:
+        """Server-Timing header plus one phase histogram observation per phase"""
+        total = time.perf_counter() - start_time
+        endpoint = route_template(request.scope)
+        for phase, seconds in timings.breakdown(total).items():
+            self.metrics.histogram(
+                "http_request_phase_duration_seconds", {"endpoint": endpoint, "phase": phase}
+            ).observe(seconds)
+        response.headers["Server-Timing"] = timings.header(total)
+
+    def _record_queries(self, request: Request, queries: RequestQueries) -> None:
+        """Query count and DB time per route; requests without statements are skipped"""
+        endpoint = route_template(request.scope)
+        labels = {"endpoint": endpoint}
+        self.metrics.histogram("db_queries_per_request", labels).observe(queries.count)
+        self.metrics.histogram("db_query_seconds_per_request", labels).observe(queries.seconds)
+        suspect = queries.n_plus_one(self.n_plus_one_threshold)
+        if suspect is None:
+            return
+        statement, repeats = suspect
+        self.metrics.counter("db_n_plus_one_total", labels).inc()
+        logger.warning(
+            "Suspected N+1 query pattern",
             extra={
-                "request_id": request_id,
-                "trace_id": trace_id,
-                "span_id": span_id,
-                "method": request.method,
-                "path": str(request.url.path),
+                "route": endpoint,
+                "statement": statement,
+                "repeats": repeats,
+                "queries": queries.count,
             },
         )
 
-        # Process request
-        response = await call_next(request)
-
-        # Record metrics
-        duration = time.time() - start_time
+    def _record(
+        self,
+        request: Request,
+        status_code: int,
+        started_at: float,
+        start_time: float,
+        trace_id: str,
+        span_context: trace.SpanContext,
+        exc: Exception | None = None,
+    ) -> None:
+        """Metrics, latency analytics and the completion log for one request"""
+        duration = time.perf_counter() - start_time
+        # Route template, not the raw path: keeps the label set bounded
+        endpoint = route_template(request.scope)
         labels = {
             "method": request.method,
-            "endpoint": str(request.url.path),
-            "status": str(response.status_code),
+            "endpoint": endpoint,
+            "status": str(status_code),
         }
 
-        self.metrics.increment_counter("http_requests_total", labels)
-        self.metrics.observe_histogram("http_request_duration_seconds", duration, labels)
-
-        # Log completion
-        logger.info(
-            "Request completed",
-            extra={
-                "request_id": request_id,
-                "trace_id": trace_id,
-                "span_id": span_id,
-                "status_code": response.status_code,
-                "duration_seconds": duration,
-            },
+        self.metrics.counter("http_requests_total", labels).inc()
+        # Only sampled traces exist in Tempo; fast requests aren't worth the lookup
+        exemplar = (
+            {"trace_id": trace_id}
+            if span_context.trace_flags.sampled and duration >= self.exemplar_min_seconds
+            else None
         )
-
-        return response
+        self.metrics.histogram("http_request_duration_seconds", labels).observe(
+            duration, exemplar=exemplar
+        )
+        # Set by SimulatorInjectionMiddleware; absent for /api/sim requests
+        scenarios = getattr(request.state, "sim_scenarios", ())
+        # Scenario analytics cover workload routes only: scrapes and the
+        # dashboard polling /api/sim would dilute the per-scenario segments
+        if not is_control_route(endpoint):
+            if self.latency is not None:
+                self.latency.record(endpoint, scenarios, duration)
+            active = getattr(request.state, "sim_active", None)
+            if self.impact is not None and active is not None:
+                self.impact.record(active, duration, error=status_code >= 500)
+
+        # One record per kept request (errors, faults and slow requests always)
+        sampler = self.log_sampler
+        reason = (
+            sampler.decide(
+                route=endpoint,
+                status_code=status_code,
+                duration=duration,
+                faulted=bool(scenarios),
+            )
+            if sampler is not None
+            else "sampled"
+        )
+        if reason is not None:
+            # A raised request is an error record carrying its traceback
+            logger.log(
+                logging.INFO if exc is None else logging.ERROR,
+                "Request completed",
+                extra={
+                    "method": request.method,
+                    "path": request.url.path,
+                    "route": endpoint,
+                    "status_code": status_code,
+                    "started_at": datetime.fromtimestamp(started_at, UTC).isoformat(),
+                    "duration_seconds": duration,
+                    "sample_reason": reason,
+                    "sample_rate": (
+                        sampler.sample_rate if sampler is not None and reason == "sampled" else 1.0
+                    ),
+                },
+                exc_info=exc,
+            )
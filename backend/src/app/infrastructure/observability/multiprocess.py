@@ -0,0 +1,111 @@
+"""Prometheus multiprocess metrics - for multi-worker uvicorn/gunicorn
+
+Each worker writes metric values to mmap'd files in PROMETHEUS_MULTIPROC_DIR
+(prometheus_client switches to file-backed values when that variable is set
+before it is imported). At scrape time, whichever worker serves the request
+aggregates every worker's files, so counters no longer depend on which worker
+Prometheus happens to hit.
+
+The directory must be emptied before the server (not each worker) starts.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest, multiprocess
+from prometheus_client.openmetrics import exposition as openmetrics_exposition
+
+from app.infrastructure.observability.metrics import (
+    DEFAULT_CHILD_CACHE_SIZE,
+    DEFAULT_MAX_SERIES_PER_METRIC,
+    PrometheusMetrics,
+)
+
+logger = logging.getLogger(__name__)
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+class MultiProcessPrometheusMetrics(PrometheusMetrics):
+    """
+    PrometheusMetrics whose exposition aggregates all worker processes.
+
+    Updates are unchanged (values land in this worker's files). export()
+    first reaps files left by workers that have exited, then collects
+    through a MultiProcessCollector. Counters and histograms from dead
+    workers are kept so totals never go backwards; only their "live*" gauge
+    files are removed.
+    """
+
+    def __init__(
+        self,
+        multiproc_dir: str | os.PathLike[str],
+        *,
+        child_cache_size: int = DEFAULT_CHILD_CACHE_SIZE,
+        max_series_per_metric: int = DEFAULT_MAX_SERIES_PER_METRIC,
+        series_limits: dict[str, int] | None = None,
+    ) -> None:
+        self.multiproc_dir = Path(multiproc_dir)
+        if not self.multiproc_dir.is_dir():
+            raise RuntimeError(f"{MULTIPROC_DIR_ENV} '{self.multiproc_dir}' is not a directory")
+        self._reaped: set[int] = set()
+        # Per-process registry only tracks which metrics exist; values are in files
+        super().__init__(
+            registry=CollectorRegistry(),
+            child_cache_size=child_cache_size,
+            max_series_per_metric=max_series_per_metric,
+            series_limits=series_limits,
+        )
+
+    def get_metrics(self) -> bytes:
+        return self.export()[0]
+
+    def export(self, *, openmetrics: bool = False) -> tuple[bytes, str]:
+        self.cleanup_dead_workers()
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(  # type: ignore[no-untyped-call]
+            registry, path=str(self.multiproc_dir)
+        )
+        if openmetrics:
+            return (
+                openmetrics_exposition.generate_latest(registry),  # type: ignore[no-untyped-call]
+                openmetrics_exposition.CONTENT_TYPE_LATEST,
+            )
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+
+    def cleanup_dead_workers(self) -> list[int]:
+        """Remove live-gauge files of exited workers; returns the reaped pids"""
+        dead: list[int] = []
+        for pid in sorted(worker_pids(self.multiproc_dir) - self._reaped):
+            if pid == os.getpid() or _pid_alive(pid):
+                continue
+            multiprocess.mark_process_dead(pid, str(self.multiproc_dir))  # type: ignore[no-untyped-call]
+            self._reaped.add(pid)
+            dead.append(pid)
+        if dead:
+            logger.info("Reaped metrics files of exited workers", extra={"pids": dead})
+        return dead
+
+
+def worker_pids(multiproc_dir: Path) -> set[int]:
+    """Pids that have metric files in the directory (files are <kind>_<pid>.db)"""
+    pids: set[int] = set()
+    for path in multiproc_dir.glob("*.db"):
+        suffix = path.stem.rsplit("_", 1)[-1]
+        if suffix.isdigit():
+            pids.add(int(suffix))
+    return pids
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists but owned by another user
+        return True
+    return True
@@ -0,0 +1,70 @@
+"""Route templates - bounded endpoint labels for metrics and logs"""
+
+from __future__ import annotations
+
+import weakref
+from collections.abc import Callable
+
+from starlette.routing import BaseRoute, Match
+from starlette.types import Scope
+
+# Label for requests that matched no route (404s, scans)
+UNMATCHED_ROUTE = "__unmatched__"
+# Scrapes and simulator control: not workload traffic
+_CONTROL_ROUTE = "/api/metrics"
+_CONTROL_PREFIX = "/api/sim/"
+
+# app -> endpoint -> routes serving it; built lazily from app.routes
+_route_index: weakref.WeakKeyDictionary[object, dict[Callable[..., object], list[BaseRoute]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Matched route template for a request, e.g. "/api/items/{item_id}".
+
+    The router records the matched endpoint in the scope; the template is
+    looked up from it rather than re-matching the path. Requests that matched
+    nothing share a single UNMATCHED_ROUTE label.
+    """
+    endpoint = scope.get("endpoint")
+    app = scope.get("app")
+    if endpoint is None or app is None:
+        return UNMATCHED_ROUTE
+
+    index = _route_index.get(app)
+    if index is None or endpoint not in index:
+        # First request, or routes were added after the index was built
+        index = _build_index(app)
+        _route_index[app] = index
+
+    routes = index.get(endpoint)
+    if not routes:
+        return UNMATCHED_ROUTE
+    if len(routes) == 1:
+        return _template(routes[0])
+    # Same endpoint mounted on several paths: re-match only among those
+    for route in routes:
+        match, _ = route.matches(scope)
+        if match is Match.FULL:
+            return _template(route)
+    return UNMATCHED_ROUTE
+
+
+def is_control_route(template: str) -> bool:
+    """Whether a route template is a metrics scrape or simulator-control route"""
+    return template == _CONTROL_ROUTE or template.startswith(_CONTROL_PREFIX)
+
+
+def _build_index(app: object) -> dict[Callable[..., object], list[BaseRoute]]:
+    index: dict[Callable[..., object], list[BaseRoute]] = {}
+    for route in getattr(app, "routes", []):
+        endpoint = getattr(route, "endpoint", None) or getattr(route, "app", None)
+        if endpoint is not None:
+            index.setdefault(endpoint, []).append(route)
+    return index
+
+
+def _template(route: BaseRoute) -> str:
+    return str(getattr(route, "path_format", None) or getattr(route, "path", UNMATCHED_ROUTE))
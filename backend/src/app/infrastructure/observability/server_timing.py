@@ -0,0 +1,133 @@
+"""Request phase timing - Server-Timing header breakdown
+
+When enabled, ObservabilityMiddleware binds a RequestTimings for the request
+in a contextvar; the layers below add the time they spend to it:
+
+- plan: looking up active scenarios and building the effect plan
+- inject: executing injected effects (delays, CPU burn, forced errors)
+- handler: the endpoint function itself (TimedRoute)
+- serialize: the rest of the route - request validation, dependency
+  resolution and response serialization (TimedRoute)
+- middleware: whatever is left of the total - middleware stack and routing
+
+Each layer reads the contextvar, so nothing is threaded through signatures
+and the cost with timing disabled is one contextvar lookup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from collections.abc import Callable, Coroutine, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+PHASES = ("middleware", "plan", "inject", "handler", "serialize")
+MEASURED_PHASES = PHASES[1:]
+
+
+class RequestTimings:
+    """Seconds spent per phase of one request"""
+
+    __slots__ = ("phases",)
+
+    def __init__(self) -> None:
+        self.phases = dict.fromkeys(MEASURED_PHASES, 0.0)
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] += seconds
+
+    def breakdown(self, total: float) -> dict[str, float]:
+        """All phases, with middleware as the unattributed remainder of `total`"""
+        measured = sum(self.phases.values())
+        return {"middleware": max(0.0, total - measured), **self.phases}
+
+    def header(self, total: float) -> str:
+        """Server-Timing header value, durations in milliseconds"""
+        entries = [
+            f"{name};dur={seconds * 1000:.2f}" for name, seconds in self.breakdown(total).items()
+        ]
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def bind_timings(timings: RequestTimings) -> Token[RequestTimings | None]:
+    return _current.set(timings)
+
+
+def reset_timings(token: Token[RequestTimings | None]) -> None:
+    _current.reset(token)
+
+
+def current_timings() -> RequestTimings | None:
+    return _current.get()
+
+
+@contextmanager
+def timed_phase(phase: str) -> Iterator[None]:
+    """Add the block's duration to `phase` when timing is enabled"""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - start)
+
+
+class TimedRoute(APIRoute):
+    """
+    APIRoute that splits route time into handler and serialize phases.
+
+    Use as `APIRouter(route_class=TimedRoute)`. The endpoint is wrapped on the
+    dependant only, so signature introspection and OpenAPI are unaffected.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        self.dependant.call = _timed_endpoint(self.dependant.call)
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            timings = _current.get()
+            if timings is None:
+                return await handler(request)
+            start = time.perf_counter()
+            handler_before = timings.phases["handler"]
+            try:
+                return await handler(request)
+            finally:
+                route_seconds = time.perf_counter() - start
+                handler_seconds = timings.phases["handler"] - handler_before
+                timings.add("serialize", max(0.0, route_seconds - handler_seconds))
+
+        return timed_handler
+
+
+def _timed_endpoint(call: Callable[..., Any] | None) -> Callable[..., Any] | None:
+    if call is None:
+        return None
+    if asyncio.iscoroutinefunction(call):
+
+        @functools.wraps(call)
+        async def timed_async(*args: Any, **kwargs: Any) -> Any:
+            with timed_phase("handler"):
+                return await call(*args, **kwargs)
+
+        return timed_async
+
+    @functools.wraps(call)
+    def timed_sync(*args: Any, **kwargs: Any) -> Any:
+        with timed_phase("handler"):
+            return call(*args, **kwargs)
+
+    return timed_sync
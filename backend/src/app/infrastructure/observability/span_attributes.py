@@ -0,0 +1,8 @@
+"""Span attribute names shared by request handling and trace sampling
+
+Kept free of OpenTelemetry SDK imports so the request path can set them
+without loading the tracing adapter.
+"""
+
+# Scenario names whose effects were applied to the request
+SIM_SCENARIOS_ATTRIBUTE = "sim.scenarios"
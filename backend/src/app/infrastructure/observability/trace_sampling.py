@@ -0,0 +1,155 @@
+"""Trace sampling - head ratio sampling plus in-process tail sampling
+
+Head sampling (ParentBased(TraceIdRatioBased)) decides at the root span
+whether a trace is recorded at all; downstream services follow the caller's
+decision via traceparent.
+
+Tail sampling runs after recording: spans are buffered per trace until the
+local root span ends, then the whole trace is exported only if it is worth
+looking at - an errored span, injected scenario effects, or a root slower
+than `slow_seconds`. Everything else is dropped before it reaches the
+exporter. Decisions are remembered for `window_seconds` so spans ending
+after their root follow the same decision; traces whose root never ends
+locally are decided on what arrived once the window passes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Literal
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBased, Sampler, TraceIdRatioBased
+from opentelemetry.trace import StatusCode
+
+from app.infrastructure.observability.span_attributes import SIM_SCENARIOS_ATTRIBUTE
+
+DEFAULT_SAMPLE_RATIO = 1.0
+# Matches DEFAULT_EXEMPLAR_MIN_SECONDS, so duration exemplars point at kept traces
+DEFAULT_SLOW_SECONDS = 0.1
+DEFAULT_WINDOW_SECONDS = 5.0
+DEFAULT_MAX_TRACES = 10_000
+
+TailReason = Literal["error", "fault", "slow"]
+
+
+def build_sampler(ratio: float = DEFAULT_SAMPLE_RATIO) -> Sampler:
+    """Sample root spans at `ratio`; child spans follow their parent"""
+    if not 0.0 <= ratio <= 1.0:
+        raise ValueError("trace sample ratio must be between 0 and 1")
+    return ParentBased(TraceIdRatioBased(ratio))
+
+
+@dataclass(slots=True)
+class _PendingTrace:
+    expires: float
+    spans: list[ReadableSpan] = field(default_factory=list)
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """
+    Buffers finished spans per trace and forwards kept traces to `delegate`.
+
+    `delegate` is the exporting processor (normally a BatchSpanProcessor).
+    on_end() may run on any thread; the buffers are guarded by a lock and
+    the delegate is called outside it. `decisions` counts traces by reason,
+    plus "dropped".
+    """
+
+    def __init__(
+        self,
+        delegate: SpanProcessor,
+        *,
+        slow_seconds: float = DEFAULT_SLOW_SECONDS,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        max_traces: int = DEFAULT_MAX_TRACES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._delegate = delegate
+        self._slow_ns = int(slow_seconds * 1e9)
+        self._window = window_seconds
+        self._max_traces = max_traces
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Insertion order is expiry order: both use the same window
+        self._pending: OrderedDict[int, _PendingTrace] = OrderedDict()
+        self._decided: OrderedDict[int, tuple[bool, float]] = OrderedDict()
+        self.decisions: dict[str, int] = {}
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        self._delegate.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if span.context is None:
+            return
+        trace_id = span.context.trace_id
+        now = self._clock()
+        with self._lock:
+            forward = self._expire(now)
+            decided = self._decided.get(trace_id)
+            if decided is not None:
+                if decided[0]:
+                    forward.append(span)
+            else:
+                pending = self._pending.get(trace_id)
+                if pending is None:
+                    pending = self._pending[trace_id] = _PendingTrace(now + self._window)
+                pending.spans.append(span)
+                if span.parent is None or span.parent.is_remote:
+                    # Local root ended: the request is complete
+                    forward += self._decide(trace_id, now)
+                elif len(self._pending) > self._max_traces:
+                    forward += self._decide(next(iter(self._pending)), now)
+        for kept in forward:
+            self._delegate.on_end(kept)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            forward: list[ReadableSpan] = []
+            while self._pending:
+                forward += self._decide(next(iter(self._pending)), self._clock())
+        for kept in forward:
+            self._delegate.on_end(kept)
+        self._delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._delegate.force_flush(timeout_millis)
+
+    def _expire(self, now: float) -> list[ReadableSpan]:
+        """Decide traces whose window passed; forget old decisions"""
+        forward: list[ReadableSpan] = []
+        while self._pending:
+            trace_id, pending = next(iter(self._pending.items()))
+            if pending.expires > now:
+                break
+            forward += self._decide(trace_id, now)
+        while self._decided:
+            trace_id, (_, expires) = next(iter(self._decided.items()))
+            if expires > now:
+                break
+            del self._decided[trace_id]
+        return forward
+
+    def _decide(self, trace_id: int, now: float) -> list[ReadableSpan]:
+        spans = self._pending.pop(trace_id).spans
+        reason = self._reason(spans)
+        key = reason or "dropped"
+        self.decisions[key] = self.decisions.get(key, 0) + 1
+        self._decided[trace_id] = (reason is not None, now + self._window)
+        return spans if reason is not None else []
+
+    def _reason(self, spans: Sequence[ReadableSpan]) -> TailReason | None:
+        if any(s.status.status_code is StatusCode.ERROR for s in spans):
+            return "error"
+        if any(s.attributes and SIM_SCENARIOS_ATTRIBUTE in s.attributes for s in spans):
+            return "fault"
+        for s in spans:
+            if s.start_time is not None and s.end_time is not None:
+                if s.end_time - s.start_time >= self._slow_ns:
+                    return "slow"
+        return None
@@ -14,15 +14,28 @@ from opentelemetry.instrumentation.sqlalchemy import (
     SQLAlchemyInstrumentor,
 )
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from sqlalchemy.engine import Engine
 
+from app.infrastructure.observability.trace_sampling import (
+    DEFAULT_SAMPLE_RATIO,
+    DEFAULT_SLOW_SECONDS,
+    DEFAULT_WINDOW_SECONDS,
+    TailSamplingSpanProcessor,
+    build_sampler,
+)
+
 
 def setup_tracing(app_name: str = "systems-design-lab-backend") -> None:
     """
     Configure OpenTelemetry tracing with Tempo backend.
 
+    Root spans are sampled at OTEL_TRACES_SAMPLER_ARG (0..1, default 1);
+    child spans follow their parent. TRACE_TAIL_SAMPLING=true additionally
+    exports only errored, fault-injected or slow (TRACE_SLOW_SECONDS) traces,
+    buffered for up to TRACE_TAIL_WINDOW_SECONDS.
+
     Args:
         app_name: Service name for tracing
     """
@@ -38,8 +51,9 @@ def setup_tracing(app_name: str = "systems-design-lab-backend") -> None:
         }
     )
 
-    # Create tracer provider
-    provider = TracerProvider(resource=resource)
+    # Create tracer provider with parent-based ratio sampling
+    ratio = float(os.getenv("OTEL_TRACES_SAMPLER_ARG", str(DEFAULT_SAMPLE_RATIO)))
+    provider = TracerProvider(resource=resource, sampler=build_sampler(ratio))
 
     # OTLP exporter to Tempo
     otlp_endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://tempo:4317")
@@ -48,7 +62,16 @@ def setup_tracing(app_name: str = "systems-design-lab-backend") -> None:
         otlp_exporter = OTLPSpanExporter(endpoint=otlp_endpoint, insecure=True)
 
         # Batch processor for efficiency
-        processor = BatchSpanProcessor(otlp_exporter)
+        processor: SpanProcessor = BatchSpanProcessor(otlp_exporter)
+        if os.getenv("TRACE_TAIL_SAMPLING", "false").lower() == "true":
+            # Keep only traces worth looking at; the rest never reach the exporter
+            processor = TailSamplingSpanProcessor(
+                processor,
+                slow_seconds=float(os.getenv("TRACE_SLOW_SECONDS", str(DEFAULT_SLOW_SECONDS))),
+                window_seconds=float(
+                    os.getenv("TRACE_TAIL_WINDOW_SECONDS", str(DEFAULT_WINDOW_SECONDS))
+                ),
+            )
         provider.add_span_processor(processor)
 
         # Set as global tracer provider
@@ -31,3 +31,18 @@ class InMemorySimulatorStore(SimulatorStore):
 
     def get(self, name: str) -> ActiveScenarioState | None:
         return self._store.get(name)
+
+    def apply_batch(
+        self,
+        *,
+        upserts: list[ActiveScenarioState],
+        removals: list[str],
+        clear: bool = False,
+    ) -> None:
+        # Build the new state aside and swap it in with a single assignment
+        store = {} if clear else dict(self._store)
+        for name in removals:
+            store.pop(name, None)
+        for state in upserts:
+            store[state.name] = state
+        self._store = store
@@ -0,0 +1,350 @@
+"""SQL-backed Simulator Store Implementation"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Literal
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    delete,
+    insert,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.application.ports.simulator_store import SimulatorStore
+from app.application.simulator.models import ActiveScenarioState
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel used to broadcast version bumps to other processes
+NOTIFY_CHANNEL = "simulator_state"
+
+metadata = MetaData()
+
+active_scenarios_table = Table(
+    "simulator_active_scenarios",
+    metadata,
+    Column("name", String(128), primary_key=True),
+    Column("parameters", JSON, nullable=False),
+    Column("enabled_at", DateTime(timezone=True), nullable=False),
+    Column("expires_at", DateTime(timezone=True), nullable=True),
+)
+
+# Single-row table; every committed change bumps the version so other
+# processes know their local cache is stale
+state_version_table = Table(
+    "simulator_state_version",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("version", Integer, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class _WriteOp:
+    """A mutation waiting to be persisted"""
+
+    kind: Literal["upsert", "remove", "clear"]
+    state: ActiveScenarioState | None = None
+    name: str | None = None
+
+
+class SqlSimulatorStore(SimulatorStore):
+    """
+    SQLAlchemy-backed implementation of SimulatorStore.
+
+    Reads are served from a process-local cache so the request hot path never
+    touches the database. Mutations update the cache immediately and are
+    persisted by a background writer. Other processes learn about changes via
+    a change feed: LISTEN/NOTIFY on Postgres, polling the version row elsewhere
+    (e.g. SQLite in tests). On a version change the cache is reloaded.
+    """
+
+    def __init__(self, engine: AsyncEngine, *, poll_interval_seconds: float = 1.0) -> None:
+        self._engine = engine
+        self._poll_interval = poll_interval_seconds
+        self._cache: dict[str, ActiveScenarioState] = {}
+        self._version = 0
+        self._pending: list[_WriteOp] = []
+        self._in_flight: list[_WriteOp] = []
+        self._dirty = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._stopped = False
+
+    # ------------------------------------------------------------------
+    # SimulatorStore port (synchronous, cache only)
+    # ------------------------------------------------------------------
+
+    def list_active(self) -> list[ActiveScenarioState]:
+        return list(self._cache.values())
+
+    def upsert(self, state: ActiveScenarioState) -> None:
+        self._check_running()
+        self._cache[state.name] = state
+        self._enqueue(_WriteOp(kind="upsert", state=state))
+
+    def remove(self, name: str) -> None:
+        self._check_running()
+        self._cache.pop(name, None)
+        self._enqueue(_WriteOp(kind="remove", name=name))
+
+    def clear(self) -> None:
+        self._check_running()
+        self._cache.clear()
+        self._enqueue(_WriteOp(kind="clear"))
+
+    def get(self, name: str) -> ActiveScenarioState | None:
+        return self._cache.get(name)
+
+    def apply_batch(
+        self,
+        *,
+        upserts: list[ActiveScenarioState],
+        removals: list[str],
+        clear: bool = False,
+    ) -> None:
+        self._check_running()
+        ops: list[_WriteOp] = []
+        if clear:
+            ops.append(_WriteOp(kind="clear"))
+        ops.extend(_WriteOp(kind="remove", name=name) for name in removals)
+        ops.extend(_WriteOp(kind="upsert", state=state) for state in upserts)
+
+        cache = dict(self._cache)
+        for op in ops:
+            _apply_op(cache, op)
+        self._cache = cache
+        # Queued together, so the writer persists them in one transaction
+        # with a single version bump
+        self._pending.extend(ops)
+        self._dirty.set()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def version(self) -> int:
+        """Last state version this process has observed"""
+        return self._version
+
+    @property
+    def is_postgres(self) -> bool:
+        return self._engine.dialect.name == "postgresql"
+
+    async def start(self) -> None:
+        """Create tables, warm the cache and start the writer and change feed"""
+        self._stopped = False
+        async with self._engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+            existing = await conn.scalar(
+                select(state_version_table.c.version).where(state_version_table.c.id == 1)
+            )
+            if existing is None:
+                await conn.execute(insert(state_version_table).values(id=1, version=0))
+
+        await self.reload()
+
+        feed = self._listen_feed() if self.is_postgres else self._poll_feed()
+        self._tasks = [
+            asyncio.create_task(self._writer(), name="simulator-store-writer"),
+            asyncio.create_task(feed, name="simulator-store-feed"),
+        ]
+
+    async def stop(self) -> None:
+        """Flush pending writes and stop background tasks; later mutations raise"""
+        self._stopped = True
+        await self.flush()
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+
+    async def flush(self) -> None:
+        """Persist all pending writes now"""
+        async with self._write_lock:
+            while self._pending:
+                ops, self._pending = self._pending, []
+                self._in_flight = ops
+                try:
+                    await self._persist(ops)
+                except Exception:
+                    # Keep the ops so the next flush retries them in order
+                    self._pending = ops + self._pending
+                    raise
+                finally:
+                    self._in_flight = []
+
+    async def reload(self) -> None:
+        """Replace the local cache with the persisted state"""
+        # Serialized with flush(): a commit between the read and the overlay
+        # below would clear _in_flight and lose that write from the cache
+        async with self._write_lock:
+            await self._reload_locked()
+
+    async def _reload_locked(self) -> None:
+        async with self._engine.connect() as conn:
+            version = await self._read_version(conn)
+            rows = (await conn.execute(select(active_scenarios_table))).all()
+
+        cache = {
+            row.name: ActiveScenarioState(
+                name=row.name,
+                parameters=dict(row.parameters),
+                enabled_at=_as_utc(row.enabled_at),
+                expires_at=_as_utc(row.expires_at) if row.expires_at is not None else None,
+            )
+            for row in rows
+        }
+        # Local writes that have not been committed yet still win
+        for op in self._in_flight + self._pending:
+            _apply_op(cache, op)
+
+        self._cache = cache
+        self._version = max(self._version, version)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _check_running(self) -> None:
+        if self._stopped:
+            # The writer is gone; the change would never reach the database
+            raise RuntimeError("SqlSimulatorStore is stopped; state changes are not persisted")
+
+    def _enqueue(self, op: _WriteOp) -> None:
+        self._pending.append(op)
+        self._dirty.set()
+
+    async def _writer(self) -> None:
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to persist simulator state; retrying")
+                await asyncio.sleep(self._poll_interval)
+                self._dirty.set()
+
+    async def _persist(self, ops: list[_WriteOp]) -> None:
+        """Apply a group of ops in one transaction with a single version bump"""
+        table = active_scenarios_table
+        async with self._engine.begin() as conn:
+            for op in ops:
+                if op.kind == "clear":
+                    await conn.execute(delete(table))
+                elif op.kind == "remove":
+                    await conn.execute(delete(table).where(table.c.name == op.name))
+                elif op.state is not None:
+                    state = op.state
+                    await conn.execute(delete(table).where(table.c.name == state.name))
+                    await conn.execute(
+                        insert(table).values(
+                            name=state.name,
+                            parameters=state.parameters,
+                            enabled_at=state.enabled_at,
+                            expires_at=state.expires_at,
+                        )
+                    )
+
+            await conn.execute(
+                update(state_version_table)
+                .where(state_version_table.c.id == 1)
+                .values(version=state_version_table.c.version + 1)
+            )
+            version = await self._read_version(conn)
+            if self.is_postgres:
+                await conn.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": NOTIFY_CHANNEL, "payload": str(version)},
+                )
+
+        if version == self._version + 1:
+            self._version = version
+        else:
+            # Another process committed in between; pick up its changes too
+            # (flush() holds the write lock)
+            await self._reload_locked()
+
+    async def _read_version(self, conn: AsyncConnection) -> int:
+        version = await conn.scalar(
+            select(state_version_table.c.version).where(state_version_table.c.id == 1)
+        )
+        return int(version or 0)
+
+    async def _poll_feed(self) -> None:
+        while True:
+            await asyncio.sleep(self._poll_interval)
+            try:
+                async with self._engine.connect() as conn:
+                    version = await self._read_version(conn)
+                if version > self._version:
+                    await self.reload()
+            except Exception:
+                logger.exception("Simulator state poll failed")
+
+    async def _listen_feed(self) -> None:
+        while True:
+            try:
+                async with self._engine.connect() as conn:
+                    raw = await conn.get_raw_connection()
+                    driver_conn = raw.driver_connection
+                    if driver_conn is None:
+                        raise RuntimeError("Postgres driver connection unavailable")
+                    await driver_conn.set_autocommit(True)
+                    await driver_conn.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                    # Catch anything committed before LISTEN took effect
+                    await self.reload()
+                    try:
+                        async for notify in driver_conn.notifies():
+                            if int(notify.payload) > self._version:
+                                await self.reload()
+                    finally:
+                        # The connection was switched to autocommit; don't reuse it
+                        await conn.invalidate()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Simulator state LISTEN failed; falling back to polling")
+                await asyncio.sleep(self._poll_interval)
+                if await self._poll_once():
+                    await self.reload()
+
+    async def _poll_once(self) -> bool:
+        try:
+            async with self._engine.connect() as conn:
+                return await self._read_version(conn) > self._version
+        except Exception:
+            return False
+
+
+def _apply_op(cache: dict[str, ActiveScenarioState], op: _WriteOp) -> None:
+    if op.kind == "clear":
+        cache.clear()
+    elif op.kind == "remove" and op.name is not None:
+        cache.pop(op.name, None)
+    elif op.state is not None:
+        cache[op.state.name] = op.state
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite drops tzinfo; stored values are always UTC"""
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
@@ -0,0 +1,170 @@
+"""Integration tests for the commerce sample workload (SQLite)"""
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.api.main import create_app
+
+PRODUCTS = [
+    ("KB-1", "Mechanical Keyboard", "peripherals", 8900, 10),
+    ("MS-1", "Wireless Mouse", "peripherals", 2500, 100),
+    ("MN-1", "4K Monitor", "displays", 19900, 1),
+]
+
+
+@pytest.fixture(scope="module")
+def test_client(tmp_path_factory):
+    """App backed by a fresh SQLite database with a small catalog"""
+    for collector in list(REGISTRY._collector_to_names.keys()):
+        REGISTRY.unregister(collector)
+
+    db_path = tmp_path_factory.mktemp("commerce") / "shop.db"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{db_path}")
+        app = create_app()
+    with TestClient(app) as client:
+        with sqlite3.connect(db_path) as conn:
+            conn.executemany(
+                "INSERT INTO products (sku, name, category, price_cents, stock) VALUES (?, ?, ?, ?, ?)",
+                PRODUCTS,
+            )
+        yield client
+
+
+@pytest.mark.integration
+def test_customer_places_and_reads_orders(test_client):
+    resp = test_client.post("/api/customers", json={"email": "ada@example.com", "name": "Ada"})
+    assert resp.status_code == 201
+    customer_id = resp.json()["id"]
+    assert test_client.post(
+        "/api/customers", json={"email": "ADA@example.com", "name": "Ada"}
+    ).status_code == 409
+
+    resp = test_client.post(
+        "/api/orders",
+        json={"customer_id": customer_id, "lines": [{"product_id": 1, "quantity": 2}, {"product_id": 2, "quantity": 1}]},
+    )
+    assert resp.status_code == 201
+    order = resp.json()
+    assert order["total_cents"] == 2 * 8900 + 2500
+
+    assert test_client.get(f"/api/orders/{order['id']}").json() == order
+    history = test_client.get(f"/api/customers/{customer_id}/orders").json()["orders"]
+    assert [o["id"] for o in history] == [order["id"]]
+    assert test_client.get("/api/products/1").json()["stock"] == 8
+
+
+@pytest.mark.integration
+def test_catalog_reads(test_client):
+    peripherals = test_client.get("/api/products", params={"category": "peripherals"}).json()
+    assert [p["sku"] for p in peripherals["products"]] == ["KB-1", "MS-1"]
+    found = test_client.get("/api/products/search", params={"q": "mouse"}).json()
+    assert [p["sku"] for p in found["products"]] == ["MS-1"]
+    assert test_client.get("/api/products/999").status_code == 404
+    assert test_client.get("/api/customers/999").status_code == 404
+
+
+@pytest.mark.integration
+def test_order_errors_map_to_status_codes(test_client):
+    customer_id = test_client.post(
+        "/api/customers", json={"email": "bob@example.com", "name": "Bob"}
+    ).json()["id"]
+
+    def place(product_id, quantity, customer=customer_id):
+        return test_client.post(
+            "/api/orders",
+            json={"customer_id": customer, "lines": [{"product_id": product_id, "quantity": quantity}]},
+        )
+
+    assert place(3, 2).status_code == 409
+    assert place(999, 1).status_code == 404
+    assert place(1, 1, customer=999).status_code == 404
+    assert place(1, 0).status_code == 422
+
+
+@pytest.mark.integration
+def test_disk_full_fails_order_writes_only(test_client):
+    customer_id = test_client.post(
+        "/api/customers", json={"email": "cy@example.com", "name": "Cy"}
+    ).json()["id"]
+    resp = test_client.post(
+        "/api/sim/enable",
+        json={"name": "disk-full", "parameters": {"failure_probability": 1.0, "path_prefix": "/api/orders"}},
+    )
+    assert resp.status_code == 200
+
+    client = TestClient(test_client.app, raise_server_exceptions=False)
+    resp = client.post(
+        "/api/orders", json={"customer_id": customer_id, "lines": [{"product_id": 2, "quantity": 1}]}
+    )
+    assert resp.status_code == 500
+    # Reads and writes outside the prefix are unaffected
+    assert test_client.get(f"/api/customers/{customer_id}/orders").json() == {"orders": []}
+    assert test_client.post(
+        "/api/customers", json={"email": "dee@example.com", "name": "Dee"}
+    ).status_code == 201
+
+
+@pytest.mark.integration
+def test_lazy_loading_shows_up_as_n_plus_one(test_client):
+    customer_id = test_client.post(
+        "/api/customers", json={"email": "eve@example.com", "name": "Eve"}
+    ).json()["id"]
+    for _ in range(10):
+        resp = test_client.post(
+            "/api/orders", json={"customer_id": customer_id, "lines": [{"product_id": 2, "quantity": 1}]}
+        )
+        assert resp.status_code == 201
+
+    route = {"endpoint": "/api/customers/{customer_id}/orders"}
+
+    def sample(name):
+        return REGISTRY.get_sample_value(name, route) or 0.0
+
+    def list_orders(loading):
+        before = (sample("db_queries_per_request_sum"), sample("db_n_plus_one_total"))
+        resp = test_client.get(f"/api/customers/{customer_id}/orders", params={"loading": loading})
+        assert resp.status_code == 200
+        after = (sample("db_queries_per_request_sum"), sample("db_n_plus_one_total"))
+        return resp.json(), after[0] - before[0], after[1] - before[1]
+
+    eager, eager_queries, eager_flagged = list_orders("selectin")
+    lazy, lazy_queries, lazy_flagged = list_orders("lazy")
+    assert lazy == eager
+    # Customer lookup + orders + one lines query per order
+    assert (eager_queries, eager_flagged) == (3, 0)
+    assert (lazy_queries, lazy_flagged) == (12, 1)
+    assert test_client.get(
+        f"/api/customers/{customer_id}/orders", params={"loading": "eager"}
+    ).status_code == 422
+
+
+@pytest.mark.integration
+def test_injected_db_fault_is_recorded_as_a_500(test_client):
+    customer_id = test_client.post(
+        "/api/customers", json={"email": "fay@example.com", "name": "Fay"}
+    ).json()["id"]
+    test_client.post("/api/sim/latency/reset")
+    resp = test_client.post(
+        "/api/sim/enable",
+        json={"name": "disk-full", "parameters": {"failure_probability": 1.0, "path_prefix": "/api/orders"}},
+    )
+    assert resp.status_code == 200
+    labels = {"method": "POST", "endpoint": "/api/orders", "status": "500"}
+    before = REGISTRY.get_sample_value("http_requests_total", labels) or 0.0
+
+    client = TestClient(test_client.app, raise_server_exceptions=False)
+    resp = client.post(
+        "/api/orders", json={"customer_id": customer_id, "lines": [{"product_id": 2, "quantity": 1}]}
+    )
+    assert resp.status_code == 500
+
+    assert REGISTRY.get_sample_value("http_requests_total", labels) == before + 1
+    series = test_client.get("/api/sim/latency", params={"route": "/api/orders"}).json()["series"]
+    assert sum(s["count"] for s in series) == 1
+    segments = test_client.get("/api/sim/impact").json()["segments"]
+    [faulted] = [s for s in segments if s["scenarios"] == ["disk-full"]]
+    assert faulted["errors"] >= 1
+    test_client.post("/api/sim/reset")
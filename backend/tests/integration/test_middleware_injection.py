@@ -247,3 +247,20 @@ def test_scenario_only_affects_applicable_targets(test_client):
 
     # Cleanup
     test_client.post("/api/sim/reset")
+
+
+@pytest.mark.integration
+def test_injected_latency_is_measured(test_client):
+    """Observability wraps injection, so recorded latency includes injected delay"""
+    test_client.post("/api/sim/reset")
+    test_client.post("/api/sim/latency/reset")
+    resp = test_client.post(
+        "/api/sim/enable", json={"name": "fixed-latency", "parameters": {"ms": 50, "probability": 1.0}}
+    )
+    assert resp.status_code == 200
+    test_client.get("/api/health")
+    test_client.post("/api/sim/reset")
+
+    series = test_client.get("/api/sim/latency", params={"route": "/api/health"}).json()["series"]
+    [delayed] = [s for s in series if s["scenario"] == "fixed-latency"]
+    assert delayed["min_ms"] >= 50
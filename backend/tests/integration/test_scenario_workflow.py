@@ -163,3 +163,34 @@ def test_all_scenario_targets_are_contract_compliant(test_client):
         targets = set(scenario["targets"])
         invalid_targets = targets - allowed_targets
         assert not invalid_targets, f"Scenario {scenario['name']} has invalid targets: {invalid_targets}"
+
+
+@pytest.mark.integration
+def test_batch_apply_profile_workflow(test_client):
+    """Test applying a named profile and explicit operations in one request"""
+    resp = test_client.get("/api/sim/profiles")
+    assert resp.status_code == 200
+    profiles = {p["name"]: p for p in resp.json()["profiles"]}
+    assert "flaky-upstream" in profiles
+
+    resp2 = test_client.post(
+        "/api/sim/batch",
+        json={
+            "profile": "flaky-upstream",
+            "operations": [{"op": "enable", "name": "cpu-spike", "parameters": {"spike_probability": 0.0}}],
+        },
+    )
+    assert resp2.status_code == 200
+    active_names = {a["name"] for a in resp2.json()["active"]}
+    assert active_names == {"fixed-latency", "error-burst-5xx", "cpu-spike"}
+
+    # Unknown scenario anywhere in the batch rejects the whole batch
+    resp3 = test_client.post(
+        "/api/sim/batch",
+        json={"reset": True, "operations": [{"op": "enable", "name": "nonexistent-scenario"}]},
+    )
+    assert resp3.status_code == 404
+    resp4 = test_client.get("/api/sim/status")
+    assert {a["name"] for a in resp4.json()["active"]} == active_names
+
+    test_client.post("/api/sim/reset")
@@ -0,0 +1,120 @@
+"""Test SQL commerce repositories (SQLite)"""
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.application.commerce.exceptions import (
+    CustomerNotFoundError,
+    DuplicateCustomerError,
+    InsufficientStockError,
+    ProductNotFoundError,
+)
+from app.infrastructure.commerce.orm import ProductRow, create_schema
+from app.infrastructure.commerce.sql_repository import (
+    SqlCustomerRepository,
+    SqlOrderRepository,
+    SqlProductRepository,
+)
+
+NOW = datetime(2026, 3, 1, 12, 0, 0, tzinfo=UTC)
+
+PRODUCTS = [
+    ("KB-1", "Mechanical Keyboard", "peripherals", 8900, 5),
+    ("MS-1", "Wireless Mouse", "peripherals", 2500, 1),
+    ("MN-1", "100% Monitor", "displays", 19900, 3),
+]
+
+
+def run(tmp_path, body):
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'shop.db'}")
+        await create_schema(engine)
+        async with async_sessionmaker(engine).begin() as session:
+            session.add_all(
+                ProductRow(sku=sku, name=name, category=category, price_cents=price, stock=stock)
+                for sku, name, category, price, stock in PRODUCTS
+            )
+        try:
+            return await body(
+                SqlCustomerRepository(engine), SqlProductRepository(engine), SqlOrderRepository(engine)
+            )
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def test_customers_are_unique_by_email(tmp_path):
+    async def body(customers, products, orders):
+        ada = await customers.add(email="ada@example.com", name="Ada", created_at=NOW)
+        with pytest.raises(DuplicateCustomerError):
+            await customers.add(email="ada@example.com", name="Ada 2", created_at=NOW)
+        await customers.add(email="bob@example.com", name="Bob", created_at=NOW)
+        return ada, await customers.get(ada.id), await customers.list_page(limit=10, offset=1)
+
+    ada, fetched, page = run(tmp_path, body)
+    assert fetched == ada and ada.created_at == NOW
+    assert [c.name for c in page] == ["Bob"]
+
+
+def test_products_list_by_category_and_search_escapes_wildcards(tmp_path):
+    async def body(customers, products, orders):
+        return (
+            await products.list_page(category="peripherals", limit=10, offset=0),
+            await products.search("MOUSE", limit=10),
+            await products.search("100%", limit=10),
+            await products.search("%", limit=10),
+            await products.get(999),
+        )
+
+    peripherals, mouse, monitor, percent, missing = run(tmp_path, body)
+    assert [p.sku for p in peripherals] == ["KB-1", "MS-1"]
+    assert [p.sku for p in mouse] == ["MS-1"]
+    assert [p.sku for p in monitor] == [p.sku for p in percent] == ["MN-1"]
+    assert missing is None
+
+
+def test_place_order_reserves_stock_and_captures_prices(tmp_path):
+    async def body(customers, products, orders):
+        ada = await customers.add(email="ada@example.com", name="Ada", created_at=NOW)
+        first = await orders.place(customer_id=ada.id, quantities={1: 2, 2: 1}, created_at=NOW)
+        second = await orders.place(
+            customer_id=ada.id, quantities={3: 1}, created_at=NOW + timedelta(minutes=1)
+        )
+        return (
+            first,
+            await orders.get(first.id),
+            await orders.list_for_customer(ada.id, limit=10),
+            [(await products.get(i)).stock for i in (1, 2, 3)],
+            second,
+        )
+
+    first, fetched, history, stock, second = run(tmp_path, body)
+    assert fetched == first
+    assert first.total_cents == 2 * 8900 + 2500
+    assert [(line.product_id, line.quantity) for line in first.lines] == [(1, 2), (2, 1)]
+    assert [o.id for o in history] == [second.id, first.id]
+    assert stock == [3, 0, 2]
+
+
+def test_failed_order_writes_nothing(tmp_path):
+    async def body(customers, products, orders):
+        ada = await customers.add(email="ada@example.com", name="Ada", created_at=NOW)
+        with pytest.raises(InsufficientStockError) as insufficient:
+            await orders.place(customer_id=ada.id, quantities={1: 1, 2: 2}, created_at=NOW)
+        with pytest.raises(ProductNotFoundError):
+            await orders.place(customer_id=ada.id, quantities={1: 1, 999: 1}, created_at=NOW)
+        with pytest.raises(CustomerNotFoundError):
+            await orders.place(customer_id=999, quantities={1: 1}, created_at=NOW)
+        return (
+            insufficient.value,
+            (await products.get(1)).stock,
+            await orders.list_for_customer(ada.id, limit=10),
+        )
+
+    insufficient, keyboard_stock, history = run(tmp_path, body)
+    assert (insufficient.product_id, insufficient.requested, insufficient.available) == (2, 2, 1)
+    assert keyboard_stock == 5
+    assert history == []
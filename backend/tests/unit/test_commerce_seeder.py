@@ -0,0 +1,75 @@
+"""Test the bulk commerce seeder (SQLite)"""
+import asyncio
+import random
+from collections import Counter
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.commerce.seeder import (
+    SeedConfig,
+    ZipfSampler,
+    customer_rows,
+    order_rows,
+    product_price_cents,
+    seed,
+)
+
+SMALL = SeedConfig(customers=120, products=40, orders=300, batch_size=50, workers=3, seed=7)
+
+
+def test_batches_are_reproducible_and_cover_their_ids():
+    assert customer_rows(SMALL, 1) == customer_rows(SMALL, 1)
+    assert [row[0] for row in customer_rows(SMALL, 2)] == list(range(101, 121))
+    assert customer_rows(SMALL, 0) != customer_rows(SeedConfig(customers=120, batch_size=50, seed=8), 0)
+
+
+def test_zipf_sampler_concentrates_on_hot_ids():
+    rng = random.Random(1)
+    skewed = Counter(ZipfSampler(1000, 1.2, seed=1).sample(rng, 20_000))
+    uniform = Counter(ZipfSampler(1000, 0.0, seed=1).sample(rng, 20_000))
+    assert skewed.most_common(1)[0][1] > 10 * uniform.most_common(1)[0][1]
+    assert set(skewed) <= set(range(1, 1001)) and set(uniform) <= set(range(1, 1001))
+
+
+@pytest.mark.parametrize("skew", [0.0, 0.5, 1.0, 2.0])
+def test_zipf_ranks_stay_in_range(skew):
+    sampler = ZipfSampler(10, skew, seed=3)
+    assert sampler.rank(0.0) == 1 and sampler.rank(0.999999) == 10
+    assert sorted(sampler.id_of_rank(r) for r in range(1, 11)) == list(range(1, 11))
+
+
+def test_order_lines_are_priced_and_merged():
+    products = ZipfSampler(SMALL.products, SMALL.product_skew, SMALL.seed)
+    customers = ZipfSampler(SMALL.customers, 0.0, SMALL.seed)
+    orders, lines = order_rows(SMALL, 0, products, customers)
+    assert len(orders) == 50
+    keys = [(order_id, product_id) for order_id, product_id, _, _ in lines]
+    assert len(keys) == len(set(keys))
+    assert all(price == product_price_cents(pid) for _, pid, _, price in lines)
+
+
+def test_seed_loads_reproducible_data(tmp_path):
+    progress = []
+
+    async def load(name):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}")
+        try:
+            counts = await seed(engine, SMALL, lambda *p: progress.append(p))
+            async with engine.connect() as conn:
+                dump = {
+                    table: (await conn.execute(text(f"SELECT * FROM {table} ORDER BY id"))).all()
+                    for table in ("customers", "products", "orders", "order_lines")
+                }
+            return counts, dump
+        finally:
+            await engine.dispose()
+
+    counts, first = asyncio.run(load("a.db"))
+    _, second = asyncio.run(load("b.db"))
+
+    assert counts["customers"] == 120 and counts["products"] == 40 and counts["orders"] == 300
+    assert counts["order_lines"] == len(first["order_lines"]) >= 300
+    assert first == second
+    assert ("customers", 120, 120) in progress and ("orders", 300, 300) in progress
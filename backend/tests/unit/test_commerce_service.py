@@ -0,0 +1,143 @@
+"""Test CommerceService use cases against in-memory fakes"""
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from app.application.commerce.app_models import (
+    OrderLineRequestApp,
+    PlaceOrderRequestApp,
+    RegisterCustomerRequestApp,
+)
+from app.application.commerce.exceptions import (
+    CustomerNotFoundError,
+    InvalidOrderError,
+    OrderNotFoundError,
+    ProductNotFoundError,
+)
+from app.application.commerce.service import MAX_ORDER_LINES, CommerceService
+from app.domain.commerce import Customer, Order, OrderLine
+
+NOW = datetime(2026, 3, 1, 12, 0, 0, tzinfo=UTC)
+
+
+class FakeClock:
+    def now(self):
+        return NOW
+
+
+class FakeCustomers:
+    def __init__(self):
+        self.rows = {}
+
+    async def get(self, customer_id):
+        return self.rows.get(customer_id)
+
+    async def list_page(self, *, limit, offset):
+        return list(self.rows.values())[offset : offset + limit]
+
+    async def add(self, *, email, name, created_at):
+        customer = Customer(id=len(self.rows) + 1, email=email, name=name, created_at=created_at)
+        self.rows[customer.id] = customer
+        return customer
+
+
+class FakeProducts:
+    async def get(self, product_id):
+        return None
+
+    async def list_page(self, *, category, limit, offset):
+        return []
+
+    async def search(self, query, *, limit):
+        self.searched = query
+        return []
+
+
+class FakeOrders:
+    def __init__(self):
+        self.placed = []
+        self.loading = []
+
+    async def get(self, order_id, *, loading="selectin"):
+        self.loading.append(loading)
+        return None
+
+    async def list_for_customer(self, customer_id, *, limit, loading="selectin"):
+        self.loading.append(loading)
+        return []
+
+    async def place(self, *, customer_id, quantities, created_at):
+        self.placed.append(quantities)
+        lines = tuple(OrderLine(pid, q, 100) for pid, q in quantities.items())
+        return Order(id=1, customer_id=customer_id, status="placed", created_at=created_at, lines=lines)
+
+
+def make_service():
+    customers, products, orders = FakeCustomers(), FakeProducts(), FakeOrders()
+    service = CommerceService(
+        customers=customers, products=products, orders=orders, clock=FakeClock()
+    )
+    return service, customers, products, orders
+
+
+def test_register_customer_normalizes_email():
+    service, *_ = make_service()
+    customer = asyncio.run(
+        service.register_customer(RegisterCustomerRequestApp(email=" Ada@Example.COM ", name=" Ada "))
+    )
+    assert (customer.email, customer.name, customer.created_at) == ("ada@example.com", "Ada", NOW)
+
+
+def test_missing_entities_raise_not_found():
+    service, *_ = make_service()
+    with pytest.raises(CustomerNotFoundError):
+        asyncio.run(service.get_customer(1))
+    with pytest.raises(CustomerNotFoundError):
+        asyncio.run(service.list_customer_orders(1, limit=10))
+    with pytest.raises(ProductNotFoundError):
+        asyncio.run(service.get_product(1))
+    with pytest.raises(OrderNotFoundError):
+        asyncio.run(service.get_order(1))
+
+
+def test_blank_search_skips_the_repository():
+    service, _, products, _ = make_service()
+    assert asyncio.run(service.search_products("   ", limit=10)) == []
+    assert not hasattr(products, "searched")
+    asyncio.run(service.search_products(" mouse ", limit=10))
+    assert products.searched == "mouse"
+
+
+def test_place_order_merges_repeated_products():
+    service, _, _, orders = make_service()
+    lines = [OrderLineRequestApp(1, 2), OrderLineRequestApp(2, 1), OrderLineRequestApp(1, 3)]
+    order = asyncio.run(service.place_order(PlaceOrderRequestApp(customer_id=7, lines=lines)))
+    assert orders.placed == [{1: 5, 2: 1}]
+    assert order.total_cents == 600
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [
+        [],
+        [OrderLineRequestApp(1, 0)],
+        [OrderLineRequestApp(i, 1) for i in range(MAX_ORDER_LINES + 1)],
+    ],
+)
+def test_invalid_orders_are_rejected(lines):
+    service, _, _, orders = make_service()
+    with pytest.raises(InvalidOrderError):
+        asyncio.run(service.place_order(PlaceOrderRequestApp(customer_id=1, lines=lines)))
+    assert orders.placed == []
+
+
+def test_loading_strategy_is_passed_to_the_repository():
+    service, customers, _, orders = make_service()
+    customers.rows[1] = object()
+    asyncio.run(service.list_customer_orders(1, limit=10, loading="lazy"))
+    asyncio.run(service.list_customer_orders(1, limit=10))
+    with pytest.raises(OrderNotFoundError):
+        asyncio.run(service.get_order(1, loading="joined"))
+
+    assert orders.loading == ["lazy", "selectin", "joined"]
@@ -0,0 +1,77 @@
+"""Test correlation ID generation, traceparent reuse and propagation"""
+import uuid
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from app.api.middleware.request_id import RequestIdMiddleware
+from app.infrastructure.observability import correlation
+from app.infrastructure.observability.log_context import bind_correlation, reset_correlation
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+TRACEPARENT = f"00-{TRACE_ID}-00f067aa0ba902b7-01"
+
+
+def test_generated_ids_are_unique_sortable_uuid_hex():
+    ids = [correlation.new_correlation_id() for _ in range(1000)]
+    assert len(set(ids)) == 1000
+    assert ids == sorted(ids)
+    assert all(len(i) == 32 for i in ids)
+    uuid.UUID(ids[0])
+
+
+def test_traceparent_trace_id_is_extracted_only_when_valid():
+    parse = correlation.trace_id_from_traceparent
+    assert parse(TRACEPARENT) == TRACE_ID
+    assert parse(TRACEPARENT.upper()) == TRACE_ID
+    assert parse(None) is None
+    assert parse("garbage") is None
+    assert parse(f"00-{'0' * 32}-00f067aa0ba902b7-01") is None
+    assert parse(f"ff-{TRACE_ID}-00f067aa0ba902b7-01") is None
+    assert parse(f"00-{'z' * 32}-00f067aa0ba902b7-01") is None
+
+
+def test_request_id_header_wins_over_traceparent():
+    assert correlation.resolve_request_id("abc", TRACEPARENT) == "abc"
+    assert correlation.resolve_request_id(None, TRACEPARENT) == TRACE_ID
+    assert len(correlation.resolve_request_id(None, None)) == 32
+
+
+def test_outbound_headers_carry_the_current_request_id():
+    assert correlation.REQUEST_ID_HEADER not in correlation.outbound_headers()
+    token = bind_correlation(request_id="req-1")
+    try:
+        assert correlation.outbound_headers()[correlation.REQUEST_ID_HEADER] == "req-1"
+    finally:
+        reset_correlation(token)
+
+
+def test_request_id_reaches_response_logs_and_span():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    seen = []
+
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        from app.infrastructure.observability.log_context import current_correlation
+
+        seen.append(current_correlation()["request_id"])
+        return {}
+
+    app.add_middleware(RequestIdMiddleware)
+    FastAPIInstrumentor.instrument_app(app, tracer_provider=provider)
+    client = TestClient(app)
+
+    resp = client.get("/ping", headers={"traceparent": TRACEPARENT})
+    assert resp.headers["X-Request-ID"] == TRACE_ID
+    assert seen == [TRACE_ID]
+    [server_span] = [s for s in exporter.get_finished_spans() if s.name == "GET /ping"]
+    assert server_span.attributes["request.id"] == TRACE_ID
+    assert format(server_span.context.trace_id, "032x") == TRACE_ID
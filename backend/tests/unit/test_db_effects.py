@@ -0,0 +1,251 @@
+"""Test db-category effect injection through the engine hooks (SQLite)"""
+import asyncio
+import time
+
+import pytest
+from prometheus_client import CollectorRegistry
+from sqlalchemy import event, exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.application.simulator.parameters import ScenarioParameters
+from app.application.simulator.scenarios.connection_pool_exhaustion import (
+    ConnectionPoolExhaustion,
+)
+from app.infrastructure.db.effects import DbEffectInjector, db_scope, statement_operation
+from app.infrastructure.db.session import install_effect_hooks
+from app.infrastructure.observability.metric_events import MetricEventBuffer
+from app.infrastructure.observability.metrics import PrometheusMetrics
+
+
+class DummyActive:
+    def __init__(self, name):
+        self.name = name
+        self.parameters = {}
+
+
+class DummyScenario:
+    def __init__(self, effects):
+        self._effects = effects
+        self.targets = []
+
+    def is_applicable(self, *, target):
+        self.targets.append(target)
+        return target["category"] == "db"
+
+    def apply(self, *, ctx, parameters):
+        return dict(self._effects)
+
+
+class DummyService:
+    def __init__(self, active):
+        self._active = active
+
+    def status(self):
+        return type("Status", (), {"active": self._active})()
+
+    def effective_parameters(self, active):
+        return active.parameters
+
+
+class DummyRegistry:
+    def __init__(self, scenario):
+        self._scenario = scenario
+
+    def get(self, name):
+        return self._scenario
+
+
+def run_with_effects(effects, body):
+    """Run `body(engine)` with one active scenario producing `effects`"""
+    scenario = DummyScenario(effects)
+    registry = CollectorRegistry()
+    metrics = PrometheusMetrics(registry=registry)
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        install_effect_hooks(
+            engine,
+            DbEffectInjector(
+                DummyService([DummyActive("db-scenario")]),
+                DummyRegistry(scenario),
+                metrics=metrics,
+            ),
+        )
+        try:
+            return await body(engine)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run()), scenario, registry
+
+
+def statements(registry, operation, status="ok"):
+    return registry.get_sample_value(
+        "db_statements_total", {"operation": operation, "status": status}
+    )
+
+
+def injections(registry, effect_type):
+    return registry.get_sample_value(
+        "simulator_injections_total",
+        {"scenario_name": "db-scenario", "effect_type": effect_type},
+    )
+
+
+@pytest.mark.parametrize(
+    "statement,operation",
+    [
+        ("SELECT 1", "select"),
+        ("  insert into t values (1)", "insert"),
+        ("UPDATE t SET a = 1", "update"),
+        ("DELETE FROM t", "delete"),
+        ("CREATE TABLE t (a int)", "other"),
+    ],
+)
+def test_statement_operation(statement, operation):
+    assert statement_operation(statement) == operation
+
+
+def test_query_delay_applies_inside_request_scope_only():
+    async def body(engine):
+        async with engine.connect() as conn:
+            start = time.perf_counter()
+            await conn.execute(text("SELECT 1"))
+            unscoped = time.perf_counter() - start
+            with db_scope("/api/items"):
+                start = time.perf_counter()
+                await conn.execute(text("SELECT 1"))
+                scoped = time.perf_counter() - start
+        return unscoped, scoped
+
+    (unscoped, scoped), scenario, registry = run_with_effects({"db_query_delay_ms": 50}, body)
+
+    assert unscoped < 0.05 <= scoped
+    assert scenario.targets[-1] == {"category": "db", "operation": "select", "path": "/api/items"}
+    assert injections(registry, "db_delay") == 1
+    assert statements(registry, "select") == 2
+    assert registry.get_sample_value(
+        "db_statement_duration_seconds_sum", {"operation": "select"}
+    ) >= 0.05
+
+
+def test_delay_yields_to_the_event_loop():
+    async def body(engine):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        with db_scope("/api/items"):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        task.cancel()
+        return ticks
+
+    ticks, _, _ = run_with_effects({"db_sleep_seconds": 0.1}, body)
+    assert ticks >= 5
+
+
+def test_cancelled_delay_leaves_no_statement_start_time():
+    async def body(engine):
+        async with engine.connect() as conn:
+            with db_scope("/api/items"):
+                query = asyncio.create_task(conn.execute(text("SELECT 1")))
+                await asyncio.sleep(0.02)
+                query.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await query
+            return (await conn.get_raw_connection()).info.get("sim_statement_started")
+
+    started, _, registry = run_with_effects({"db_sleep_seconds": 1.0}, body)
+
+    assert started == []
+    assert statements(registry, "select", "error") == 1
+
+
+def test_connection_exhaustion_fails_checkout():
+    invalidated = []
+
+    async def body(engine):
+        event.listen(engine.sync_engine.pool, "invalidate", lambda *args: invalidated.append(args))
+        with db_scope("/api/items"), pytest.raises(exc.TimeoutError, match="limit of size 5"):
+            async with engine.connect():
+                pass
+        # The pool stays usable for statements outside the request scope
+        async with engine.connect() as conn:
+            return (await conn.execute(text("SELECT 1"))).scalar()
+
+    effects = {
+        "db_connection_exhausted": True,
+        "db_hang_duration_ms": 20,
+        "db_pool_size_limit": 5,
+    }
+    result, scenario, registry = run_with_effects(effects, body)
+
+    assert result == 1
+    # The healthy connection went back to the pool rather than being discarded
+    assert invalidated == []
+    assert scenario.targets[0]["operation"] == "connect"
+    assert injections(registry, "db_connection_exhausted") == 1
+
+
+def test_connection_exhaustion_emits_pool_metric_events_at_checkout():
+    registry = CollectorRegistry()
+    metrics = PrometheusMetrics(registry=registry)
+    metrics.register_scenario_metrics("connection-pool-exhaustion", ConnectionPoolExhaustion.meta.metrics)
+    buffer = MetricEventBuffer(metrics)
+    active = DummyActive("connection-pool-exhaustion")
+    active.parameters = ScenarioParameters(
+        {"exhaustion_probability": 1.0, "hang_duration_ms": 100, "pool_size_limit": 5}
+    )
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        install_effect_hooks(
+            engine,
+            DbEffectInjector(
+                DummyService([active]),
+                DummyRegistry(ConnectionPoolExhaustion()),
+                metrics=metrics,
+                metric_events=buffer,
+            ),
+        )
+        try:
+            with db_scope("/api/items"), pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+    buffer.flush()
+
+    labels = {"scenario": "connection-pool-exhaustion"}
+    assert registry.get_sample_value("connection_pool_size", labels) == 5
+    assert registry.get_sample_value("connection_pool_wait_seconds_sum", labels) == pytest.approx(0.1)
+
+
+def test_disk_full_fails_writes_under_path_prefix():
+    async def body(engine):
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE t (a int)"))
+        async with engine.connect() as conn:
+            with db_scope("/api/orders/1"):
+                await conn.execute(text("SELECT * FROM t"))
+                with pytest.raises(exc.OperationalError, match="No space left on device"):
+                    await conn.execute(text("INSERT INTO t VALUES (1)"))
+            with db_scope("/api/items"):
+                await conn.execute(text("INSERT INTO t VALUES (2)"))
+            return (await conn.execute(text("SELECT a FROM t"))).scalars().all()
+
+    effects = {"disk_full_error": True, "path_prefix": "/api/orders"}
+    rows, _, registry = run_with_effects(effects, body)
+
+    assert rows == [2]
+    assert injections(registry, "db_write_failure") == 1
+    assert statements(registry, "insert", "error") == 1
+    assert statements(registry, "insert") == 1
@@ -0,0 +1,83 @@
+"""Test pool settings, pool metrics and prewarming (SQLite)"""
+import asyncio
+
+import pytest
+from prometheus_client import CollectorRegistry
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.db.pool import PoolSettings, install_pool_metrics, prewarm_pool
+from app.infrastructure.observability.metrics import PrometheusMetrics
+
+
+def make_engine(tmp_path, **settings):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+    return create_async_engine(url, **PoolSettings(**settings).engine_options(url))
+
+
+def test_in_memory_sqlite_keeps_its_static_pool():
+    assert PoolSettings(size=3).engine_options("sqlite+aiosqlite:///:memory:") == {
+        "pool_pre_ping": False
+    }
+
+
+@pytest.mark.parametrize(
+    "settings", [{"size": 0}, {"timeout_seconds": 0}, {"prewarm": -1}]
+)
+def test_invalid_settings_are_rejected(settings):
+    with pytest.raises(ValueError):
+        PoolSettings(**settings)
+
+
+def test_pool_metrics_track_occupancy_wait_and_connect(tmp_path):
+    registry = CollectorRegistry()
+
+    async def run():
+        engine = make_engine(tmp_path, size=1, max_overflow=1)
+        install_pool_metrics(engine, PrometheusMetrics(registry=registry))
+        try:
+            async with engine.connect() as first, engine.connect() as second:
+                await first.execute(text("SELECT 1"))
+                await second.execute(text("SELECT 1"))
+                during = (
+                    registry.get_sample_value("db_pool_checked_out"),
+                    registry.get_sample_value("db_pool_overflow"),
+                )
+            return during
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(run()) == (2.0, 1.0)
+    assert registry.get_sample_value("db_pool_checked_out") == 0
+    assert registry.get_sample_value("db_pool_overflow") == 0
+    assert registry.get_sample_value("db_pool_wait_seconds_count") == 2
+    assert registry.get_sample_value("db_connect_seconds_count") == 2
+
+
+def test_exhausted_pool_times_out(tmp_path):
+    async def run():
+        engine = make_engine(tmp_path, size=1, max_overflow=0, timeout_seconds=0.05)
+        try:
+            async with engine.connect():
+                with pytest.raises(exc.TimeoutError):
+                    await engine.connect()
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_prewarm_opens_up_to_pool_size(tmp_path):
+    registry = CollectorRegistry()
+
+    async def run():
+        engine = make_engine(tmp_path, size=3)
+        install_pool_metrics(engine, PrometheusMetrics(registry=registry))
+        try:
+            opened = await prewarm_pool(engine, 10)
+            return opened, engine.sync_engine.pool.checkedin()
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(run()) == (3, 3)
+    assert registry.get_sample_value("db_connect_seconds_count") == 3
@@ -0,0 +1,67 @@
+"""Test effect spans and effect duration observations"""
+import time
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from prometheus_client import CollectorRegistry
+
+from app.infrastructure.observability.effects import EffectRecorder
+from app.infrastructure.observability.metrics import PrometheusMetrics
+
+
+def make_recorder():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    registry = CollectorRegistry()
+    recorder = EffectRecorder(
+        PrometheusMetrics(registry=registry), tracer=provider.get_tracer("test")
+    )
+    return recorder, exporter, registry
+
+
+def effect_samples(registry, suffix, scenario="fixed-latency", effect="http_delay"):
+    return registry.get_sample_value(
+        f"simulator_effect_duration_seconds_{suffix}",
+        {"scenario_name": scenario, "effect_type": effect},
+    )
+
+
+def test_effect_is_a_child_span_with_scenario_and_parameters():
+    recorder, exporter, registry = make_recorder()
+    tracer = recorder._tracer
+    with tracer.start_as_current_span("GET /items") as request_span:
+        with recorder.record("fixed-latency", "http_delay", {"delay_ms": 20, "ctx": object()}):
+            time.sleep(0.02)
+
+    effect, request = exporter.get_finished_spans()
+    assert effect.name == "sim.effect http_delay"
+    assert effect.parent.span_id == request_span.get_span_context().span_id
+    assert dict(effect.attributes) == {
+        "sim.scenario": "fixed-latency",
+        "sim.effect": "http_delay",
+        "sim.param.delay_ms": 20,
+    }
+    assert effect_samples(registry, "count") == 1.0
+    assert effect_samples(registry, "sum") >= 0.02
+
+
+def test_effect_is_timed_when_it_raises():
+    recorder, exporter, registry = make_recorder()
+    with pytest.raises(RuntimeError):
+        with recorder.record("db-hang", "db_delay", {}):
+            raise RuntimeError("boom")
+    assert effect_samples(registry, "count", "db-hang", "db_delay") == 1.0
+    assert exporter.get_finished_spans()[0].status.is_ok is False
+
+
+def test_recorder_without_metrics_only_traces():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    recorder = EffectRecorder(None, tracer=provider.get_tracer("test"))
+    with recorder.record("cpu-spike", "cpu_spike", {"duration_ms": 1}):
+        pass
+    assert [s.name for s in exporter.get_finished_spans()] == ["sim.effect cpu_spike"]
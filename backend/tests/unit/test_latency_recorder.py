@@ -0,0 +1,115 @@
+"""Test the log-linear latency histograms, recorder windows and /api/sim/latency"""
+import math
+import random
+
+import pytest
+from fastapi import FastAPI
+from prometheus_client import CollectorRegistry
+from starlette.testclient import TestClient
+
+from app.api.routers import simulator
+from app.infrastructure.observability.latency import (
+    NO_SCENARIO,
+    LatencyHistogram,
+    LatencyRecorder,
+)
+from app.infrastructure.observability.metrics import PrometheusMetrics
+from app.infrastructure.observability.middleware import ObservabilityMiddleware
+
+
+def exact(values, p):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(p * len(ordered) / 100)) - 1]
+
+
+def test_percentiles_within_relative_error():
+    rng = random.Random(7)
+    values = [rng.uniform(0.001, 30.0) for _ in range(20000)]
+    hist = LatencyHistogram()
+    for v in values:
+        hist.record(v)
+
+    for p in (50, 90, 99, 99.9, 99.99):
+        assert hist.percentile(p) == pytest.approx(exact(values, p), rel=1 / 128)
+    assert hist.percentile(100) == max(values)
+    assert hist.count == len(values)
+    assert hist.min == min(values)
+
+
+def test_small_values_are_exact_and_large_values_are_capped():
+    hist = LatencyHistogram(highest_seconds=1.0)
+    hist.record(0.000_100)
+    assert hist.percentile(50) == pytest.approx(0.000_100)
+    hist.record(5.0)
+    # Beyond the trackable range: counted in the last slot, max stays exact
+    assert hist.max == 5.0
+    assert hist.percentile(100) <= 5.0
+    assert LatencyHistogram().percentile(99) == 0.0
+
+
+def test_merge_equals_recording_everything_in_one():
+    a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for i in range(1, 500):
+        (a if i % 2 else b).record(i / 1000)
+        both.record(i / 1000)
+    a.merge(b)
+    assert list(a.counts) == list(both.counts)
+    assert (a.count, a.min, a.max) == (both.count, both.min, both.max)
+
+    with pytest.raises(ValueError):
+        a.merge(LatencyHistogram(significant_bits=6))
+
+
+def test_recorder_series_filters_and_reset():
+    recorder = LatencyRecorder()
+    recorder.record("/a", (), 0.010)
+    recorder.record("/a", ("fixed-latency",), 0.500)
+    recorder.record("/b", ("fixed-latency", "cpu-spike"), 1.000)
+
+    snapshot = recorder.snapshot()
+    keys = [(s.route, s.scenario) for s in snapshot.series]
+    assert keys == [("/a", "fixed-latency"), ("/a", NO_SCENARIO), ("/b", "cpu-spike"), ("/b", "fixed-latency")]
+
+    by_scenario = recorder.snapshot(scenario="fixed-latency")
+    assert by_scenario.merged.count == 2
+    assert by_scenario.merged.max_seconds == 1.0
+    assert by_scenario.merged.route == "*"
+
+    closed = recorder.reset()
+    assert len(closed.series) == 4
+    assert recorder.snapshot().series == []
+    assert recorder.snapshot().merged is None
+
+
+def test_latency_endpoint_reports_route_and_scenario_percentiles():
+    app = FastAPI()
+    recorder = LatencyRecorder()
+    app.state.latency_recorder = recorder
+    app.add_middleware(
+        ObservabilityMiddleware,
+        metrics=PrometheusMetrics(registry=CollectorRegistry()),
+        latency=recorder,
+    )
+    app.include_router(simulator.router, prefix="/api/sim")
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id}
+
+    client = TestClient(app)
+    for i in range(10):
+        client.get(f"/items/{i}")
+
+    body = client.get("/api/sim/latency", params={"route": "/items/{item_id}"}).json()
+    assert [(s["route"], s["scenario"]) for s in body["series"]] == [("/items/{item_id}", "none")]
+    series = body["series"][0]
+    assert series["count"] == 10
+    assert set(series["percentiles_ms"]) == {"p50", "p90", "p95", "p99", "p99.9", "p99.99"}
+    assert series["percentiles_ms"]["p50"] <= series["max_ms"]
+    assert body["merged"]["count"] == 10
+
+    closed = client.post("/api/sim/latency/reset").json()
+    assert closed["merged"]["count"] >= 10
+    # The reset request itself lands in the new window
+    after = client.get("/api/sim/latency", params={"route": "/items/{item_id}"}).json()
+    assert after["series"] == []
@@ -0,0 +1,121 @@
+"""Test the fast JSON formatter and contextvar log correlation"""
+import asyncio
+import json
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.middleware.request_id import RequestIdMiddleware
+from app.infrastructure.observability.json_formatter import FastJsonFormatter
+from app.infrastructure.observability.log_context import (
+    CorrelationFilter,
+    bind_correlation,
+    current_correlation,
+    reset_correlation,
+)
+
+
+class Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.addFilter(CorrelationFilter())
+        self.setFormatter(FastJsonFormatter())
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(json.loads(self.format(record)))
+
+
+def capture_logger(name):
+    handler = Capture()
+    logger = logging.getLogger(f"test_log_formatter.{name}")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger, handler
+
+
+def test_formatter_keeps_field_layout_and_extras():
+    logger, handler = capture_logger("layout")
+    logger.info("hello %s", "world", extra={"status_code": 200, "tags": {"a": 1}})
+
+    (line,) = handler.lines
+    assert list(line)[:7] == [
+        "timestamp",
+        "level",
+        "name",
+        "message",
+        "request_id",
+        "trace_id",
+        "span_id",
+    ]
+    assert line["message"] == "hello world"
+    assert line["level"] == "INFO"
+    assert line["request_id"] == "none"
+    assert line["status_code"] == 200 and line["tags"] == {"a": 1}
+    assert line["timestamp"].endswith("Z") and len(line["timestamp"]) == 24
+
+
+def test_formatter_keeps_extras_in_the_order_given():
+    logger, handler = capture_logger("order")
+    extra = {name: i for i, name in enumerate(["zeta", "alpha", "mid", "beta", "omega"])}
+    logger.info("ordered", extra=extra)
+
+    assert list(handler.lines[0])[7:] == list(extra)
+
+
+def test_formatter_renders_exceptions():
+    logger, handler = capture_logger("exc")
+    try:
+        raise ValueError("bad")
+    except ValueError:
+        logger.exception("failed")
+    assert "ValueError: bad" in handler.lines[0]["exc_info"]
+
+
+def test_bound_fields_reach_records_and_explicit_extra_wins():
+    logger, handler = capture_logger("bound")
+    token = bind_correlation(request_id="req-1", trace_id="t" * 32)
+    try:
+        logger.info("inside")
+        logger.info("override", extra={"request_id": "explicit"})
+    finally:
+        reset_correlation(token)
+    logger.info("outside")
+
+    assert [(l["request_id"], l["trace_id"]) for l in handler.lines] == [
+        ("req-1", "t" * 32),
+        ("explicit", "t" * 32),
+        ("none", "none"),
+    ]
+
+
+def test_bindings_are_isolated_between_tasks():
+    async def handle(request_id):
+        token = bind_correlation(request_id=request_id)
+        try:
+            await asyncio.sleep(0)
+            return current_correlation()["request_id"]
+        finally:
+            reset_correlation(token)
+
+    async def run():
+        return await asyncio.gather(*(handle(f"r{i}") for i in range(5)))
+
+    assert asyncio.run(run()) == [f"r{i}" for i in range(5)]
+    assert "request_id" not in current_correlation()
+
+
+def test_request_id_middleware_binds_request_id_for_handlers():
+    logger, handler = capture_logger("middleware")
+    app = FastAPI()
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.get("/ping")
+    async def ping():
+        logger.info("handling")
+        return {}
+
+    TestClient(app).get("/ping", headers={"X-Request-ID": "abc"})
+    assert handler.lines[0]["request_id"] == "abc"
@@ -0,0 +1,174 @@
+"""Test the bounded queue log handler and its overflow policies"""
+import io
+import logging
+import threading
+
+import pytest
+
+from app.infrastructure.observability.log_queue import QueueLogHandler
+from app.infrastructure.observability.logging import setup_logging
+
+
+class BlockingStream(io.StringIO):
+    """Stream whose writes wait until released, to simulate a stalled consumer"""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, s):
+        self.entered.set()
+        self.release.wait(5)
+        return super().write(s)
+
+
+def make_logger(handler, name):
+    logger = logging.getLogger(f"test_log_queue.{name}")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def stalled(overflow, capacity=3):
+    stream = BlockingStream()
+    target = logging.StreamHandler(stream)
+    target.setFormatter(logging.Formatter("%(message)s"))
+    handler = QueueLogHandler(target, capacity=capacity, overflow=overflow)
+    logger = make_logger(handler, overflow)
+    # First record occupies the writer inside write()
+    logger.info("first")
+    assert stream.entered.wait(5)
+    return handler, logger, stream
+
+
+def lines(stream):
+    return stream.getvalue().splitlines()
+
+
+def test_records_are_formatted_and_written_off_the_calling_thread():
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    target.setFormatter(logging.Formatter("%(threadName)s|%(message)s"))
+    threads = []
+    original = target.format
+    target.format = lambda record: threads.append(threading.current_thread().name) or original(record)
+    handler = QueueLogHandler(target)
+    logger = make_logger(handler, "offthread")
+
+    for i in range(5):
+        logger.info("hello %d", i)
+    handler.flush()
+
+    assert [line.split("|")[1] for line in lines(stream)] == [f"hello {i}" for i in range(5)]
+    assert set(threads) == {"log-writer"}
+    handler.close()
+
+
+def test_exception_text_is_rendered_before_queueing():
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    handler = QueueLogHandler(target)
+    logger = make_logger(handler, "exc")
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logger.exception("failed")
+    handler.flush()
+    assert "RuntimeError: boom" in stream.getvalue()
+    handler.close()
+
+
+def test_drop_newest_discards_incoming_records():
+    handler, logger, stream = stalled("drop_newest")
+    for i in range(5):
+        logger.info("r%d", i)
+    stream.release.set()
+    handler.flush()
+    assert lines(stream) == ["first", "r0", "r1", "r2"]
+    assert handler.dropped == {"overflow": 2}
+    handler.close()
+
+
+def test_drop_oldest_keeps_the_latest_records():
+    handler, logger, stream = stalled("drop_oldest")
+    for i in range(5):
+        logger.info("r%d", i)
+    stream.release.set()
+    handler.flush()
+    assert lines(stream) == ["first", "r2", "r3", "r4"]
+    assert handler.dropped == {"overflow": 2}
+    handler.close()
+
+
+def test_coalesce_folds_overflow_into_summaries():
+    handler, logger, stream = stalled("coalesce", capacity=1)
+    seen = []
+    handler.set_drop_listener(seen.append)
+    logger.info("queued")
+    for _ in range(4):
+        logger.info("Request completed")
+    logger.warning("slow consumer")
+    stream.release.set()
+    handler.flush()
+    assert lines(stream) == [
+        "first",
+        "queued",
+        "Request completed [coalesced 4 records]",
+        "slow consumer [coalesced 1 records]",
+    ]
+    assert handler.dropped == {"coalesced": 5}
+    assert seen == ["coalesced"] * 5
+    handler.close()
+
+
+def test_close_drains_and_rejects_later_records():
+    stream = io.StringIO()
+    handler = QueueLogHandler(logging.StreamHandler(stream))
+    logger = make_logger(handler, "close")
+    logger.info("before")
+    handler.close()
+    logger.info("after")
+    assert lines(stream) == ["before"]
+    assert handler.dropped == {"closed": 1}
+
+
+def test_unknown_overflow_policy_is_rejected():
+    with pytest.raises(ValueError):
+        QueueLogHandler(logging.NullHandler(), overflow="block")
+
+
+def test_setup_logging_installs_queue_handler():
+    root = logging.getLogger()
+    saved = root.handlers[:], root.level
+    # Keep the app's handler out of reach: reconfiguring closes the previous queue
+    root.handlers = []
+    try:
+        handler = setup_logging(level="INFO", json_format=True, queue_capacity=10)
+        assert root.handlers == [handler]
+        assert isinstance(handler.target, logging.StreamHandler)
+        assert setup_logging(json_format=False, queue_capacity=0) is None
+        assert not isinstance(root.handlers[0], QueueLogHandler)
+        assert handler.dropped == {} and handler._stopped
+    finally:
+        root.handlers, level = saved
+        root.setLevel(level)
+
+
+def test_malformed_log_call_goes_to_handle_error_not_the_caller():
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    target.setFormatter(logging.Formatter("%(message)s"))
+    handler = QueueLogHandler(target)
+    errors = []
+    handler.handleError = errors.append
+    logger = make_logger(handler, "malformed")
+
+    logger.info("x %s %s", 1)
+    logger.info("after")
+    handler.flush()
+
+    assert [record.msg for record in errors] == ["x %s %s"]
+    assert lines(stream) == ["after"]
+    handler.close()
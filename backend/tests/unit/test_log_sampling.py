@@ -0,0 +1,121 @@
+"""Test request log sampling and the single "Request completed" record"""
+import logging
+
+import pytest
+from fastapi import FastAPI, Response
+from prometheus_client import CollectorRegistry
+from starlette.testclient import TestClient
+
+from app.infrastructure.observability.log_sampling import (
+    RequestLogSampler,
+    parse_route_rate_limits,
+)
+from app.infrastructure.observability.metrics import PrometheusMetrics
+from app.infrastructure.observability.middleware import ObservabilityMiddleware
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def decide(sampler, route="/x", status_code=200, duration=0.01, faulted=False):
+    return sampler.decide(route=route, status_code=status_code, duration=duration, faulted=faulted)
+
+
+def test_errors_faults_and_slow_requests_are_always_kept():
+    sampler = RequestLogSampler(sample_rate=0.0, slow_seconds=0.5)
+    assert decide(sampler, status_code=503) == "error"
+    assert decide(sampler, faulted=True) == "fault"
+    assert decide(sampler, duration=0.6) == "slow"
+    assert decide(sampler) is None
+
+
+def test_head_sampling_uses_the_rate():
+    draws = iter([0.05, 0.5])
+    sampler = RequestLogSampler(sample_rate=0.1, rng=lambda: next(draws))
+    assert decide(sampler) == "sampled"
+    assert decide(sampler) is None
+
+
+def test_route_rate_limit_caps_sampled_records():
+    clock = FakeClock()
+    sampler = RequestLogSampler(route_rate_limits={"/api/health": 1.0}, clock=clock)
+    assert decide(sampler, route="/api/health") == "sampled"
+    assert decide(sampler, route="/api/health") is None
+    # Other routes are not limited, errors bypass the limit
+    assert decide(sampler, route="/other") == "sampled"
+    assert decide(sampler, route="/api/health", status_code=500) == "error"
+    clock.now += 1.0
+    assert decide(sampler, route="/api/health") == "sampled"
+
+
+def test_parse_route_rate_limits():
+    assert parse_route_rate_limits("/api/health=1, /api/metrics=0.2,") == {
+        "/api/health": 1.0,
+        "/api/metrics": 0.2,
+    }
+    assert parse_route_rate_limits("") == {}
+    with pytest.raises(ValueError):
+        parse_route_rate_limits("/api/health")
+    with pytest.raises(ValueError):
+        RequestLogSampler(sample_rate=2.0)
+
+
+def test_middleware_logs_one_completed_record(caplog):
+    app = FastAPI()
+
+    @app.get("/ok")
+    async def ok():
+        return {}
+
+    @app.get("/fail")
+    async def fail():
+        return Response(status_code=500)
+
+    app.add_middleware(
+        ObservabilityMiddleware,
+        metrics=PrometheusMetrics(registry=CollectorRegistry()),
+        log_sampler=RequestLogSampler(sample_rate=0.0),
+    )
+    client = TestClient(app)
+    with caplog.at_level(logging.INFO, logger="app.infrastructure.observability.middleware"):
+        client.get("/ok")
+        client.get("/fail")
+
+    records = [r for r in caplog.records if r.name.endswith("observability.middleware")]
+    assert [r.getMessage() for r in records] == ["Request completed"]
+    record = records[0]
+    assert record.route == "/fail"
+    assert record.status_code == 500
+    assert record.sample_reason == "error"
+    assert record.sample_rate == 1.0
+    assert record.started_at.endswith("+00:00")
+
+
+def test_middleware_logs_requests_whose_route_raises(caplog):
+    app = FastAPI()
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("injected")
+
+    app.add_middleware(
+        ObservabilityMiddleware,
+        metrics=PrometheusMetrics(registry=CollectorRegistry()),
+        log_sampler=RequestLogSampler(sample_rate=0.0),
+    )
+    client = TestClient(app, raise_server_exceptions=False)
+    with caplog.at_level(logging.INFO, logger="app.infrastructure.observability.middleware"):
+        assert client.get("/boom").status_code == 500
+
+    [record] = [r for r in caplog.records if r.name.endswith("observability.middleware")]
+    assert record.getMessage() == "Request completed"
+    assert record.levelno == logging.ERROR
+    assert record.status_code == 500
+    assert record.sample_reason == "error"
+    # The traceback may already be rendered into exc_text by the queue handler
+    assert "RuntimeError: injected" in logging.Formatter().format(record)
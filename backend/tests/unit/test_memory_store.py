@@ -38,3 +38,12 @@ def test_clear():
     assert store.list_active() == []
     assert store.get("foo") is None
     assert store.get("bar") is None
+
+def test_apply_batch_swaps_state():
+    store = InMemorySimulatorStore()
+    store.upsert(make_state("foo"))
+    store.upsert(make_state("bar"))
+    store.apply_batch(upserts=[make_state("baz", {"z": 1})], removals=["foo"])
+    assert set(a.name for a in store.list_active()) == {"bar", "baz"}
+    store.apply_batch(upserts=[make_state("qux")], removals=[], clear=True)
+    assert [a.name for a in store.list_active()] == ["qux"]
@@ -0,0 +1,136 @@
+"""Test the scenario metric event buffer and its wiring"""
+import asyncio
+
+from fastapi import FastAPI
+from prometheus_client import CollectorRegistry
+from starlette.testclient import TestClient
+
+from app.api.middleware.simulator_injection import SimulatorInjectionMiddleware
+from app.application.simulator.events import (
+    MetricEvent,
+    counter_event,
+    gauge_event,
+    histogram_event,
+)
+from app.application.simulator.models import MetricSpec
+from app.application.simulator.parameters import ScenarioParameters
+from app.application.simulator.scenarios.stale_read import StaleRead
+from app.infrastructure.observability.metric_events import MetricEventBuffer
+from app.infrastructure.observability.metrics import PrometheusMetrics
+
+LABELS = {"scenario": "s", "kind": "k"}
+SPECS = [
+    MetricSpec(name="ev_total", type="counter", description="c", labels=["scenario", "kind"]),
+    MetricSpec(name="ev_level", type="gauge", description="g", labels=["scenario", "kind"]),
+    MetricSpec(name="ev_seconds", type="histogram", description="h", labels=["scenario", "kind"]),
+]
+
+
+def make_metrics():
+    registry = CollectorRegistry()
+    metrics = PrometheusMetrics(registry=registry)
+    metrics.register_scenario_metrics("s", SPECS)
+    return metrics, registry
+
+
+def test_flush_aggregates_by_series():
+    metrics, registry = make_metrics()
+    buffer = MetricEventBuffer(metrics)
+
+    buffer.emit([counter_event("ev_total", **LABELS)] * 3)
+    buffer.emit([counter_event("ev_total", 2, **LABELS)])
+    buffer.emit([gauge_event("ev_level", 1, **LABELS), gauge_event("ev_level", 5, **LABELS)])
+    buffer.emit([histogram_event("ev_seconds", 0.1, **LABELS), histogram_event("ev_seconds", 0.3, **LABELS)])
+    # Nothing reaches Prometheus until a flush
+    assert registry.get_sample_value("ev_total", LABELS) is None
+
+    assert buffer.flush() == 8
+    assert buffer.pending == 0
+    assert registry.get_sample_value("ev_total", LABELS) == 5.0
+    assert registry.get_sample_value("ev_level", LABELS) == 5.0
+    assert registry.get_sample_value("ev_seconds_count", LABELS) == 2.0
+    assert abs(registry.get_sample_value("ev_seconds_sum", LABELS) - 0.4) < 1e-9
+    assert buffer.flush() == 0
+
+
+def test_size_threshold_triggers_flush():
+    metrics, registry = make_metrics()
+    buffer = MetricEventBuffer(metrics, max_pending=4)
+
+    buffer.emit([counter_event("ev_total", **LABELS)] * 3)
+    assert buffer.pending == 3
+    buffer.emit([counter_event("ev_total", **LABELS)])
+    assert buffer.pending == 0
+    assert registry.get_sample_value("ev_total", LABELS) == 4.0
+
+
+def test_bad_events_are_dropped_without_losing_the_batch():
+    metrics, registry = make_metrics()
+    buffer = MetricEventBuffer(metrics)
+
+    buffer.emit([
+        counter_event("ev_total", scenario="s"),  # missing label
+        counter_event("unknown_total", **LABELS),
+        counter_event("ev_total", **LABELS),
+    ])
+    buffer.flush()
+    assert registry.get_sample_value("ev_total", LABELS) == 1.0
+
+
+def test_background_tick_and_stop_flush():
+    metrics, registry = make_metrics()
+    buffer = MetricEventBuffer(metrics, flush_interval_seconds=0.01)
+
+    async def run():
+        await buffer.start()
+        buffer.emit([counter_event("ev_total", **LABELS)])
+        await asyncio.sleep(0.05)
+        assert registry.get_sample_value("ev_total", LABELS) == 1.0
+        buffer.emit([counter_event("ev_total", **LABELS)])
+        await buffer.stop()
+
+    asyncio.run(run())
+    assert registry.get_sample_value("ev_total", LABELS) == 2.0
+
+
+def test_events_are_hashable_and_label_order_independent():
+    a = counter_event("ev_total", scenario="s", kind="k")
+    b = counter_event("ev_total", kind="k", scenario="s")
+    assert a == b == MetricEvent("ev_total", "inc", 1.0, (("kind", "k"), ("scenario", "s")))
+    assert len({a, b}) == 1
+
+
+class _Service:
+    def __init__(self, scenario):
+        self._registry = type("Registry", (), {"get": lambda _self, name: scenario})()
+        self._active = type("Active", (), {"name": "stale-read", "parameters": {}})()
+
+    def status(self):
+        return type("Status", (), {"active": [self._active]})()
+
+    def effective_parameters(self, active):
+        return ScenarioParameters({"stale_probability": 1.0})
+
+
+def test_middleware_emits_scenario_events_to_buffer():
+    registry = CollectorRegistry()
+    metrics = PrometheusMetrics(registry=registry)
+    metrics.register_scenario_metrics("stale-read", StaleRead.meta.metrics)
+    buffer = MetricEventBuffer(metrics)
+
+    app = FastAPI()
+    app.state.simulator_service = _Service(StaleRead())
+    app.add_middleware(SimulatorInjectionMiddleware, metrics=metrics, metric_events=buffer)
+
+    @app.get("/test")
+    async def test():
+        return {"ok": True}
+
+    client = TestClient(app)
+    assert client.get("/test").status_code == 200
+    assert client.get("/test").status_code == 200
+    assert buffer.pending == 2
+
+    buffer.flush()
+    labels = {"scenario": "stale-read", "cache_key_pattern": "*"}
+    assert registry.get_sample_value("stale_read_total", labels) == 2.0
@@ -0,0 +1,81 @@
+"""Test cached, negotiated /api/metrics exposition"""
+import gzip
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry
+
+from app.api.routers.metrics import router
+from app.infrastructure.observability.exposition import MetricsExposition
+from app.infrastructure.observability.metrics import PrometheusMetrics
+
+
+class CountingMetrics(PrometheusMetrics):
+    def __init__(self):
+        super().__init__(registry=CollectorRegistry())
+        self.exports = 0
+
+    def export(self, *, openmetrics=False):
+        self.exports += 1
+        return super().export(openmetrics=openmetrics)
+
+
+def make_client(ttl_seconds=60.0):
+    metrics = CountingMetrics()
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.state.metrics = metrics
+    app.state.metrics_exposition = MetricsExposition(metrics, ttl_seconds=ttl_seconds)
+    return TestClient(app), metrics
+
+
+def test_plain_text_by_default():
+    client, _ = make_client()
+    response = client.get("/api/metrics", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "content-encoding" not in response.headers
+    assert b"http_requests_total" in response.content
+
+
+def test_openmetrics_negotiation():
+    client, _ = make_client()
+    response = client.get(
+        "/api/metrics", headers={"Accept": "application/openmetrics-text; version=1.0.0"}
+    )
+    assert response.headers["content-type"].startswith("application/openmetrics-text")
+    assert response.content.rstrip().endswith(b"# EOF")
+
+
+def test_gzip_negotiation():
+    client, _ = make_client()
+    response = client.get("/api/metrics", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    # httpx decodes transparently; the raw body is gzip
+    assert b"http_requests_total" in response.content
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+def test_snapshot_is_reused_within_ttl():
+    client, metrics = make_client(ttl_seconds=60.0)
+    client.get("/api/metrics")
+    metrics.increment_counter("simulator_scenarios_active", {"scenario_name": "foo"})
+    second = client.get("/api/metrics")
+    assert metrics.exports == 1
+    assert b'scenario_name="foo"' not in second.content
+
+
+def test_ttl_zero_disables_caching():
+    client, metrics = make_client(ttl_seconds=0.0)
+    client.get("/api/metrics")
+    client.get("/api/metrics")
+    assert metrics.exports == 2
+
+
+def test_gzip_body_is_compressed_once_per_snapshot():
+    metrics = CountingMetrics()
+    exposition = MetricsExposition(metrics, ttl_seconds=60.0)
+    first = exposition.render(gzip_ok=True)
+    second = exposition.render(gzip_ok=True)
+    assert first.body is second.body
+    assert gzip.decompress(first.body) == exposition.render().body
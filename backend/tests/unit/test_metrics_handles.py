@@ -0,0 +1,122 @@
+"""Test bound metric handles and the labelled-child LRU"""
+from prometheus_client import CollectorRegistry
+
+from app.application.ports.metrics import MetricsPort
+from app.infrastructure.observability.metrics import PrometheusMetrics
+
+LABELS = {"method": "GET", "endpoint": "/api/health", "status": "200"}
+
+
+def sample(registry, name, labels):
+    return registry.get_sample_value(name, labels)
+
+
+def test_handles_update_the_labelled_series():
+    registry = CollectorRegistry()
+    metrics = PrometheusMetrics(registry=registry)
+
+    counter = metrics.counter("http_requests_total", LABELS)
+    counter.inc()
+    counter.inc()
+    metrics.histogram("http_request_duration_seconds", LABELS).observe(0.2)
+    metrics.gauge("simulator_scenarios_enabled", {"scenario_name": "foo"}).set(1.0)
+
+    assert sample(registry, "http_requests_total", LABELS) == 2.0
+    assert sample(registry, "http_request_duration_seconds_count", LABELS) == 1.0
+    assert sample(registry, "simulator_scenarios_enabled", {"scenario_name": "foo"}) == 1.0
+
+
+def test_children_are_resolved_once():
+    metrics = PrometheusMetrics(registry=CollectorRegistry())
+    first = metrics.counter("http_requests_total", LABELS)
+    assert metrics.counter("http_requests_total", dict(LABELS)) is first
+    # Name-based methods share the same cache
+    metrics.increment_counter("http_requests_total", LABELS)
+    assert len(metrics._children) == 1
+
+
+def test_child_cache_is_bounded_lru():
+    registry = CollectorRegistry()
+    metrics = PrometheusMetrics(registry=registry, child_cache_size=2)
+    a, b, c = ({**LABELS, "status": s} for s in ("200", "404", "500"))
+
+    metrics.increment_counter("http_requests_total", a)
+    metrics.increment_counter("http_requests_total", b)
+    metrics.increment_counter("http_requests_total", a)  # a is now most recent
+    metrics.increment_counter("http_requests_total", c)  # evicts b
+
+    keys = [dict(k[1])["status"] for k in metrics._children]
+    assert keys == ["200", "500"]
+    # Eviction only drops the cached handle, never the series
+    metrics.increment_counter("http_requests_total", b)
+    assert sample(registry, "http_requests_total", b) == 2.0
+
+
+def test_unknown_metric_handles_are_noops():
+    metrics = PrometheusMetrics(registry=CollectorRegistry())
+    metrics.counter("nope", LABELS).inc()
+    metrics.histogram("nope").observe(1.0)
+    metrics.gauge("nope").set(1.0)
+
+
+class RecordingPort(MetricsPort):
+    def __init__(self):
+        self.calls = []
+
+    def increment_counter(self, name, labels=None):
+        self.calls.append(("inc", name, labels))
+
+    def observe_histogram(self, name, value, labels=None):
+        self.calls.append(("observe", name, value, labels))
+
+    def set_gauge(self, name, value, labels=None):
+        self.calls.append(("set", name, value, labels))
+
+    def register_scenario_metrics(self, scenario_name, metrics):
+        pass
+
+    def get_metrics(self):
+        return b""
+
+
+def test_default_port_handles_delegate_to_name_based_methods():
+    port = RecordingPort()
+    port.counter("c", {"a": "1"}).inc()
+    port.histogram("h").observe(0.5)
+    port.gauge("g", {"b": "2"}).set(3.0)
+    assert port.calls == [
+        ("inc", "c", {"a": "1"}),
+        ("observe", "h", 0.5, None),
+        ("set", "g", 3.0, {"b": "2"}),
+    ]
+
+
+def test_cardinality_cap_folds_overflow_into_other():
+    registry = CollectorRegistry()
+    metrics = PrometheusMetrics(registry=registry, max_series_per_metric=2)
+    paths = ["/a", "/b", "/c", "/d"]
+    for path in paths:
+        metrics.increment_counter("http_requests_total", {**LABELS, "endpoint": path})
+    metrics.increment_counter("http_requests_total", {**LABELS, "endpoint": "/a"})
+
+    assert sample(registry, "http_requests_total", {**LABELS, "endpoint": "/a"}) == 2.0
+    assert sample(registry, "http_requests_total", {**LABELS, "endpoint": "/c"}) is None
+    other = {"method": "__other__", "endpoint": "__other__", "status": "__other__"}
+    assert sample(registry, "http_requests_total", other) == 2.0
+    dropped = {"metric": "http_requests_total"}
+    assert sample(registry, "metrics_series_dropped_total", dropped) == 2.0
+
+
+def test_series_limits_override_per_metric():
+    registry = CollectorRegistry()
+    metrics = PrometheusMetrics(
+        registry=registry, max_series_per_metric=100, series_limits={"http_requests_total": 1}
+    )
+    for status in ("200", "500"):
+        labels = {**LABELS, "status": status}
+        metrics.increment_counter("http_requests_total", labels)
+        metrics.observe_histogram("http_request_duration_seconds", 0.1, labels)
+
+    dropped = "metrics_series_dropped_total"
+    assert sample(registry, dropped, {"metric": "http_requests_total"}) == 1.0
+    assert sample(registry, dropped, {"metric": "http_request_duration_seconds"}) is None
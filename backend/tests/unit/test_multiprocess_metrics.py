@@ -0,0 +1,84 @@
+"""Test multiprocess metrics aggregation and dead-worker cleanup"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.infrastructure.observability.multiprocess import (
+    MultiProcessPrometheusMetrics,
+    worker_pids,
+)
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+# prometheus_client picks file-backed values at import time, so each "worker"
+# runs in its own interpreter with PROMETHEUS_MULTIPROC_DIR set
+WORKER = """
+import sys
+from app.infrastructure.observability.multiprocess import MultiProcessPrometheusMetrics
+from app.application.simulator.models import MetricSpec
+
+metrics = MultiProcessPrometheusMetrics(sys.argv[1])
+metrics.register_scenario_metrics("memory-leak", [
+    MetricSpec(name="memory_leaked_bytes", type="gauge", description="d",
+               labels=["scenario"], multiprocess_mode="livesum"),
+])
+metrics.increment_counter("http_requests_total",
+                          {"method": "GET", "endpoint": "/api/health", "status": "200"})
+metrics.set_gauge("memory_leaked_bytes", float(sys.argv[2]), {"scenario": "memory-leak"})
+metrics.set_gauge("simulator_scenarios_enabled", float(sys.argv[3]), {"scenario_name": "foo"})
+if sys.argv[4] == "scrape":
+    sys.stdout.write(metrics.get_metrics().decode())
+"""
+
+
+def run_worker(tmp_path, leaked, enabled, action="exit"):
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path), "PYTHONPATH": str(SRC)}
+    result = subprocess.run(
+        [sys.executable, "-c", WORKER, str(tmp_path), str(leaked), str(enabled), action],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def test_scrape_aggregates_all_workers(tmp_path):
+    run_worker(tmp_path, leaked=100, enabled=1)
+    run_worker(tmp_path, leaked=200, enabled=0)
+    output = run_worker(tmp_path, leaked=50, enabled=1, action="scrape")
+
+    # Counters sum across workers, including ones that have exited
+    assert 'http_requests_total{endpoint="/api/health",method="GET",status="200"} 3.0' in output
+    # livesum gauges only count live workers: the two exited workers were reaped
+    assert 'memory_leaked_bytes{scenario="memory-leak"} 50.0' in output
+    # mostrecent: the last write wins regardless of worker
+    assert 'simulator_scenarios_enabled{scenario_name="foo"} 1.0' in output
+
+
+def test_cleanup_removes_only_live_gauge_files_of_dead_workers(tmp_path):
+    dead_pid = 2**22 + 12345  # above the default pid_max, never alive
+    for name in (
+        f"counter_{dead_pid}.db",
+        f"gauge_livesum_{dead_pid}.db",
+        f"gauge_all_{os.getpid()}.db",
+    ):
+        (tmp_path / name).write_bytes(b"")
+
+    metrics = MultiProcessPrometheusMetrics(tmp_path)
+    assert worker_pids(tmp_path) == {dead_pid, os.getpid()}
+    assert metrics.cleanup_dead_workers() == [dead_pid]
+
+    remaining = sorted(p.name for p in tmp_path.iterdir())
+    assert remaining == [f"counter_{dead_pid}.db", f"gauge_all_{os.getpid()}.db"]
+    # Already reaped pids are not rescanned
+    assert metrics.cleanup_dead_workers() == []
+
+
+def test_missing_directory_is_rejected(tmp_path):
+    with pytest.raises(RuntimeError):
+        MultiProcessPrometheusMetrics(tmp_path / "missing")
@@ -0,0 +1,132 @@
+"""Test ObservabilityMiddleware endpoint labels"""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry
+
+from app.infrastructure.observability.metrics import PrometheusMetrics
+from app.infrastructure.observability.middleware import ObservabilityMiddleware
+from app.infrastructure.observability.routes import UNMATCHED_ROUTE
+
+
+def make_client():
+    registry = CollectorRegistry()
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        return {"id": item_id}
+
+    def shared():
+        return {}
+
+    app.add_api_route("/one", shared)
+    app.add_api_route("/two/{x}", shared)
+    app.add_middleware(ObservabilityMiddleware, metrics=PrometheusMetrics(registry=registry))
+    return TestClient(app), registry
+
+
+def requests_total(registry, endpoint, status="200"):
+    return registry.get_sample_value(
+        "http_requests_total", {"method": "GET", "endpoint": endpoint, "status": status}
+    )
+
+
+def test_endpoint_label_is_route_template():
+    client, registry = make_client()
+    for item_id in range(5):
+        assert client.get(f"/items/{item_id}").status_code == 200
+
+    assert requests_total(registry, "/items/{item_id}") == 5.0
+    assert requests_total(registry, "/items/0") is None
+
+
+def test_unmatched_paths_share_one_label():
+    client, registry = make_client()
+    for i in range(3):
+        assert client.get(f"/scan/{i}").status_code == 404
+
+    assert requests_total(registry, UNMATCHED_ROUTE, "404") == 3.0
+
+
+def test_shared_endpoint_resolves_the_matching_route():
+    client, registry = make_client()
+    client.get("/one")
+    client.get("/two/abc")
+
+    assert requests_total(registry, "/one") == 1.0
+    assert requests_total(registry, "/two/{x}") == 1.0
+
+
+def test_sampled_slow_requests_carry_trace_id_exemplar(monkeypatch):
+    from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags
+
+    from app.infrastructure.observability import middleware
+
+    sampled = TraceFlags(TraceFlags.SAMPLED)
+    span_context = SpanContext(trace_id=0xABC, span_id=0x1, is_remote=False, trace_flags=sampled)
+    monkeypatch.setattr(
+        middleware.trace, "get_current_span", lambda: NonRecordingSpan(span_context)
+    )
+
+    registry = CollectorRegistry()
+    metrics = PrometheusMetrics(registry=registry)
+    app = FastAPI()
+
+    @app.get("/slow")
+    def slow():
+        return {}
+
+    app.add_middleware(ObservabilityMiddleware, metrics=metrics, exemplar_min_seconds=0.0)
+    TestClient(app).get("/slow")
+
+    body, content_type = metrics.export(openmetrics=True)
+    assert content_type.startswith("application/openmetrics-text")
+    assert f'# {{trace_id="{0xABC:032x}"}}' in body.decode()
+    # Exemplars exist only in the OpenMetrics format
+    assert "trace_id" not in metrics.export()[0].decode()
+
+
+def test_fast_or_unsampled_requests_have_no_exemplar():
+    client, registry = make_client()
+    client.get("/items/1")
+    samples = [
+        s
+        for m in registry.collect()
+        if m.name == "http_request_duration_seconds"
+        for s in m.samples
+    ]
+    assert samples and all(s.exemplar is None for s in samples)
+
+
+def test_query_counts_per_route_and_n_plus_one():
+    from app.infrastructure.db.query_stats import current_queries
+
+    registry = CollectorRegistry()
+    app = FastAPI()
+
+    @app.get("/orders/{n}")
+    async def orders(n: int):
+        queries = current_queries()
+        queries.record("SELECT * FROM orders", 0.001)
+        for order_id in range(n):
+            queries.record(f"SELECT * FROM order_lines WHERE order_id = {order_id}", 0.001)
+        return {}
+
+    @app.get("/plain")
+    async def plain():
+        return {}
+
+    app.add_middleware(
+        ObservabilityMiddleware, metrics=PrometheusMetrics(registry=registry), n_plus_one_threshold=3
+    )
+    client = TestClient(app)
+    client.get("/orders/1")
+    client.get("/orders/5")
+    client.get("/plain")
+
+    labels = {"endpoint": "/orders/{n}"}
+    assert registry.get_sample_value("db_queries_per_request_count", labels) == 2.0
+    assert registry.get_sample_value("db_queries_per_request_sum", labels) == 2.0 + 6.0
+    assert registry.get_sample_value("db_n_plus_one_total", labels) == 1.0
+    # Requests without statements aren't observed
+    assert registry.get_sample_value("db_queries_per_request_count", {"endpoint": "/plain"}) is None
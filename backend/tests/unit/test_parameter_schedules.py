@@ -0,0 +1,164 @@
+"""Test time-varying scenario parameter schedules"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.application.simulator.app_models import ActiveScenarioApp, EnableScenarioRequestApp
+from app.application.simulator.exceptions import InvalidParametersError
+from app.application.simulator.schedules import (
+    Ramp,
+    ScheduledParameters,
+    SineWave,
+    SquareWave,
+    Steps,
+    parse_schedule,
+)
+from app.application.simulator.service import SimulatorService
+from app.infrastructure.simulator.memory_store import InMemorySimulatorStore
+
+T0 = datetime(2026, 2, 11, 12, 0, 0, tzinfo=UTC)
+
+
+def test_parse_constant_is_not_a_schedule():
+    assert parse_schedule(100) is None
+    assert parse_schedule({"a": 1}) is None
+
+
+def test_ramp():
+    ramp = parse_schedule({"schedule": "ramp", "from": 10, "to": 110, "duration_seconds": 10})
+    assert isinstance(ramp, Ramp)
+    assert ramp.resolve(0) == 10
+    assert ramp.resolve(5) == 60
+    assert ramp.resolve(60) == 110
+    assert isinstance(ramp.resolve(2.5), int)
+
+
+def test_steps_capped():
+    steps = parse_schedule(
+        {"schedule": "steps", "from": 100, "step": 100, "interval_seconds": 10, "to": 250}
+    )
+    assert isinstance(steps, Steps)
+    assert [steps.resolve(t) for t in (0, 9.9, 10, 25, 100)] == [100, 100, 200, 250, 250]
+
+
+def test_square_wave():
+    square = parse_schedule(
+        {"schedule": "square", "low": 0.0, "high": 1.0, "period_seconds": 10, "duty_cycle": 0.3}
+    )
+    assert isinstance(square, SquareWave)
+    assert square.resolve(1) == 1.0
+    assert square.resolve(5) == 0.0
+    assert square.resolve(11) == 1.0
+
+
+def test_sine_wave():
+    sine = parse_schedule({"schedule": "sine", "low": 0.0, "high": 2.0, "period_seconds": 4})
+    assert isinstance(sine, SineWave)
+    assert sine.resolve(0) == pytest.approx(1.0)
+    assert sine.resolve(1) == pytest.approx(2.0)
+    assert sine.resolve(3) == pytest.approx(0.0)
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        {"schedule": "ramp", "from": 1, "to": 2},
+        {"schedule": "ramp", "from": "a", "to": 2, "duration_seconds": 1},
+        {"schedule": "steps", "from": 1, "step": 1, "interval_seconds": 0},
+        {"schedule": "square", "low": 0, "high": 1, "period_seconds": 1, "duty_cycle": 2},
+        {"schedule": "sawtooth"},
+    ],
+)
+def test_malformed_schedules_raise(spec):
+    with pytest.raises(ValueError):
+        parse_schedule(spec)
+
+
+def test_scheduled_parameters_cached_per_tick():
+    params = {
+        "ms": {"schedule": "ramp", "from": 0, "to": 1000, "duration_seconds": 10},
+        "path_prefix": "/api",
+    }
+    scheduled = ScheduledParameters(params, enabled_at=T0, tick_seconds=1.0)
+    first = scheduled.at(T0 + timedelta(seconds=2.2))
+    assert first == {"ms": 200, "path_prefix": "/api"}
+    # Same tick: same object, no recomputation
+    assert scheduled.at(T0 + timedelta(seconds=2.9)) is first
+    assert scheduled.at(T0 + timedelta(seconds=3.0))["ms"] == 300
+
+
+def test_static_parameters_are_returned_unchanged():
+    params = {"ms": 100}
+    scheduled = ScheduledParameters(params, enabled_at=T0)
+    assert not scheduled.is_dynamic
+    assert scheduled.at(T0 + timedelta(seconds=5)) == params
+
+
+class StepClock:
+    def __init__(self):
+        self.now_value = T0
+
+    def now(self):
+        return self.now_value
+
+
+class FakeScenario:
+    def __init__(self, name):
+        self.meta = type(
+            "Meta",
+            (),
+            {
+                "name": name,
+                "parameter_schema": {
+                    "type": "object",
+                    "properties": {"ms": {"type": "integer", "minimum": 1, "maximum": 10_000}},
+                },
+                "safety_limits": {"max_ms": 5000},
+            },
+        )()
+
+
+class FakeRegistry:
+    def __init__(self):
+        self.scenarios = {"fixed-latency": FakeScenario("fixed-latency")}
+
+    def get(self, name):
+        return self.scenarios[name]
+
+
+def test_service_effective_parameters_follow_schedule():
+    clock = StepClock()
+    svc = SimulatorService(store=InMemorySimulatorStore(), clock=clock, registry=FakeRegistry())
+    ramp = {"schedule": "ramp", "from": 100, "to": 200, "duration_seconds": 10}
+    status = svc.enable(EnableScenarioRequestApp(name="fixed-latency", parameters={"ms": ramp}))
+    active = status.active[0]
+    assert svc.effective_parameters(active)["ms"] == 100
+    clock.now_value = T0 + timedelta(seconds=5)
+    assert svc.effective_parameters(active)["ms"] == 150
+    # Re-enabling resets the schedule origin
+    relaunched = ActiveScenarioApp(
+        name=active.name, parameters=active.parameters, enabled_at=clock.now_value
+    )
+    assert svc.effective_parameters(relaunched)["ms"] == 100
+
+
+def test_service_rejects_malformed_schedule():
+    svc = SimulatorService(
+        store=InMemorySimulatorStore(), clock=StepClock(), registry=FakeRegistry()
+    )
+    with pytest.raises(InvalidParametersError):
+        svc.enable(
+            EnableScenarioRequestApp(
+                name="fixed-latency", parameters={"ms": {"schedule": "ramp", "from": 1}}
+            )
+        )
+
+
+def test_service_clamps_scheduled_values_to_safety_limits():
+    clock = StepClock()
+    svc = SimulatorService(store=InMemorySimulatorStore(), clock=clock, registry=FakeRegistry())
+    ramp = {"schedule": "ramp", "from": 1000, "to": 9000, "duration_seconds": 10}
+    status = svc.enable(EnableScenarioRequestApp(name="fixed-latency", parameters={"ms": ramp}))
+    clock.now_value = T0 + timedelta(seconds=10)
+    assert svc.effective_parameters(status.active[0]).get_int("ms") == 5000
@@ -0,0 +1,121 @@
+"""Test per-request query stats and the order loading strategies"""
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.infrastructure.commerce.orm import ProductRow, create_schema
+from app.infrastructure.commerce.sql_repository import SqlCustomerRepository, SqlOrderRepository
+from app.infrastructure.db.query_stats import (
+    RequestQueries,
+    bind_queries,
+    fingerprint,
+    install_query_stats,
+    reset_queries,
+)
+
+NOW = datetime(2026, 3, 1, 12, 0, 0, tzinfo=UTC)
+
+
+def test_fingerprint_normalizes_literals_placeholders_and_in_lists():
+    assert fingerprint("SELECT * FROM t WHERE id = 42 AND name = 'O''Brien'") == (
+        "SELECT * FROM t WHERE id = ? AND name = ?"
+    )
+    assert fingerprint("SELECT a\n  FROM t WHERE a IN (?, ?, ?)") == fingerprint(
+        "SELECT a FROM t WHERE a IN (?)"
+    )
+    assert fingerprint("SELECT a FROM t WHERE a = %(a_1)s LIMIT %s") == (
+        "SELECT a FROM t WHERE a = ? LIMIT ?"
+    )
+    assert fingerprint("SELECT a::int FROM t1 WHERE b = $1 OR c = :c") == (
+        "SELECT a::int FROM t1 WHERE b = ? OR c = ?"
+    )
+
+
+def test_n_plus_one_needs_a_repeated_select_at_the_threshold():
+    queries = RequestQueries()
+    queries.record("SELECT * FROM orders WHERE customer_id = ?", 0.01)
+    for order_id in range(4):
+        queries.record(f"SELECT * FROM order_lines WHERE order_id = {order_id}", 0.01)
+        queries.record("UPDATE products SET stock = stock - 1 WHERE id = ?", 0.01)
+
+    assert queries.count == 9
+    assert abs(queries.seconds - 0.09) < 1e-9
+    assert queries.n_plus_one(5) is None
+    # Repeated writes are not N+1 reads
+    assert queries.n_plus_one(4) == ("SELECT * FROM order_lines WHERE order_id = ?", 4)
+
+
+def test_only_statements_in_a_bound_context_are_counted():
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        install_query_stats(engine)
+        queries = RequestQueries()
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                token = bind_queries(queries)
+                try:
+                    await conn.execute(text("SELECT 2"))
+                    await conn.execute(text("SELECT 3"))
+                    try:
+                        await conn.execute(text("SELECT * FROM missing"))
+                    except Exception:
+                        pass
+                finally:
+                    reset_queries(token)
+                await conn.execute(text("SELECT 4"))
+        finally:
+            await engine.dispose()
+        return queries
+
+    queries = asyncio.run(main())
+    assert queries.count == 3
+    assert queries.fingerprints["SELECT ?"] == 2
+    assert queries.seconds > 0
+
+
+def test_loading_strategies_return_the_same_orders_with_different_query_counts(tmp_path):
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'shop.db'}")
+        await create_schema(engine)
+        install_query_stats(engine)
+        async with async_sessionmaker(engine).begin() as session:
+            session.add_all(
+                ProductRow(sku=f"P-{i}", name=f"P {i}", category="c", price_cents=100, stock=100)
+                for i in range(3)
+            )
+        customers, orders = SqlCustomerRepository(engine), SqlOrderRepository(engine)
+        ada = await customers.add(email="ada@example.com", name="Ada", created_at=NOW)
+        for i in range(5):
+            await orders.place(
+                customer_id=ada.id, quantities={1: 1, 2: i + 1}, created_at=NOW + timedelta(i)
+            )
+
+        results = {}
+        try:
+            for loading in ("lazy", "joined", "selectin"):
+                queries = RequestQueries()
+                token = bind_queries(queries)
+                try:
+                    history = await orders.list_for_customer(ada.id, limit=10, loading=loading)
+                    single = await orders.get(history[0].id, loading=loading)
+                finally:
+                    reset_queries(token)
+                results[loading] = (history, single, queries)
+        finally:
+            await engine.dispose()
+        return results
+
+    results = asyncio.run(main())
+    lazy_history, lazy_single, lazy = results["lazy"]
+    for history, single, _ in results.values():
+        assert history == lazy_history and single == lazy_single
+    assert [line.quantity for line in lazy_history[0].lines] == [1, 5]
+    # SELECT statements only: a session begins without issuing BEGIN on SQLite
+    assert lazy.count == (1 + 5) + (1 + 1)
+    assert lazy.n_plus_one(5) is not None
+    assert results["joined"][2].count == 1 + 1
+    assert results["selectin"][2].count == 2 + 2
+    assert results["selectin"][2].n_plus_one(3) is None
@@ -0,0 +1,164 @@
+"""Test rolling-window scenario impact analytics and /api/sim/impact"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from prometheus_client import CollectorRegistry
+from starlette.testclient import TestClient
+
+from app.api.middleware.simulator_injection import SimulatorInjectionMiddleware
+from app.api.routers import simulator
+from app.infrastructure.observability.impact import ImpactAnalyzer
+from app.infrastructure.observability.latency import LatencyRecorder
+from app.infrastructure.observability.metrics import PrometheusMetrics
+from app.infrastructure.observability.middleware import ObservabilityMiddleware
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_segments_are_keyed_by_active_set():
+    clock = FakeClock()
+    analyzer = ImpactAnalyzer(clock=clock)
+    analyzer.record(["b", "a"], 0.1, error=False)
+    analyzer.record(["a", "b"], 0.1, error=True)
+    analyzer.record([], 0.01, error=False)
+
+    stats = analyzer.stats(["a", "b"])
+    assert stats.scenarios == ("a", "b")
+    assert stats.requests == 2
+    assert stats.error_rate == 0.5
+    assert [s.scenarios for s in analyzer.segments()] == [(), ("a", "b")]
+
+
+def test_window_rolls_over_old_slots():
+    clock = FakeClock()
+    analyzer = ImpactAnalyzer(slot_seconds=1.0, window_slots=3, clock=clock)
+    for _ in range(5):
+        analyzer.record([], 2.0, error=True)
+    clock.now += 10
+    for _ in range(4):
+        clock.now += 1
+        analyzer.record([], 0.01, error=False)
+
+    stats = analyzer.stats([])
+    # Only the last three one-second slots count
+    assert stats.requests == 3
+    assert stats.errors == 0
+    assert stats.p99_seconds == pytest.approx(0.01, rel=0.05)
+    assert stats.throughput_rps == pytest.approx(3 / 2)
+
+
+def test_impact_compares_against_set_without_scenario():
+    clock = FakeClock()
+    analyzer = ImpactAnalyzer(clock=clock)
+    for _ in range(100):
+        analyzer.record([], 0.010, error=False)
+    clock.now += 60
+    for i in range(100):
+        analyzer.record(["fixed-latency"], 0.510, error=i % 10 == 0)
+
+    [impact] = analyzer.impact(["fixed-latency"])
+    assert impact.before.requests == 100
+    assert impact.after.requests == 100
+    assert impact.p95_delta_seconds == pytest.approx(0.5, rel=0.05)
+    assert impact.error_rate_delta == pytest.approx(0.1)
+
+    # No baseline traffic for this set yet
+    [unknown] = analyzer.impact(["cpu-spike", "fixed-latency"])[:1]
+    assert unknown.after is None and unknown.p95_delta_seconds is None
+
+
+def test_least_recently_seen_segment_is_evicted():
+    analyzer = ImpactAnalyzer(max_segments=2, clock=FakeClock())
+    analyzer.record(["a"], 0.1, error=False)
+    analyzer.record(["b"], 0.1, error=False)
+    analyzer.record(["a"], 0.1, error=False)
+    analyzer.record(["c"], 0.1, error=False)
+    assert analyzer.stats(["b"]) is None
+    assert analyzer.stats(["a"]).requests == 2
+
+
+def test_impact_endpoint_reports_active_scenarios():
+    clock = FakeClock()
+    analyzer = ImpactAnalyzer(clock=clock)
+    analyzer.record([], 0.010, error=False)
+    analyzer.record(["fixed-latency"], 0.210, error=False)
+
+    app = FastAPI()
+    app.state.impact_analyzer = analyzer
+    app.state.simulator_service = SimpleNamespace(
+        status=lambda: SimpleNamespace(active=[SimpleNamespace(name="fixed-latency")])
+    )
+    app.include_router(simulator.router, prefix="/api/sim")
+
+    body = TestClient(app).get("/api/sim/impact").json()
+    assert body["active"] == ["fixed-latency"]
+    [report] = body["impacts"]
+    assert report["before"]["scenarios"] == []
+    assert report["after"]["scenarios"] == ["fixed-latency"]
+    assert report["p95_delta_ms"] == pytest.approx(200, rel=0.05)
+    assert len(body["segments"]) == 2
+
+
+def test_middleware_records_requests_under_active_set():
+    analyzer = ImpactAnalyzer()
+    scenario = SimpleNamespace(is_applicable=lambda *, target: False)
+    service = SimpleNamespace(
+        status=lambda: SimpleNamespace(active=[SimpleNamespace(name="cpu-spike")]),
+        _registry=SimpleNamespace(get=lambda name: scenario),
+    )
+    app = FastAPI()
+    app.state.simulator_service = service
+    app.add_middleware(SimulatorInjectionMiddleware)
+    app.add_middleware(
+        ObservabilityMiddleware,
+        metrics=PrometheusMetrics(registry=CollectorRegistry()),
+        impact=analyzer,
+    )
+
+    @app.get("/work")
+    async def work():
+        return {}
+
+    client = TestClient(app)
+    client.get("/work")
+    client.get("/api/sim/anything")  # control traffic is not attributed
+    assert [s.scenarios for s in analyzer.segments()] == [("cpu-spike",)]
+    assert analyzer.stats(["cpu-spike"]).requests == 1
+
+
+def test_scrapes_and_simulator_control_are_not_analyzed():
+    analyzer = ImpactAnalyzer()
+    recorder = LatencyRecorder()
+    service = SimpleNamespace(
+        status=lambda: SimpleNamespace(active=[]),
+        _registry=SimpleNamespace(get=lambda name: None),
+    )
+    app = FastAPI()
+    app.state.simulator_service = service
+    app.add_middleware(SimulatorInjectionMiddleware)
+    app.add_middleware(
+        ObservabilityMiddleware,
+        metrics=PrometheusMetrics(registry=CollectorRegistry()),
+        latency=recorder,
+        impact=analyzer,
+    )
+
+    async def ok():
+        return {}
+
+    for path in ("/work", "/api/metrics", "/api/sim/status"):
+        app.add_api_route(path, ok)
+
+    client = TestClient(app)
+    for path in ("/work", "/api/metrics", "/api/metrics", "/api/sim/status"):
+        assert client.get(path).status_code == 200
+
+    assert analyzer.stats([]).requests == 1
+    assert [s.route for s in recorder.snapshot().series] == ["/work"]
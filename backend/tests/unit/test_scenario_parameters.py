@@ -0,0 +1,108 @@
+"""Test compiled parameter validation and typed ScenarioParameters"""
+
+import pytest
+
+from app.application.simulator.parameters import ParameterValidator, ScenarioParameters
+from app.application.simulator.registry import build_registry
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "ms": {"type": "integer", "minimum": 1, "maximum": 10_000},
+        "probability": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+        "path_prefix": {"type": "string"},
+        "severity": {"type": "string", "enum": ["low", "high"]},
+        "drop": {"type": "boolean", "default": False},
+    },
+    "required": ["ms"],
+}
+LIMITS = {"max_ms": 5000, "max_probability": 0.9}
+
+
+@pytest.fixture
+def validator():
+    return ParameterValidator.compile(SCHEMA, LIMITS)
+
+
+def test_validate_coerces_and_fills_defaults(validator):
+    out = validator.validate({"ms": "250", "probability": 1, "extra": "kept"})
+    assert out == {"ms": 250, "probability": 0.9, "drop": False, "extra": "kept"}
+    assert isinstance(out["ms"], int)
+    assert isinstance(out["probability"], float)
+
+
+def test_values_above_safety_limit_are_clamped(validator):
+    assert validator.validate({"ms": 9000})["ms"] == 5000
+
+
+@pytest.mark.parametrize(
+    "params,message",
+    [
+        ({}, "missing required parameter 'ms'"),
+        ({"ms": 0}, "'ms' must be >= 1"),
+        ({"ms": 20_000}, "'ms' must be <= 10000"),
+        ({"ms": 1.5}, "'ms' must be an integer"),
+        ({"ms": "fast"}, "'ms' must be a number"),
+        ({"ms": True}, "'ms' must be a number"),
+        ({"ms": 1, "path_prefix": 5}, "'path_prefix' must be a string"),
+        ({"ms": 1, "severity": "medium"}, "'severity' must be one of"),
+        ({"ms": 1, "drop": "yes"}, "'drop' must be a boolean"),
+        ({"ms": 1, "path_prefix": {"schedule": "ramp"}}, "'path_prefix' does not accept"),
+    ],
+)
+def test_validate_rejects_invalid(validator, params, message):
+    with pytest.raises(ValueError, match=message):
+        validator.validate(params)
+
+
+def test_schedules_pass_through_and_clamp_when_resolved(validator):
+    ramp = {"schedule": "ramp", "from": 1, "to": 9000, "duration_seconds": 10}
+    assert validator.validate({"ms": ramp})["ms"] == ramp
+    assert validator.clamp("ms", 7000.4) == 5000
+    assert validator.clamp("ms", -3) == 1
+    assert validator.clamp("unknown", 7) == 7
+
+
+def test_typed_getters():
+    params = ScenarioParameters({"ms": 100, "p": 0.5, "s": "x", "b": True, "n": 3})
+    assert params.get_int("ms") == 100
+    assert params.get_float("p") == 0.5
+    assert params.get_float("n") == 3.0
+    assert params.get_str("s") == "x"
+    assert params.get_bool("b") is True
+    # Missing or mistyped values fall back to the default
+    assert params.get_int("missing", 7) == 7
+    assert params.get_int("b", 7) == 7
+    assert params.get_str("ms", "d") == "d"
+
+
+def test_scenario_parameters_is_read_only_mapping():
+    params = ScenarioParameters({"ms": 100})
+    assert params == {"ms": 100}
+    assert dict(params) == {"ms": 100}
+    with pytest.raises(TypeError):
+        params["ms"] = 5  # type: ignore[index]
+
+
+def test_builtin_scenario_schemas_compile_and_accept_profiles():
+    from app.application.simulator.profiles import build_profiles
+
+    registry = build_registry()
+    validators = {
+        name: ParameterValidator.compile(s.meta.parameter_schema, s.meta.safety_limits)
+        for name, s in registry.scenarios.items()
+    }
+    for profile in build_profiles().values():
+        for op in profile.operations:
+            validators[op.name].validate(op.parameters)
+
+
+def test_stale_read_safety_limit_applies():
+    scenario = build_registry().get("stale-read")
+    validator = ParameterValidator.compile(
+        scenario.meta.parameter_schema, scenario.meta.safety_limits
+    )
+    assert validator.validate({"stale_probability": 1.0}) == {
+        "stale_probability": 0.9,
+        "cache_key_pattern": "*",
+    }
@@ -0,0 +1,94 @@
+"""Test the Server-Timing breakdown and per-phase histograms"""
+import time
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry
+
+from app.api.middleware.simulator_injection import SimulatorInjectionMiddleware
+from app.infrastructure.observability.metrics import PrometheusMetrics
+from app.infrastructure.observability.middleware import ObservabilityMiddleware
+from app.infrastructure.observability.server_timing import PHASES, RequestTimings, TimedRoute
+
+
+class FakeSimService:
+    def __init__(self, effects):
+        scenario = type(
+            "Scenario", (), {"is_applicable": lambda self, target: True, "apply": lambda self, ctx, parameters: dict(effects)}
+        )()
+        self._registry = type("Registry", (), {"get": lambda self, name: scenario})()
+        self._active = [type("Active", (), {"name": "fixed-latency"})()]
+
+    def status(self):
+        return type("Status", (), {"active": self._active})()
+
+    def effective_parameters(self, active):
+        return {}
+
+
+def make_client(server_timing=True, effects=None):
+    registry = CollectorRegistry()
+    metrics = PrometheusMetrics(registry=registry)
+    router = APIRouter(route_class=TimedRoute)
+
+    @router.get("/work")
+    async def work():
+        time.sleep(0.03)
+        return {"items": list(range(10))}
+
+    @router.get("/sync/{x}")
+    def sync_work(x: int):
+        time.sleep(0.02)
+        return {"x": x}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.state.simulator_service = FakeSimService(effects or {})
+    app.add_middleware(SimulatorInjectionMiddleware, metrics=metrics)
+    app.add_middleware(ObservabilityMiddleware, metrics=metrics, server_timing=server_timing)
+    return TestClient(app), registry
+
+
+def parse(header):
+    entries = (part.strip().split(";dur=") for part in header.split(","))
+    return {name: float(ms) for name, ms in entries}
+
+
+def test_header_breaks_total_into_phases():
+    client, registry = make_client(effects={"http_delay_ms": 40})
+    resp = client.get("/work")
+
+    phases = parse(resp.headers["Server-Timing"])
+    assert list(phases) == [*PHASES, "total"]
+    assert phases["inject"] >= 40
+    assert phases["handler"] >= 30
+    assert abs(sum(phases[p] for p in PHASES) - phases["total"]) < 0.1
+    count = registry.get_sample_value(
+        "http_request_phase_duration_seconds_count", {"endpoint": "/work", "phase": "inject"}
+    )
+    assert count == 1.0
+
+
+def test_sync_endpoints_are_timed_in_the_threadpool():
+    client, _ = make_client()
+    resp = client.get("/sync/3")
+    assert resp.json() == {"x": 3}
+    assert parse(resp.headers["Server-Timing"])["handler"] >= 20
+
+
+def test_disabled_by_default():
+    client, registry = make_client(server_timing=False)
+    resp = client.get("/work")
+    assert "Server-Timing" not in resp.headers
+    assert registry.get_sample_value(
+        "http_request_phase_duration_seconds_count", {"endpoint": "/work", "phase": "handler"}
+    ) is None
+
+
+def test_middleware_is_the_unattributed_remainder():
+    timings = RequestTimings()
+    timings.add("handler", 0.004)
+    timings.add("serialize", 0.001)
+    assert timings.breakdown(0.010)["middleware"] == 0.005
+    assert timings.breakdown(0.001)["middleware"] == 0.0
+    assert timings.header(0.010).endswith("total;dur=10.00")
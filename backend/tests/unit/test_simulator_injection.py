@@ -13,6 +13,8 @@ class DummySimService:
         self._status_return = status_return
     def status(self):
         return self._status_return
+    def effective_parameters(self, active):
+        return active.parameters
 
 class DummyActive:
     def __init__(self, name, parameters):
@@ -76,3 +78,27 @@ def test_simulator_injection_handles_exception():
     client = TestClient(app, raise_server_exceptions=False)
     resp = client.get("/fail")
     assert resp.status_code == 500
+
+
+def test_executed_effects_are_timed_per_scenario():
+    from prometheus_client import CollectorRegistry
+    from app.infrastructure.observability.metrics import PrometheusMetrics
+
+    registry = CollectorRegistry()
+    app = FastAPI()
+    sim_service = DummySimService(type('Status', (), {'active': [DummyActive('cpu-spike', {})]})())
+    sim_service._registry = DummyRegistry(DummyScenario({"cpu_spike_ms": 30}))
+    app.state.simulator_service = sim_service
+    app.add_middleware(SimulatorInjectionMiddleware, metrics=PrometheusMetrics(registry=registry))
+
+    @app.get("/test")
+    async def test():
+        return {"ok": True}
+
+    start = time.time()
+    assert TestClient(app).get("/test").status_code == 200
+    assert time.time() - start >= 0.03
+    labels = {"scenario_name": "cpu-spike", "effect_type": "cpu_spike"}
+    assert registry.get_sample_value("simulator_effect_duration_seconds_count", labels) == 1.0
+    assert registry.get_sample_value("simulator_effect_duration_seconds_sum", labels) >= 0.03
+    assert registry.get_sample_value("simulator_injections_total", labels) == 1.0
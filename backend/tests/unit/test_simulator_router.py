@@ -50,6 +50,28 @@ class DummyService:
     def reset(self):
         self._active = []
         return self.status()
+    def list_profiles(self):
+        from app.application.simulator.app_models import (
+            BatchOperationApp, ProfileDescriptorApp, ProfilesResponseApp,
+        )
+        return ProfilesResponseApp(profiles=[
+            ProfileDescriptorApp(
+                name="slow", description="Slow things",
+                operations=[BatchOperationApp(op="enable", name="latency", parameters={"ms": 5})],
+            )
+        ])
+    def apply_batch(self, req):
+        from app.application.simulator.exceptions import ProfileNotFoundError
+        if req.profile is not None and req.profile != "slow":
+            raise ProfileNotFoundError(req.profile)
+        if req.reset:
+            self._active = []
+        for op in req.operations:
+            if op.op == "enable":
+                self.enable(op)
+            else:
+                self.disable(op)
+        return self.status()
 
 def make_app():
     app = FastAPI()
@@ -93,3 +115,34 @@ def test_reset():
     resp = client.post("/api/sim/reset")
     assert resp.status_code == 200
     assert resp.json()["active"] == []
+
+
+def test_list_profiles():
+    app = make_app()
+    client = TestClient(app)
+    resp = client.get("/api/sim/profiles")
+    assert resp.status_code == 200
+    profile = resp.json()["profiles"][0]
+    assert profile["name"] == "slow"
+    assert profile["operations"][0]["parameters"] == {"ms": 5}
+
+def test_apply_batch():
+    app = make_app()
+    client = TestClient(app)
+    body = {
+        "reset": True,
+        "operations": [
+            {"op": "enable", "name": "latency", "parameters": {"ms": 10}},
+            {"op": "enable", "name": "other"},
+            {"op": "disable", "name": "other"},
+        ],
+    }
+    resp = client.post("/api/sim/batch", json=body)
+    assert resp.status_code == 200
+    assert [a["name"] for a in resp.json()["active"]] == ["latency"]
+
+def test_apply_batch_unknown_profile():
+    app = make_app()
+    client = TestClient(app)
+    resp = client.post("/api/sim/batch", json={"profile": "nope"})
+    assert resp.status_code == 404
@@ -1,3 +1,5 @@
+from app.application.simulator.parameters import ScenarioParameters
+
 # CpuSpike
 from app.application.simulator.scenarios.cpu_spike import CpuSpike
 
@@ -6,11 +8,13 @@ def test_cpu_spike_apply_and_applicable(monkeypatch):
     cs = CpuSpike()
     assert cs.is_applicable(target={"category": "http"})
     monkeypatch.setattr("random.random", lambda: 0.0)
-    out = cs.apply(ctx={}, parameters={"spike_probability": 1.0, "duration_ms": 500})
+    out = cs.apply(ctx={}, parameters=ScenarioParameters({"spike_probability": 1.0, "duration_ms": 500}))
     assert out["cpu_spike_ms"] == 500
+    assert [(e.name, e.value) for e in out["metric_events"]] == [("cpu_usage_percent", 100.0)]
     # No spike
     monkeypatch.setattr("random.random", lambda: 1.0)
-    out2 = cs.apply(ctx={}, parameters={"spike_probability": 0.0})
+    out2 = cs.apply(ctx={}, parameters=ScenarioParameters({"spike_probability": 0.0}))
+    assert [(e.name, e.value) for e in out2.pop("metric_events")] == [("cpu_usage_percent", 0.0)]
     assert out2 == {}
 
 
@@ -22,11 +26,12 @@ def test_memory_leak_apply_and_applicable(monkeypatch):
     ml = MemoryLeak()
     assert ml.is_applicable(target={"category": "db"})
     monkeypatch.setattr("random.random", lambda: 0.0)
-    out = ml.apply(ctx={}, parameters={"leak_probability": 1.0, "leak_size_kb": 256})
+    out = ml.apply(ctx={}, parameters=ScenarioParameters({"leak_probability": 1.0, "leak_size_kb": 256}))
     assert out["memory_leak_kb"] == 256
+    assert [(e.name, e.value) for e in out["metric_events"]] == [("memory_leaked_bytes_total", 256 * 1024)]
     # No leak
     monkeypatch.setattr("random.random", lambda: 1.0)
-    out2 = ml.apply(ctx={}, parameters={"leak_probability": 0.0})
+    out2 = ml.apply(ctx={}, parameters=ScenarioParameters({"leak_probability": 0.0}))
     assert out2 == {}
 
 
@@ -38,12 +43,23 @@ def test_disk_full_apply_and_applicable(monkeypatch):
     df = DiskFull()
     assert df.is_applicable(target={"category": "db"})
     monkeypatch.setattr("random.random", lambda: 0.0)
-    out = df.apply(ctx={}, parameters={"failure_probability": 1.0, "path_prefix": "/tmp"})
+    out = df.apply(ctx={}, parameters=ScenarioParameters({"failure_probability": 1.0, "path_prefix": "/tmp"}))
     assert out["disk_full_error"] is True
     assert out["path_prefix"] == "/tmp"
+    assert "metric_events" not in out
+    # Only in-scope writes count as failures
+    params = ScenarioParameters({"failure_probability": 1.0, "path_prefix": "/api/orders"})
+    write = {"target": {"category": "db", "operation": "insert", "path": "/api/orders"}}
+    assert [e.name for e in df.apply(ctx=write, parameters=params)["metric_events"]] == [
+        "disk_write_failures_total"
+    ]
+    read = {"target": {"category": "db", "operation": "select", "path": "/api/orders"}}
+    assert "metric_events" not in df.apply(ctx=read, parameters=params)
+    other = {"target": {"category": "db", "operation": "insert", "path": "/api/customers"}}
+    assert "metric_events" not in df.apply(ctx=other, parameters=params)
     # No failure
     monkeypatch.setattr("random.random", lambda: 1.0)
-    out2 = df.apply(ctx={}, parameters={"failure_probability": 0.0})
+    out2 = df.apply(ctx={}, parameters=ScenarioParameters({"failure_probability": 0.0}))
     assert out2 == {}
 
 
@@ -55,13 +71,15 @@ def test_network_partition_apply_and_applicable(monkeypatch):
     np = NetworkPartition()
     assert np.is_applicable(target={"category": "http"})
     monkeypatch.setattr("random.random", lambda: 0.0)
-    out = np.apply(ctx={}, parameters={"partition_probability": 1.0, "delay_ms": 200, "drop": True})
+    out = np.apply(ctx={}, parameters=ScenarioParameters({"partition_probability": 1.0, "delay_ms": 200, "drop": True}))
     assert out["network_partition"] is True
     assert out["delay_ms"] == 200
     assert out["drop_request"] is True
+    assert [e.name for e in out["metric_events"]] == ["network_partition_active", "network_requests_dropped_total"]
     # No partition
     monkeypatch.setattr("random.random", lambda: 1.0)
-    out2 = np.apply(ctx={}, parameters={"partition_probability": 0.0})
+    out2 = np.apply(ctx={}, parameters=ScenarioParameters({"partition_probability": 0.0}))
+    assert [(e.name, e.value) for e in out2.pop("metric_events")] == [("network_partition_active", 0.0)]
     assert out2 == {}
 
 
@@ -73,11 +91,16 @@ def test_clock_skew_apply_and_applicable(monkeypatch):
     cs = ClockSkew()
     assert cs.is_applicable(target={"category": "time"})
     monkeypatch.setattr("random.random", lambda: 0.0)
-    out = cs.apply(ctx={}, parameters={"skew_probability": 1.0, "skew_ms": -5000})
+    out = cs.apply(ctx={}, parameters=ScenarioParameters({"skew_probability": 1.0, "skew_ms": -5000}))
     assert out["clock_skew_ms"] == -5000
+    assert [(e.name, e.value) for e in out["metric_events"]] == [
+        ("clock_skew_seconds", -5.0),
+        ("time_sync_failures_total", 1.0),
+    ]
     # No skew
     monkeypatch.setattr("random.random", lambda: 1.0)
-    out2 = cs.apply(ctx={}, parameters={"skew_probability": 0.0})
+    out2 = cs.apply(ctx={}, parameters=ScenarioParameters({"skew_probability": 0.0}))
+    assert [(e.name, e.value) for e in out2.pop("metric_events")] == [("clock_skew_seconds", 0.0)]
     assert out2 == {}
 
 
@@ -89,12 +112,12 @@ def test_resource_starvation_apply_and_applicable(monkeypatch):
     rs = ResourceStarvation()
     assert rs.is_applicable(target={"category": "database"})
     monkeypatch.setattr("random.random", lambda: 0.0)
-    out = rs.apply(ctx={}, parameters={"starvation_probability": 1.0, "max_workers": 3})
+    out = rs.apply(ctx={}, parameters=ScenarioParameters({"starvation_probability": 1.0, "max_workers": 3}))
     assert out["resource_starvation"] is True
     assert out["max_workers"] == 3
     # No starvation
     monkeypatch.setattr("random.random", lambda: 1.0)
-    out2 = rs.apply(ctx={}, parameters={"starvation_probability": 0.0})
+    out2 = rs.apply(ctx={}, parameters=ScenarioParameters({"starvation_probability": 0.0}))
     assert out2 == {}
 
 
@@ -118,10 +141,14 @@ ALG = AlgorithmicDegradation()
 
 def test_algorithmic_degradation_apply_and_applicable():
     assert ALG.is_applicable(target={"category": "algorithm"})
-    out = ALG.apply(ctx={}, parameters={"use_slow_path": True, "input_size": 123})
+    out = ALG.apply(ctx={}, parameters=ScenarioParameters({"use_slow_path": True, "input_size": 123}))
     assert out["algorithm_use_slow"] is True
     assert out["algorithm_input_size"] == 123
-    out2 = ALG.apply(ctx={}, parameters={"use_slow_path": False})
+    assert [(e.name, e.value, dict(e.labels).get("complexity")) for e in out["metric_events"]] == [
+        ("algorithm_operations_total", 123**2, "O(n^2)"),
+        ("algorithm_complexity", 2.0, None),
+    ]
+    out2 = ALG.apply(ctx={}, parameters=ScenarioParameters({"use_slow_path": False}))
     assert out2["algorithm_use_slow"] is False
     assert out2["algorithm_input_size"] == 100
 
@@ -134,7 +161,8 @@ def test_error_burst_apply_and_applicable(monkeypatch):
     assert EB.is_applicable(target={"category": "http"})
     # Always return 0.0 for random.random to force error
     monkeypatch.setattr("random.random", lambda: 0.0)
-    out = EB.apply(ctx={}, parameters={"probability": 1.0})
+    out = EB.apply(ctx={}, parameters=ScenarioParameters({"probability": 1.0}))
+    assert [e.name for e in out.pop("metric_events")] == ["http_error_burst_active", "http_injected_errors_total"]
     assert out == {
         "http_force_error": True,
         "http_path_prefix": "",
@@ -143,7 +171,8 @@ def test_error_burst_apply_and_applicable(monkeypatch):
     }
     # Always return 1.0 for random.random to avoid error
     monkeypatch.setattr("random.random", lambda: 1.0)
-    out2 = EB.apply(ctx={}, parameters={"probability": 0.5})
+    out2 = EB.apply(ctx={}, parameters=ScenarioParameters({"probability": 0.5}))
+    assert [(e.name, e.value) for e in out2.pop("metric_events")] == [("http_error_burst_active", 0.0)]
     assert out2 == {}
 
 
@@ -154,10 +183,24 @@ FL = FixedLatency()
 def test_fixed_latency_apply_and_applicable(monkeypatch):
     assert FL.is_applicable(target={"category": "http"})
     monkeypatch.setattr("random.random", lambda: 0.0)
-    out = FL.apply(ctx={}, parameters={"ms": 100, "probability": 1.0})
+    out = FL.apply(ctx={}, parameters=ScenarioParameters({"ms": 100, "probability": 1.0}))
     assert out["http_delay_ms"] == 100
+    assert [(e.name, e.value) for e in out["metric_events"]] == [
+        ("http_latency_injections_total", 1.0),
+        ("http_injected_latency_seconds", 0.1),
+    ]
+    # Requests outside path_prefix / method get no delay, so nothing is counted
+    params = ScenarioParameters({"ms": 100, "path_prefix": "/api/orders", "method": "post"})
+    hit = {"target": {"category": "http", "path": "/api/orders/7", "method": "POST"}}
+    assert dict(FL.apply(ctx=hit, parameters=params)["metric_events"][0].labels) == {
+        "scenario": "fixed-latency",
+        "endpoint": "/api/orders",
+    }
+    for path, method in [("/api/products", "POST"), ("/api/orders", "GET")]:
+        miss = {"target": {"category": "http", "path": path, "method": method}}
+        assert "metric_events" not in FL.apply(ctx=miss, parameters=params)
     monkeypatch.setattr("random.random", lambda: 1.0)
-    out2 = FL.apply(ctx={}, parameters={"ms": 100, "probability": 0.5})
+    out2 = FL.apply(ctx={}, parameters=ScenarioParameters({"ms": 100, "probability": 0.5}))
     assert out2 == {}
 
 
@@ -167,10 +210,16 @@ LC = LockContention()
 
 def test_lock_contention_apply_and_applicable():
     assert LC.is_applicable(target={"category": "db"})
-    out = LC.apply(ctx={}, parameters={"row_id": 5, "update_count": 3})
+    out = LC.apply(ctx={}, parameters=ScenarioParameters({"row_id": 5, "update_count": 3}))
     assert out["db_lock_contention"] is True
     assert out["db_target_row_id"] == 5
     assert out["db_concurrent_updates"] == 3
+    update = {"target": {"category": "db", "operation": "update", "path": "/api/orders"}}
+    out = LC.apply(ctx=update, parameters=ScenarioParameters({"row_id": 5, "update_count": 3}))
+    assert [(e.name, e.value) for e in out["metric_events"]] == [
+        ("db_lock_attempts_total", 3.0),
+        ("db_lock_conflicts_total", 2.0),
+    ]
 
 
 # SlowDbQuery
@@ -180,10 +229,14 @@ SDQ = SlowDbQuery()
 def test_slow_db_query_apply_and_applicable(monkeypatch):
     assert SDQ.is_applicable(target={"category": "db"})
     monkeypatch.setattr("random.random", lambda: 0.0)
-    out = SDQ.apply(ctx={}, parameters={"seconds": 1.5, "probability": 1.0})
+    out = SDQ.apply(ctx={}, parameters=ScenarioParameters({"seconds": 1.5, "probability": 1.0}))
     assert out["db_sleep_seconds"] == 1.5
+    assert [(e.name, e.value) for e in out["metric_events"]] == [
+        ("db_slow_query_injections_total", 1.0),
+        ("db_query_duration_seconds", 1.5),
+    ]
     monkeypatch.setattr("random.random", lambda: 1.0)
-    out2 = SDQ.apply(ctx={}, parameters={"seconds": 1.5, "probability": 0.5})
+    out2 = SDQ.apply(ctx={}, parameters=ScenarioParameters({"seconds": 1.5, "probability": 0.5}))
     assert out2 == {}
 
 
@@ -196,14 +249,19 @@ def test_circuit_breaker_apply_and_applicable(monkeypatch):
     # Force circuit open
     monkeypatch.setattr("random.random", lambda: 0.1)
     out = CB.apply(
-        ctx={}, parameters={"failure_threshold": 5, "timeout_ms": 3000, "status_code": 503}
+        ctx={}, parameters=ScenarioParameters({"failure_threshold": 5, "timeout_ms": 3000, "status_code": 503})
     )
     assert out["circuit_breaker_open"] is True
     assert out["http_status"] == 503
     assert out["http_delay_ms"] == 3000
+    assert [(e.name, e.value) for e in out["metric_events"]] == [
+        ("circuit_breaker_state", 1.0),
+        ("circuit_breaker_trips_total", 1.0),
+    ]
     # Circuit closed
     monkeypatch.setattr("random.random", lambda: 0.5)
-    out2 = CB.apply(ctx={}, parameters={"failure_threshold": 5})
+    out2 = CB.apply(ctx={}, parameters=ScenarioParameters({"failure_threshold": 5}))
+    assert [(e.name, e.value) for e in out2.pop("metric_events")] == [("circuit_breaker_state", 0.0)]
     assert out2 == {}
 
 
@@ -216,14 +274,18 @@ def test_retry_storm_apply_and_applicable(monkeypatch):
     # Force failure
     monkeypatch.setattr("random.random", lambda: 0.1)
     out = RS.apply(
-        ctx={}, parameters={"failure_rate": 0.5, "retry_multiplier": 3.0, "status_code": 503}
+        ctx={}, parameters=ScenarioParameters({"failure_rate": 0.5, "retry_multiplier": 3.0, "status_code": 503})
     )
     assert out["retry_storm_active"] is True
     assert out["http_status"] == 503
     assert out["retry_multiplier"] == 3.0
+    assert [(e.name, e.value) for e in out["metric_events"]] == [
+        ("retry_attempts_total", 3.0),
+        ("retry_depth", 3.0),
+    ]
     # No failure
     monkeypatch.setattr("random.random", lambda: 0.9)
-    out2 = RS.apply(ctx={}, parameters={"failure_rate": 0.5})
+    out2 = RS.apply(ctx={}, parameters=ScenarioParameters({"failure_rate": 0.5}))
     assert out2 == {}
 
 
@@ -237,14 +299,25 @@ def test_connection_pool_exhaustion_apply_and_applicable(monkeypatch):
     monkeypatch.setattr("random.random", lambda: 0.1)
     out = CPE.apply(
         ctx={},
-        parameters={"exhaustion_probability": 0.8, "hang_duration_ms": 5000, "pool_size_limit": 20},
+        parameters=ScenarioParameters({"exhaustion_probability": 0.8, "hang_duration_ms": 5000, "pool_size_limit": 20}),
     )
     assert out["db_connection_exhausted"] is True
     assert out["db_hang_duration_ms"] == 5000
     assert out["db_pool_size_limit"] == 20
+    # Events only at checkout, where the effect applies
+    assert "metric_events" not in out
+    checkout = {"target": {"category": "db", "operation": "connect", "path": "/api/orders"}}
+    out = CPE.apply(
+        ctx=checkout,
+        parameters=ScenarioParameters({"exhaustion_probability": 0.8, "hang_duration_ms": 5000, "pool_size_limit": 20}),
+    )
+    assert [(e.name, e.value) for e in out["metric_events"]] == [
+        ("connection_pool_size", 20.0),
+        ("connection_pool_wait_seconds", 5.0),
+    ]
     # No exhaustion
     monkeypatch.setattr("random.random", lambda: 0.9)
-    out2 = CPE.apply(ctx={}, parameters={"exhaustion_probability": 0.5})
+    out2 = CPE.apply(ctx={}, parameters=ScenarioParameters({"exhaustion_probability": 0.5}))
     assert out2 == {}
 
 
@@ -258,17 +331,19 @@ def test_cache_stampede_apply_and_applicable(monkeypatch):
     monkeypatch.setattr("random.random", lambda: 0.1)
     out = CS.apply(
         ctx={},
-        parameters={
+        parameters=ScenarioParameters({
             "stampede_probability": 0.8,
             "concurrent_requests": 100,
             "backend_delay_ms": 3000,
-        },
+        }),
     )
     assert out["cache_stampede_active"] is True
     assert out["cache_miss"] is True
     assert out["concurrent_backend_requests"] == 100
     assert out["db_query_delay_ms"] == 3000
+    assert [e.name for e in out["metric_events"]] == ["cache_miss_total"]
     # No stampede
     monkeypatch.setattr("random.random", lambda: 0.9)
-    out2 = CS.apply(ctx={}, parameters={"stampede_probability": 0.5})
+    out2 = CS.apply(ctx={}, parameters=ScenarioParameters({"stampede_probability": 0.5}))
+    assert [e.name for e in out2.pop("metric_events")] == ["cache_hit_total"]
     assert out2 == {}
@@ -83,3 +83,127 @@ def test_reset():
     out = svc.reset()
     assert out.active == []
     assert store._cleared
+
+
+# Batch apply
+from app.application.simulator.app_models import BatchApplyRequestApp, BatchOperationApp
+from app.application.simulator.exceptions import ProfileNotFoundError, ScenarioNotFoundError
+from app.application.simulator.profiles import ScenarioProfile
+from app.infrastructure.simulator.memory_store import InMemorySimulatorStore
+
+
+class CountingStore(InMemorySimulatorStore):
+    def __init__(self):
+        super().__init__()
+        self.batches = 0
+    def apply_batch(self, *, upserts, removals, clear=False):
+        self.batches += 1
+        super().apply_batch(upserts=upserts, removals=removals, clear=clear)
+
+
+def make_batch_service():
+    store = CountingStore()
+    reg = DummyRegistry({n: DummyScenario(n) for n in ("foo", "bar", "baz")})
+    profiles = {
+        "pair": ScenarioProfile(
+            name="pair",
+            description="foo and bar",
+            operations=[
+                BatchOperationApp(op="enable", name="foo", parameters={"x": 1}),
+                BatchOperationApp(op="enable", name="bar"),
+            ],
+        )
+    }
+    svc = SimulatorService(store=store, clock=DummyClock(), registry=reg, profiles=profiles)
+    return svc, store
+
+
+def test_apply_batch_is_single_store_write():
+    svc, store = make_batch_service()
+    out = svc.apply_batch(
+        BatchApplyRequestApp(
+            operations=[
+                BatchOperationApp(op="enable", name="foo", parameters={"x": 1}),
+                BatchOperationApp(op="enable", name="bar", duration_seconds=30),
+                BatchOperationApp(op="disable", name="foo"),
+            ]
+        )
+    )
+    assert [a.name for a in out.active] == ["bar"]
+    assert out.active[0].expires_at is not None
+    assert store.batches == 1
+
+
+def test_apply_batch_with_profile_and_overrides():
+    svc, store = make_batch_service()
+    svc.enable(EnableScenarioRequest(name="baz", parameters={}))
+    out = svc.apply_batch(
+        BatchApplyRequestApp(
+            profile="pair",
+            reset=True,
+            operations=[BatchOperationApp(op="enable", name="foo", parameters={"x": 2})],
+        )
+    )
+    assert {a.name: a.parameters for a in out.active} == {"bar": {}, "foo": {"x": 2}}
+
+
+def test_apply_batch_validates_before_applying():
+    svc, store = make_batch_service()
+    with pytest.raises(ScenarioNotFoundError):
+        svc.apply_batch(
+            BatchApplyRequestApp(
+                operations=[
+                    BatchOperationApp(op="enable", name="foo"),
+                    BatchOperationApp(op="enable", name="nope"),
+                ]
+            )
+        )
+    with pytest.raises(ProfileNotFoundError):
+        svc.apply_batch(BatchApplyRequestApp(profile="missing"))
+    assert store.list_active() == []
+    assert store.batches == 0
+
+
+def test_list_profiles():
+    svc, _ = make_batch_service()
+    out = svc.list_profiles()
+    assert [p.name for p in out.profiles] == ["pair"]
+    assert len(out.profiles[0].operations) == 2
+
+
+def test_apply_batch_reset_zeroes_gauges_of_cleared_scenarios():
+    from prometheus_client import CollectorRegistry
+
+    from app.infrastructure.observability.metrics import PrometheusMetrics
+
+    registry = CollectorRegistry()
+    store = InMemorySimulatorStore()
+    reg = DummyRegistry({n: DummyScenario(n) for n in ("foo", "bar", "baz")})
+    svc = SimulatorService(
+        store=store, clock=DummyClock(), registry=reg, metrics=PrometheusMetrics(registry=registry)
+    )
+    svc.enable(EnableScenarioRequest(name="foo", parameters={}))
+    svc.enable(EnableScenarioRequest(name="baz", parameters={}))
+    svc.apply_batch(
+        BatchApplyRequestApp(reset=True, operations=[BatchOperationApp(op="enable", name="foo")])
+    )
+
+    def enabled(name):
+        return registry.get_sample_value("simulator_scenarios_enabled", {"scenario_name": name})
+
+    assert (enabled("foo"), enabled("baz")) == (1.0, 0.0)
+
+
+def test_apply_batch_drops_cached_schedules_of_removed_scenarios():
+    svc, _ = make_batch_service()
+    for name in ("foo", "bar", "baz"):
+        svc.enable(EnableScenarioRequest(name=name, parameters={}))
+    for active in svc.status().active:
+        svc.effective_parameters(active)
+    assert set(svc._scheduled) == {"foo", "bar", "baz"}
+
+    svc.apply_batch(BatchApplyRequestApp(operations=[BatchOperationApp(op="disable", name="foo")]))
+    assert set(svc._scheduled) == {"bar", "baz"}
+
+    svc.apply_batch(BatchApplyRequestApp(reset=True))
+    assert svc._scheduled == {}
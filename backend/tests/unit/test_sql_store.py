@@ -0,0 +1,166 @@
+"""Test SqlSimulatorStore persistence, local cache and change feed (SQLite)"""
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.util import await_only
+
+from app.application.simulator.models import ActiveScenarioState
+from app.infrastructure.simulator.sql_store import SqlSimulatorStore
+
+
+def make_state(name, params=None):
+    return ActiveScenarioState(
+        name=name,
+        parameters=params or {},
+        enabled_at=datetime(2026, 2, 11, 12, 0, 0, tzinfo=UTC),
+        expires_at=datetime(2026, 2, 11, 13, 0, 0, tzinfo=UTC),
+    )
+
+
+def db_url(tmp_path):
+    return f"sqlite+aiosqlite:///{tmp_path / 'sim.db'}"
+
+
+def test_state_survives_restart(tmp_path):
+    async def run():
+        engine = create_async_engine(db_url(tmp_path))
+        store = SqlSimulatorStore(engine, poll_interval_seconds=0.05)
+        await store.start()
+        store.upsert(make_state("foo", {"ms": 100}))
+        store.upsert(make_state("bar"))
+        store.remove("bar")
+        await store.stop()
+        await engine.dispose()
+
+        engine2 = create_async_engine(db_url(tmp_path))
+        restarted = SqlSimulatorStore(engine2, poll_interval_seconds=0.05)
+        await restarted.start()
+        try:
+            assert [s.name for s in restarted.list_active()] == ["foo"]
+            state = restarted.get("foo")
+            assert state.parameters == {"ms": 100}
+            assert state.enabled_at == make_state("foo").enabled_at
+            assert state.expires_at.tzinfo is not None
+        finally:
+            await restarted.stop()
+            await engine2.dispose()
+
+    asyncio.run(run())
+
+
+def test_reads_are_served_from_local_cache(tmp_path):
+    async def run():
+        engine = create_async_engine(db_url(tmp_path))
+        store = SqlSimulatorStore(engine, poll_interval_seconds=0.05)
+        await store.start()
+        store.upsert(make_state("foo"))
+        await store.stop()
+        await engine.dispose()
+
+        # Engine is gone: reads must still work against the cache
+        assert store.get("foo") is not None
+        assert len(store.list_active()) == 1
+
+    asyncio.run(run())
+
+
+def test_mutations_after_stop_raise(tmp_path):
+    async def run():
+        engine = create_async_engine(db_url(tmp_path))
+        store = SqlSimulatorStore(engine, poll_interval_seconds=0.05)
+        await store.start()
+        await store.stop()
+        try:
+            with pytest.raises(RuntimeError, match="stopped"):
+                store.upsert(make_state("foo"))
+            with pytest.raises(RuntimeError, match="stopped"):
+                store.apply_batch(upserts=[make_state("foo")], removals=[], clear=True)
+            assert store.list_active() == []
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_reload_during_flush_keeps_the_local_write(tmp_path):
+    async def run():
+        engine = create_async_engine(db_url(tmp_path))
+        store = SqlSimulatorStore(engine, poll_interval_seconds=60)
+        await store.start()
+        flushing = None
+
+        def after_read(conn, cursor, statement, *args):
+            # Let the flush commit after reload() has read the rows
+            if flushing is not None and statement.startswith("SELECT simulator_active_scenarios"):
+                await_only(flushing)
+
+        event.listen(engine.sync_engine, "after_cursor_execute", after_read)
+        try:
+            store.upsert(make_state("foo"))
+            flushing = asyncio.create_task(store.flush())
+            await asyncio.sleep(0)
+            await store.reload()
+            await flushing
+            assert store.get("foo") is not None
+        finally:
+            await store.stop()
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_change_feed_propagates_between_processes(tmp_path):
+    async def run():
+        engine_a = create_async_engine(db_url(tmp_path))
+        engine_b = create_async_engine(db_url(tmp_path))
+        store_a = SqlSimulatorStore(engine_a, poll_interval_seconds=0.05)
+        store_b = SqlSimulatorStore(engine_b, poll_interval_seconds=0.05)
+        await store_a.start()
+        await store_b.start()
+        try:
+            store_a.upsert(make_state("foo", {"x": 1}))
+            await store_a.flush()
+            for _ in range(40):
+                if store_b.get("foo") is not None:
+                    break
+                await asyncio.sleep(0.05)
+            assert store_b.get("foo").parameters == {"x": 1}
+            assert store_b.version == store_a.version
+
+            store_b.clear()
+            await store_b.flush()
+            for _ in range(40):
+                if not store_a.list_active():
+                    break
+                await asyncio.sleep(0.05)
+            assert store_a.list_active() == []
+        finally:
+            await store_a.stop()
+            await store_b.stop()
+            await engine_a.dispose()
+            await engine_b.dispose()
+
+    asyncio.run(run())
+
+
+def test_each_flush_bumps_version_once(tmp_path):
+    async def run():
+        engine = create_async_engine(db_url(tmp_path))
+        store = SqlSimulatorStore(engine, poll_interval_seconds=0.05)
+        await store.start()
+        try:
+            before = store.version
+            store.upsert(make_state("foo"))
+            store.upsert(make_state("bar"))
+            store.remove("foo")
+            await store.flush()
+            assert store.version == before + 1
+            assert [s.name for s in store.list_active()] == ["bar"]
+        finally:
+            await store.stop()
+            await engine.dispose()
+
+    asyncio.run(run())
@@ -1,16 +1,8 @@
 import pytest
+from app.application.simulator.events import METRIC_EVENTS_KEY, MetricEvent
+from app.application.simulator.parameters import ScenarioParameters
 from app.application.simulator.scenarios.stale_read import StaleRead
 
-class DummyCounter:
-    def __init__(self):
-        self.count = 0
-        self.labels_args = None
-    def labels(self, **kwargs):
-        self.labels_args = kwargs
-        return self
-    def inc(self):
-        self.count += 1
-
 @pytest.mark.parametrize("stale_probability,is_stale_expected", [
     (1.0, True),
     (0.0, False),
@@ -19,18 +11,12 @@ def test_stale_read_metric(stale_probability, is_stale_expected, monkeypatch):
     scenario = StaleRead()
     # Patch random.random to deterministic
     monkeypatch.setattr("random.random", lambda: 0.5)
-    metrics = {
-        "stale_read_total": DummyCounter(),
-        "fresh_read_total": DummyCounter(),
-    }
-    ctx = {"metrics": metrics}
-    params = {"stale_probability": stale_probability, "cache_key_pattern": "foo*"}
-    result = scenario.apply(ctx=ctx, parameters=params)
+    params = ScenarioParameters({"stale_probability": stale_probability, "cache_key_pattern": "foo*"})
+    result = scenario.apply(ctx={}, parameters=params)
+    labels = (("cache_key_pattern", "foo*"), ("scenario", "stale-read"))
     if is_stale_expected:
-        assert metrics["stale_read_total"].count == 1
-        assert metrics["fresh_read_total"].count == 0
+        assert result[METRIC_EVENTS_KEY] == (MetricEvent("stale_read_total", "inc", 1.0, labels),)
         assert result["is_stale"] is True
     else:
-        assert metrics["stale_read_total"].count == 0
-        assert metrics["fresh_read_total"].count == 1
+        assert result[METRIC_EVENTS_KEY] == (MetricEvent("fresh_read_total", "inc", 1.0, labels),)
         assert result["is_stale"] is False
@@ -0,0 +1,60 @@
+"""Test the startup import-time budget check"""
+import subprocess
+
+from app.guardrails import startup_check
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     encodings.idna
+import time:      2000 |       2100 |   fastapi
+import time:       500 |        500 |     sqlalchemy.sql
+import time:       300 |        800 |   sqlalchemy
+import time:      1000 |       3900 | app.api.main
+some unrelated warning
+"""
+
+
+def test_parse_importtime_reads_timings_and_depth():
+    timings = startup_check.parse_importtime(IMPORTTIME)
+    assert [t.module for t in timings] == [
+        "encodings.idna",
+        "fastapi",
+        "sqlalchemy.sql",
+        "sqlalchemy",
+        "app.api.main",
+    ]
+    assert timings[1].depth == 1 and timings[0].depth == 2 and timings[-1].depth == 0
+    assert startup_check.boot_time_ms(timings) == 3.9
+
+
+def test_package_totals_sum_self_time_by_top_level_package():
+    totals = startup_check.package_totals(startup_check.parse_importtime(IMPORTTIME))
+    assert list(totals) == ["fastapi", "app", "sqlalchemy", "encodings"]
+    assert totals["sqlalchemy"] == 0.8
+
+
+def test_main_fails_when_over_budget(monkeypatch, capsys):
+    monkeypatch.setattr(
+        startup_check, "profile_imports", lambda: startup_check.parse_importtime(IMPORTTIME)
+    )
+    monkeypatch.setenv("STARTUP_BUDGET_MS", "10")
+    assert startup_check.main() == 0
+    monkeypatch.setenv("STARTUP_BUDGET_MS", "1")
+    assert startup_check.main() == 1
+    assert "exceeds budget" in capsys.readouterr().out
+
+
+def test_main_fails_when_profiling_fails(monkeypatch):
+    def broken():
+        raise subprocess.CalledProcessError(1, "python")
+
+    monkeypatch.setattr(startup_check, "profile_imports", broken)
+    assert startup_check.main() == 1
+
+
+def test_disabled_tracing_keeps_the_sdk_out_of_startup():
+    timings = startup_check.profile_imports()
+    modules = {t.module for t in timings}
+    assert "app.api.main" in modules
+    assert "opentelemetry.exporter.otlp.proto.grpc.trace_exporter" not in modules
+    assert "opentelemetry.sdk.trace" not in modules
@@ -0,0 +1,134 @@
+"""Test head ratio sampling and the tail-sampling span processor"""
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import Status, StatusCode
+
+from app.infrastructure.observability.trace_sampling import (
+    SIM_SCENARIOS_ATTRIBUTE,
+    TailSamplingSpanProcessor,
+    build_sampler,
+)
+
+MS = 1_000_000
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_tracer(**kwargs):
+    exporter = InMemorySpanExporter()
+    clock = FakeClock()
+    processor = TailSamplingSpanProcessor(
+        SimpleSpanProcessor(exporter), slow_seconds=0.1, window_seconds=5, clock=clock, **kwargs
+    )
+    provider = TracerProvider()
+    provider.add_span_processor(processor)
+    return provider.get_tracer("test"), exporter, processor, clock
+
+
+def request(tracer, duration_ms=1, *, error=False, fault=False, children=1):
+    root = tracer.start_span("GET /items", start_time=0)
+    ctx = trace.set_span_in_context(root)
+    for i in range(children):
+        tracer.start_span(f"child{i}", context=ctx, start_time=0).end(end_time=MS)
+    if error:
+        root.set_status(Status(StatusCode.ERROR))
+    if fault:
+        root.set_attribute(SIM_SCENARIOS_ATTRIBUTE, ["fixed-latency"])
+    root.end(end_time=duration_ms * MS)
+    return root
+
+
+def exported_names(exporter):
+    return [s.name for s in exporter.get_finished_spans()]
+
+
+def test_fast_successful_traces_are_dropped():
+    tracer, exporter, processor, _ = make_tracer()
+    request(tracer)
+    assert exported_names(exporter) == []
+    assert processor.decisions == {"dropped": 1}
+
+
+@pytest.mark.parametrize(
+    "kwargs, reason",
+    [({"error": True}, "error"), ({"fault": True}, "fault"), ({"duration_ms": 150}, "slow")],
+)
+def test_interesting_traces_are_exported_whole(kwargs, reason):
+    tracer, exporter, processor, _ = make_tracer()
+    request(tracer, children=2, **kwargs)
+    assert exported_names(exporter) == ["child0", "child1", "GET /items"]
+    assert processor.decisions == {reason: 1}
+
+
+def test_late_spans_follow_the_trace_decision():
+    tracer, exporter, _, clock = make_tracer()
+    root = request(tracer, error=True)
+    tracer.start_span("late", context=trace.set_span_in_context(root)).end()
+    assert exported_names(exporter)[-1] == "late"
+
+    dropped = request(tracer)
+    tracer.start_span("late-dropped", context=trace.set_span_in_context(dropped)).end()
+    assert "late-dropped" not in exported_names(exporter)
+
+
+def test_traces_without_a_local_root_are_decided_after_the_window():
+    tracer, exporter, processor, clock = make_tracer()
+    root = tracer.start_span("remote-parent")
+    child = tracer.start_span("slow", context=trace.set_span_in_context(root), start_time=0)
+    child.end(end_time=200 * MS)
+    assert exported_names(exporter) == []
+
+    clock.now = 10
+    request(tracer)  # any later span triggers expiry
+    assert exported_names(exporter) == ["slow"]
+    assert processor.decisions == {"slow": 1, "dropped": 1}
+
+
+def test_pending_traces_are_bounded():
+    tracer, exporter, processor, _ = make_tracer(max_traces=2)
+    roots = [tracer.start_span(f"root{i}") for i in range(3)]
+    for root in roots:
+        tracer.start_span("child", context=trace.set_span_in_context(root)).end()
+    assert len(processor._pending) == 2
+    assert processor.decisions == {"dropped": 1}
+
+
+def test_shutdown_decides_pending_traces():
+    tracer, exporter, processor, _ = make_tracer()
+    root = tracer.start_span("root")
+    child = tracer.start_span("failing", context=trace.set_span_in_context(root))
+    child.set_status(Status(StatusCode.ERROR))
+    child.end()
+    processor.shutdown()
+    assert exported_names(exporter) == ["failing"]
+
+
+def test_head_sampler_uses_ratio_and_follows_parent():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider(sampler=build_sampler(0.0))
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = provider.get_tracer("test")
+
+    assert not tracer.start_span("root").get_span_context().trace_flags.sampled
+    sampled_parent = trace.NonRecordingSpan(
+        trace.SpanContext(
+            trace_id=1,
+            span_id=2,
+            is_remote=True,
+            trace_flags=trace.TraceFlags(trace.TraceFlags.SAMPLED),
+        )
+    )
+    child = tracer.start_span("child", context=trace.set_span_in_context(sampled_parent))
+    assert child.get_span_context().trace_flags.sampled
+
+    with pytest.raises(ValueError):
+        build_sampler(1.5)